@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from ..ui.embeds import slot_status_embed, error_embed
+from ..ui.formatters import format_slots_info
 
 if TYPE_CHECKING:
     from ..main import SRTGoBot
 
 log = logging.getLogger(__name__)
 
+# 고정 에러 Embed (import 시 한 번만 생성, 변경 금지)
+CHANNEL_DELETE_FORBIDDEN_EMBED = error_embed("채널 삭제 권한이 없습니다.")
+CHANNEL_DELETE_FAILED_EMBED = error_embed("채널 삭제에 실패했습니다.")
+
 
 class AdminCog(commands.Cog):
     """관리자 명령어."""
@@ -23,14 +29,30 @@ class AdminCog(commands.Cog):
     def __init__(self, bot: SRTGoBot) -> None:
         self.bot = bot
 
-    def _is_admin(self, interaction: discord.Interaction) -> bool:
-        """관리자 권한 확인."""
-        if interaction.guild is None:
-            return False
-        member = interaction.guild.get_member(interaction.user.id)
-        if member is None:
-            return False
-        return member.guild_permissions.administrator
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Cog 내 모든 커맨드에 적용되는 관리자 권한 확인.
+
+        길드에서 호출되면 interaction.user가 이미 권한이 계산된 Member이므로 추가 조회가 필요 없다.
+        """
+        return (
+            interaction.guild is not None
+            and isinstance(interaction.user, discord.Member)
+            and interaction.user.guild_permissions.administrator
+        )
+
+    async def cog_app_command_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ) -> None:
+        if isinstance(error, app_commands.CheckFailure):
+            await interaction.response.send_message("관리자 권한이 필요합니다.", ephemeral=True)
+
+    async def _cancel_db_session(self, channel_id: str, db_session: Any) -> None:
+        """gather 결과로 받은 채널의 DB 세션을 cancelled로 변경."""
+        if isinstance(db_session, BaseException):
+            log.error("DB 세션 조회 실패: 채널 %s", channel_id, exc_info=db_session)
+            return
+        if db_session:
+            await self.bot.session_repo.set_status(db_session["id"], "cancelled")
 
     # ──────────────────────────────────
     # /관리 그룹
@@ -40,22 +62,11 @@ class AdminCog(commands.Cog):
 
     @admin_group.command(name="슬롯현황", description="전체 예약 슬롯 상태를 확인합니다")
     async def admin_slot_status(self, interaction: discord.Interaction) -> None:
-        if not self._is_admin(interaction):
-            await interaction.response.send_message("관리자 권한이 필요합니다.", ephemeral=True)
-            return
-
-        slots = self.bot.slot_manager.get_slots()
-        slots_info = []
-        for s in slots:
-            user = interaction.guild.get_member(int(s.discord_id)) if interaction.guild else None
-            slots_info.append({
-                "user": user.display_name if user else s.discord_id,
-                "rail_type": s.rail_type,
-                "channel": f"<#{s.channel_id}>",
-            })
+        slots = self.bot.slot_manager.snapshot()
+        slots_info = format_slots_info(slots, interaction.guild)
 
         embed = slot_status_embed(
-            active=self.bot.slot_manager.active_count,
+            active=len(slots),
             max_slots=self.bot.config.max_slots,
             slots_info=slots_info,
         )
@@ -66,19 +77,23 @@ class AdminCog(commands.Cog):
     async def admin_release_slot(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ) -> None:
-        if not self._is_admin(interaction):
-            await interaction.response.send_message("관리자 권한이 필요합니다.", ephemeral=True)
-            return
-
-        released = await self.bot.slot_manager.force_release_by_channel(str(channel.id))
+        channel_id = str(channel.id)
 
         # 대화 세션도 정리
         conv = self.bot.conversations.pop(channel.id, None)
 
+        # 슬롯 해제와 DB 세션 조회는 서로 독립적이므로 동시에 실행
+        released, db_session = await asyncio.gather(
+            self.bot.slot_manager.force_release_by_channel(channel_id),
+            self.bot.session_repo.get_session_by_channel(channel_id),
+            return_exceptions=True,
+        )
+        if isinstance(released, BaseException):
+            log.error("슬롯 해제 실패: 채널 %s", channel_id, exc_info=released)
+            released = False
+
         # DB 세션 상태 업데이트
-        db_session = await self.bot.session_repo.get_session_by_channel(str(channel.id))
-        if db_session:
-            await self.bot.session_repo.set_status(db_session["id"], "cancelled")
+        await self._cancel_db_session(channel_id, db_session)
 
         if released:
             await interaction.response.send_message(
@@ -89,45 +104,69 @@ class AdminCog(commands.Cog):
                 f"{channel.mention}에 할당된 슬롯이 없습니다.", ephemeral=True
             )
 
+        # 응답 후 남아 있는 대화(폴링/타이머) 종료 — 슬롯만 해제하는 명령이므로 채널은 유지
+        if conv is not None:
+            await conv.cancel("관리자에 의해 슬롯이 해제되었습니다.", keep_channel=True)
+
     @admin_group.command(name="전체해제", description="모든 슬롯을 강제 해제합니다")
     async def admin_release_all(self, interaction: discord.Interaction) -> None:
-        if not self._is_admin(interaction):
-            await interaction.response.send_message("관리자 권한이 필요합니다.", ephemeral=True)
-            return
-
-        count = await self.bot.slot_manager.force_release_all()
-
-        # 모든 대화 세션 정리
-        self.bot.conversations.clear()
+        await interaction.response.defer()
+
+        async with self.bot.admin_lock:
+            # 대화 목록을 먼저 비우고 슬롯을 해제한 뒤, 남아 있는 대화(폴링/타이머)를 취소
+            convs = list(self.bot.conversations.values())
+            self.bot.conversations.clear()
+            count = await self.bot.slot_manager.force_release_all()
+            results = await asyncio.gather(
+                *(c.cancel("관리자에 의해 예매가 취소되었습니다.", keep_channel=True) for c in convs),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    log.error("대화 세션 취소 실패", exc_info=result)
 
-        await interaction.response.send_message(f"{count}개 슬롯이 해제되었습니다.")
+        await interaction.followup.send(f"{count}개 슬롯이 해제되었습니다.")
 
     @admin_group.command(name="채널삭제", description="예약 채널을 강제 삭제합니다")
     @app_commands.describe(channel="삭제할 예약 채널")
     async def admin_delete_channel(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ) -> None:
-        if not self._is_admin(interaction):
-            await interaction.response.send_message("관리자 권한이 필요합니다.", ephemeral=True)
-            return
-
-        # 슬롯 해제
-        await self.bot.slot_manager.force_release_by_channel(str(channel.id))
-        self.bot.conversations.pop(channel.id, None)
+        channel_id = str(channel.id)
+        conv = self.bot.conversations.pop(channel.id, None)
+        if conv is not None:
+            # 채널이 곧 삭제되므로 메시지 없이 태스크만 중단
+            conv.abort()
+
+        # 슬롯 해제 / DB 세션 조회 / 채널 삭제를 동시에 실행
+        # (채널 삭제 실패가 DB 정리를 막지 않도록 예외는 개별 처리)
+        released, db_session, deleted = await asyncio.gather(
+            self.bot.slot_manager.force_release_by_channel(channel_id),
+            self.bot.session_repo.get_session_by_channel(channel_id),
+            channel.delete(reason=f"관리자 {interaction.user.display_name}에 의해 삭제"),
+            return_exceptions=True,
+        )
+        if isinstance(released, BaseException):
+            log.error("슬롯 해제 실패: 채널 %s", channel_id, exc_info=released)
 
         # DB 세션 상태 업데이트
-        db_session = await self.bot.session_repo.get_session_by_channel(str(channel.id))
-        if db_session:
-            await self.bot.session_repo.set_status(db_session["id"], "cancelled")
+        await self._cancel_db_session(channel_id, db_session)
 
-        try:
-            await channel.delete(reason=f"관리자 {interaction.user.display_name}에 의해 삭제")
-            await interaction.response.send_message("채널이 삭제되었습니다.", ephemeral=True)
-        except discord.Forbidden:
+        if isinstance(deleted, discord.Forbidden):
             await interaction.response.send_message(
-                embed=error_embed("채널 삭제 권한이 없습니다."),
+                embed=CHANNEL_DELETE_FORBIDDEN_EMBED,
                 ephemeral=True,
             )
+            return
+        if isinstance(deleted, BaseException):
+            log.error("채널 삭제 실패: %s", channel_id, exc_info=deleted)
+            await interaction.response.send_message(
+                embed=CHANNEL_DELETE_FAILED_EMBED,
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.send_message("채널이 삭제되었습니다.", ephemeral=True)
 
 
 async def setup(bot: SRTGoBot) -> None:
@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+import time
 from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ..core.booking_context import SlotUnavailableError, booking_resources
 from ..core.booking_engine import BookingEngine
 from ..core.booking_session import BookingSession, SessionStatus
 from ..core.conversation import ConversationManager
-from ..ui.embeds import error_embed, slot_status_embed
+from ..db.repository import DB_TIMEOUT
+from ..ui.embeds import error_embed, slot_status_embed, NO_PROFILE_EMBED, DB_TIMEOUT_EMBED
+from ..ui.formatters import format_slots_info
 
 if TYPE_CHECKING:
     from ..main import SRTGoBot
 
 log = logging.getLogger(__name__)
 
+# 고정 에러 Embed (import 시 한 번만 생성, 변경 금지)
+NO_CATEGORY_EMBED = error_embed("예약 카테고리 채널을 찾을 수 없습니다. 관리자에게 문의하세요.")
+CHANNEL_CREATE_FORBIDDEN_EMBED = error_embed("채널 생성 권한이 없습니다.")
+SLOT_ACQUIRE_FAILED_EMBED = error_embed("슬롯 할당 실패. 다시 시도해주세요.")
+
 
 class BookingCog(commands.Cog):
     """예매 관련 슬래시 커맨드."""
@@ -27,6 +36,25 @@ class BookingCog(commands.Cog):
     def __init__(self, bot: SRTGoBot) -> None:
         self.bot = bot
         self.engine = BookingEngine(bot.executor)
+        # guild_id → (@everyone 차단, 봇 관리) 채널 권한 템플릿
+        self._overwrite_cache: dict[
+            int, tuple[discord.PermissionOverwrite, discord.PermissionOverwrite]
+        ] = {}
+
+    def _overwrite_templates(
+        self, guild_id: int
+    ) -> tuple[discord.PermissionOverwrite, discord.PermissionOverwrite]:
+        """(@everyone 차단, 봇 관리) 채널 권한 템플릿. 길드별로 한 번만 생성."""
+        templates = self._overwrite_cache.get(guild_id)
+        if templates is None:
+            templates = (
+                discord.PermissionOverwrite(read_messages=False),
+                discord.PermissionOverwrite(
+                    read_messages=True, send_messages=True, manage_channels=True
+                ),
+            )
+            self._overwrite_cache[guild_id] = templates
+        return templates
 
     # ──────────────────────────────────
     # /예매
@@ -59,11 +87,9 @@ class BookingCog(commands.Cog):
             return
 
         # 프로필 확인
-        user_row = await self.bot.user_repo.get_by_discord_id(discord_id)
-        if user_row is None:
-            await interaction.followup.send(
-                embed=error_embed("프로필이 등록되지 않았습니다. `/프로필설정`으로 먼저 등록해주세요."),
-            )
+        user_id = await self.bot.user_repo.get_user_id(discord_id)
+        if user_id is None:
+            await interaction.followup.send(embed=NO_PROFILE_EMBED)
             return
 
         # 자격 증명 확인
@@ -93,23 +119,20 @@ class BookingCog(commands.Cog):
 
         category = guild.get_channel(self.bot.config.category_id)
         if category is None or not isinstance(category, discord.CategoryChannel):
-            await interaction.followup.send(
-                embed=error_embed("예약 카테고리 채널을 찾을 수 없습니다. 관리자에게 문의하세요."),
-            )
+            await interaction.followup.send(embed=NO_CATEGORY_EMBED)
             return
 
         # 채널 권한 설정: 해당 사용자 + 봇만 접근 가능
+        default_ow, bot_ow = self._overwrite_templates(guild.id)
         overwrites = {
-            guild.default_role: discord.PermissionOverwrite(read_messages=False),
+            guild.default_role: default_ow,
             interaction.user: discord.PermissionOverwrite(
                 read_messages=True, send_messages=True
             ),
-            guild.me: discord.PermissionOverwrite(
-                read_messages=True, send_messages=True, manage_channels=True
-            ),
+            guild.me: bot_ow,
         }
 
-        timestamp = datetime.now().strftime("%m%d-%H%M")
+        timestamp = time.strftime("%m%d-%H%M")
         channel_name = f"예매-{interaction.user.display_name}-{rail_type}-{timestamp}".lower()
         try:
             channel = await guild.create_text_channel(
@@ -119,48 +142,33 @@ class BookingCog(commands.Cog):
                 reason=f"{interaction.user.display_name}의 {rail_type} 예매",
             )
         except discord.Forbidden:
-            await interaction.followup.send(embed=error_embed("채널 생성 권한이 없습니다."))
-            return
-
-        # DB 세션 생성
-        session_id = await self.bot.session_repo.create_session(
-            user_id=user_row["id"],
-            rail_type=rail_type,
-            channel_id=str(channel.id),
-        )
-
-        # 슬롯 할당
-        acquired = await self.bot.slot_manager.acquire(
-            session_id=session_id,
-            discord_id=discord_id,
-            channel_id=str(channel.id),
-            rail_type=rail_type,
-        )
-        if not acquired:
-            await channel.delete(reason="슬롯 할당 실패")
-            await interaction.followup.send(
-                embed=error_embed("슬롯 할당 실패. 다시 시도해주세요."),
-            )
+            await interaction.followup.send(embed=CHANNEL_CREATE_FORBIDDEN_EMBED)
             return
 
-        # BookingSession 생성
-        session = BookingSession(
-            session_id=session_id,
-            user_db_id=user_row["id"],
-            discord_id=discord_id,
-            channel_id=channel.id,
-            rail_type=rail_type,
-            rail_client=rail_client,
-        )
-
-        # ConversationManager 시작
-        conv = ConversationManager(self.bot, session, channel)
-        self.bot.conversations[channel.id] = conv
-
-        await interaction.followup.send(f"예매 채널이 생성되었습니다: {channel.mention}")
-
-        # 대화 시작
-        await conv.start()
+        # DB 세션 생성 + 슬롯 할당 (이후 단계에서 예외 발생 시 자동 롤백)
+        try:
+            async with booking_resources(
+                self.bot, channel, user_id, discord_id, rail_type
+            ) as session_id:
+                # BookingSession 생성
+                session = BookingSession(
+                    session_id=session_id,
+                    user_db_id=user_id,
+                    discord_id=discord_id,
+                    channel_id=channel.id,
+                    rail_type=rail_type,
+                    rail_client=rail_client,
+                )
+
+                # ConversationManager 시작 (생성 시 bot.conversations에 등록됨)
+                conv = ConversationManager(self.bot, session, channel)
+
+                await interaction.followup.send(f"예매 채널이 생성되었습니다: {channel.mention}")
+
+                # 대화 시작
+                await conv.start()
+        except SlotUnavailableError:
+            await interaction.followup.send(embed=SLOT_ACQUIRE_FAILED_EMBED)
 
     # ──────────────────────────────────
     # /내예매
@@ -168,15 +176,28 @@ class BookingCog(commands.Cog):
 
     @app_commands.command(name="내예매", description="내 활성 예매 세션을 확인합니다")
     async def my_bookings(self, interaction: discord.Interaction) -> None:
+        # DB 조회 전에 먼저 응답 (3초 제한 해소)
+        await interaction.response.defer(ephemeral=True)
+
         discord_id = str(interaction.user.id)
-        user_row = await self.bot.user_repo.get_by_discord_id(discord_id)
-        if user_row is None:
-            await interaction.response.send_message("등록된 프로필이 없습니다.", ephemeral=True)
+        try:
+            user_id = await asyncio.wait_for(
+                self.bot.user_repo.get_user_id(discord_id), timeout=DB_TIMEOUT
+            )
+            if user_id is None:
+                await interaction.followup.send("등록된 프로필이 없습니다.")
+                return
+
+            sessions = await asyncio.wait_for(
+                self.bot.session_repo.get_active_sessions(user_id=user_id),
+                timeout=DB_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            await interaction.followup.send(embed=DB_TIMEOUT_EMBED)
             return
 
-        sessions = await self.bot.session_repo.get_active_sessions(user_id=user_row["id"])
         if not sessions:
-            await interaction.response.send_message("활성 예매 세션이 없습니다.", ephemeral=True)
+            await interaction.followup.send("활성 예매 세션이 없습니다.")
             return
 
         embed = discord.Embed(title="내 예매 현황", color=0x3498DB)
@@ -193,7 +214,7 @@ class BookingCog(commands.Cog):
                 inline=False,
             )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed)
 
     # ──────────────────────────────────
     # /슬롯
@@ -201,22 +222,17 @@ class BookingCog(commands.Cog):
 
     @app_commands.command(name="슬롯", description="예약 슬롯 현황을 확인합니다")
     async def slot_status(self, interaction: discord.Interaction) -> None:
-        slots = self.bot.slot_manager.get_slots()
-        slots_info = []
-        for s in slots:
-            user = interaction.guild.get_member(int(s.discord_id)) if interaction.guild else None
-            slots_info.append({
-                "user": user.display_name if user else s.discord_id,
-                "rail_type": s.rail_type,
-                "channel": f"<#{s.channel_id}>",
-            })
+        await interaction.response.defer(ephemeral=True)
+
+        slots = self.bot.slot_manager.snapshot()
+        slots_info = format_slots_info(slots, interaction.guild)
 
         embed = slot_status_embed(
-            active=self.bot.slot_manager.active_count,
+            active=len(slots),
             max_slots=self.bot.config.max_slots,
             slots_info=slots_info,
         )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed)
 
 
 async def setup(bot: SRTGoBot) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -9,20 +10,26 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..ui.embeds import error_embed, favorite_routes_embed
+from ..db.repository import DB_TIMEOUT
+from ..ui.embeds import error_embed, favorite_routes_embed, NO_PROFILE_EMBED, DB_TIMEOUT_EMBED
 from ..ui.views import (
     FavoriteDeleteView,
-    StationSelectView,
+    RouteSelectView,
+    build_station_options,
 )
-from srtgo.stations import STATIONS
+from srtgo.stations import ALL_STATION_SET
 
 if TYPE_CHECKING:
     from ..main import SRTGoBot
 
 log = logging.getLogger(__name__)
 
+# 고정 에러 Embed (import 시 한 번만 생성, 변경 금지)
+FAVORITES_FULL_EMBED = error_embed("최대 6개까지 등록 가능합니다. 기존 노선을 삭제한 후 다시 시도해주세요.")
+
 # 즐겨찾기 등록용 역 목록 (SRT + KTX 합집합, 중복 제거, 가나다순)
-ALL_STATIONS = sorted(set(STATIONS["SRT"]) | set(STATIONS["KTX"]))
+ALL_STATIONS = sorted(ALL_STATION_SET)
+ALL_STATION_OPTIONS = build_station_options(ALL_STATIONS)
 
 
 class FavoriteCog(commands.Cog):
@@ -40,54 +47,41 @@ class FavoriteCog(commands.Cog):
         discord_id = str(interaction.user.id)
 
         # 프로필 확인
-        user_row = await self.bot.user_repo.get_by_discord_id(discord_id)
-        if user_row is None:
+        user_id = await self.bot.user_repo.get_user_id(discord_id)
+        if user_id is None:
             await interaction.response.send_message(
-                embed=error_embed("프로필이 등록되지 않았습니다. `/프로필설정`으로 먼저 등록해주세요."),
+                embed=NO_PROFILE_EMBED,
                 ephemeral=True,
             )
             return
 
         # 개수 확인
-        count = await self.bot.fav_repo.count(user_row["id"])
+        count = await self.bot.fav_repo.count(user_id)
         if count >= 6:
             await interaction.response.send_message(
-                embed=error_embed("최대 6개까지 등록 가능합니다. 기존 노선을 삭제한 후 다시 시도해주세요."),
+                embed=FAVORITES_FULL_EMBED,
                 ephemeral=True,
             )
             return
 
         await interaction.response.defer(ephemeral=True)
 
-        # 출발역 선택
-        dep_view = StationSelectView(ALL_STATIONS, "출발역을 선택하세요", timeout=60)
-        dep_msg = await interaction.followup.send("출발역을 선택하세요:", view=dep_view, ephemeral=True, wait=True)
-        await dep_view.wait()
-
-        if dep_view.selected_value is None:
-            await dep_msg.edit(content="시간이 초과되었습니다.", view=None)
-            return
-
-        departure = dep_view.selected_value
-
-        # 도착역 선택
-        arr_view = StationSelectView(ALL_STATIONS, "도착역을 선택하세요", timeout=60)
-        arr_msg = await interaction.followup.send("도착역을 선택하세요:", view=arr_view, ephemeral=True, wait=True)
-        await arr_view.wait()
+        # 출발역 → 도착역 선택 (한 메시지에서 순서대로)
+        route_view = RouteSelectView(ALL_STATION_OPTIONS, timeout=60)
+        route_msg = await interaction.followup.send(
+            "출발역을 선택하세요:", view=route_view, ephemeral=True, wait=True
+        )
+        await route_view.wait()
 
-        if arr_view.selected_value is None:
-            await arr_msg.edit(content="시간이 초과되었습니다.", view=None)
+        if route_view.selected_pair is None:
+            await route_msg.edit(content="시간이 초과되었습니다.", view=None)
             return
 
-        arrival = arr_view.selected_value
-
-        if departure == arrival:
-            await interaction.followup.send("출발역과 도착역이 같습니다.", ephemeral=True)
-            return
+        departure, arrival = route_view.selected_pair
 
         # DB 저장
         try:
-            await self.bot.fav_repo.add(user_row["id"], departure, arrival)
+            await self.bot.fav_repo.add(user_id, departure, arrival)
         except ValueError as e:
             await interaction.followup.send(embed=error_embed(str(e)), ephemeral=True)
             return
@@ -103,19 +97,26 @@ class FavoriteCog(commands.Cog):
 
     @app_commands.command(name="즐겨찾기목록", description="등록된 즐겨찾기 노선을 확인합니다")
     async def list_favorites(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
         discord_id = str(interaction.user.id)
+        try:
+            user_id = await asyncio.wait_for(
+                self.bot.user_repo.get_user_id(discord_id), timeout=DB_TIMEOUT
+            )
+            if user_id is None:
+                await interaction.followup.send(embed=NO_PROFILE_EMBED)
+                return
 
-        user_row = await self.bot.user_repo.get_by_discord_id(discord_id)
-        if user_row is None:
-            await interaction.response.send_message(
-                embed=error_embed("프로필이 등록되지 않았습니다. `/프로필설정`으로 먼저 등록해주세요."),
-                ephemeral=True,
+            routes = await asyncio.wait_for(
+                self.bot.fav_repo.get_all(user_id), timeout=DB_TIMEOUT
             )
+        except asyncio.TimeoutError:
+            await interaction.followup.send(embed=DB_TIMEOUT_EMBED)
             return
 
-        routes = await self.bot.fav_repo.get_all(user_row["id"])
         embed = favorite_routes_embed(routes, interaction.user.display_name)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed)
 
     # ──────────────────────────────────
     # /즐겨찾기삭제
@@ -125,15 +126,15 @@ class FavoriteCog(commands.Cog):
     async def delete_favorite(self, interaction: discord.Interaction) -> None:
         discord_id = str(interaction.user.id)
 
-        user_row = await self.bot.user_repo.get_by_discord_id(discord_id)
-        if user_row is None:
+        user_id = await self.bot.user_repo.get_user_id(discord_id)
+        if user_id is None:
             await interaction.response.send_message(
-                embed=error_embed("프로필이 등록되지 않았습니다. `/프로필설정`으로 먼저 등록해주세요."),
+                embed=NO_PROFILE_EMBED,
                 ephemeral=True,
             )
             return
 
-        routes = await self.bot.fav_repo.get_all(user_row["id"])
+        routes = await self.bot.fav_repo.get_all(user_id)
         if not routes:
             await interaction.response.send_message("등록된 즐겨찾기가 없습니다.", ephemeral=True)
             return
@@ -145,18 +146,12 @@ class FavoriteCog(commands.Cog):
         if view.selected_value is None:
             return
 
-        route_id = int(view.selected_value)
-        # 삭제할 노선 이름 찾기
-        route_name = ""
-        for r in routes:
-            if r["id"] == route_id:
-                route_name = f"{r['departure']} → {r['arrival']}"
-                break
-
-        deleted = await self.bot.fav_repo.remove(route_id, user_row["id"])
+        deleted = await self.bot.fav_repo.remove_and_return(
+            int(view.selected_value), user_id
+        )
         if deleted:
             await interaction.followup.send(
-                f"즐겨찾기에서 **{route_name}** 노선이 삭제되었습니다.",
+                f"즐겨찾기에서 **{deleted['departure']} → {deleted['arrival']}** 노선이 삭제되었습니다.",
                 ephemeral=True,
             )
         else:
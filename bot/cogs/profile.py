@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -9,7 +10,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..ui.embeds import profile_embed, error_embed
+from ..db.repository import DB_TIMEOUT
+from ..ui.embeds import profile_embed, error_embed, DB_TIMEOUT_EMBED
 from ..ui.views import ProfileModal, CardModal
 
 if TYPE_CHECKING:
@@ -17,6 +19,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# 고정 에러 Embed (import 시 한 번만 생성, 변경 금지)
+SAVE_FAILED_EMBED = error_embed("저장 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+PROFILE_NOT_FOUND_EMBED = error_embed("등록된 프로필이 없습니다. `/프로필설정`으로 등록해주세요.")
+
 
 class ProfileCog(commands.Cog):
     """프로필 관련 슬래시 커맨드."""
@@ -38,27 +44,16 @@ class ProfileCog(commands.Cog):
         self, interaction: discord.Interaction, 열차종류: app_commands.Choice[str]
     ) -> None:
         rail_type = 열차종류.value
-        modal = ProfileModal(rail_type)
-        await interaction.response.send_modal(modal)
-        timed_out = await modal.wait()
-
-        if timed_out or not modal.user_id_value or not modal.user_pw_value:
-            return
 
-        discord_id = str(interaction.user.id)
-        discord_name = interaction.user.display_name
-        prefix = "srt" if rail_type == "SRT" else "ktx"
-
-        await self.bot.user_repo.upsert_user(
-            discord_id=discord_id,
-            discord_name=discord_name,
-            **{f"{prefix}_id": modal.user_id_value, f"{prefix}_pw": modal.user_pw_value},
-        )
+        async def _save(modal_interaction: discord.Interaction, fields: dict[str, str]) -> None:
+            if not await self._upsert_from_modal(modal_interaction, fields):
+                return
+            await modal_interaction.followup.send(
+                f"**{rail_type}** 프로필이 저장되었습니다.",
+                ephemeral=True,
+            )
 
-        await interaction.followup.send(
-            f"**{rail_type}** 프로필이 저장되었습니다.",
-            ephemeral=True,
-        )
+        await interaction.response.send_modal(ProfileModal(rail_type, self.bot.modal_saves, on_save=_save))
 
     # ──────────────────────────────────
     # /카드설정
@@ -66,23 +61,31 @@ class ProfileCog(commands.Cog):
 
     @app_commands.command(name="카드설정", description="결제용 카드 정보를 등록합니다")
     async def set_card(self, interaction: discord.Interaction) -> None:
-        modal = CardModal()
-        await interaction.response.send_modal(modal)
-        timed_out = await modal.wait()
-
-        if timed_out or not modal.card_values:
-            return
-
-        discord_id = str(interaction.user.id)
-        discord_name = interaction.user.display_name
-
-        await self.bot.user_repo.upsert_user(
-            discord_id=discord_id,
-            discord_name=discord_name,
-            **modal.card_values,
-        )
-
-        await interaction.followup.send("카드 정보가 저장되었습니다.", ephemeral=True)
+        async def _save(modal_interaction: discord.Interaction, fields: dict[str, str]) -> None:
+            if not await self._upsert_from_modal(modal_interaction, fields):
+                return
+            await modal_interaction.followup.send("카드 정보가 저장되었습니다.", ephemeral=True)
+
+        await interaction.response.send_modal(CardModal(self.bot.modal_saves, on_save=_save))
+
+    async def _upsert_from_modal(
+        self, interaction: discord.Interaction, fields: dict[str, str]
+    ) -> bool:
+        """모달 제출 값을 암호화 저장. 실패 시 사용자에게 알리고 False 반환."""
+        try:
+            await self.bot.user_repo.upsert_user(
+                discord_id=str(interaction.user.id),
+                discord_name=interaction.user.display_name,
+                **fields,
+            )
+        except Exception:
+            log.exception("프로필 저장 실패: %s", interaction.user.id)
+            await interaction.followup.send(
+                embed=SAVE_FAILED_EMBED,
+                ephemeral=True,
+            )
+            return False
+        return True
 
     # ──────────────────────────────────
     # /프로필확인
@@ -90,27 +93,29 @@ class ProfileCog(commands.Cog):
 
     @app_commands.command(name="프로필확인", description="등록된 프로필 정보를 확인합니다")
     async def check_profile(self, interaction: discord.Interaction) -> None:
-        discord_id = str(interaction.user.id)
-        row = await self.bot.user_repo.get_by_discord_id(discord_id)
+        await interaction.response.defer(ephemeral=True)
 
-        if row is None:
-            await interaction.response.send_message(
-                embed=error_embed("등록된 프로필이 없습니다. `/프로필설정`으로 등록해주세요."),
-                ephemeral=True,
+        discord_id = str(interaction.user.id)
+        try:
+            flags = await asyncio.wait_for(
+                self.bot.user_repo.get_profile_flags(discord_id), timeout=DB_TIMEOUT
             )
+        except asyncio.TimeoutError:
+            await interaction.followup.send(embed=DB_TIMEOUT_EMBED)
             return
 
-        has_srt = bool(row.get("srt_id_enc"))
-        has_ktx = bool(row.get("ktx_id_enc"))
-        has_card = bool(row.get("card_number_enc"))
+        if flags is None:
+            await interaction.followup.send(embed=PROFILE_NOT_FOUND_EMBED)
+            return
 
+        has_srt, has_ktx, has_card = flags
         embed = profile_embed(
             discord_name=interaction.user.display_name,
             has_srt=has_srt,
             has_ktx=has_ktx,
             has_card=has_card,
         )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed)
 
     # ──────────────────────────────────
     # /프로필삭제
@@ -118,13 +123,21 @@ class ProfileCog(commands.Cog):
 
     @app_commands.command(name="프로필삭제", description="등록된 프로필을 삭제합니다")
     async def delete_profile(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
         discord_id = str(interaction.user.id)
-        deleted = await self.bot.user_repo.delete_user(discord_id)
+        try:
+            deleted = await asyncio.wait_for(
+                self.bot.user_repo.delete_user(discord_id), timeout=DB_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await interaction.followup.send(embed=DB_TIMEOUT_EMBED)
+            return
 
         if deleted:
-            await interaction.response.send_message("프로필이 삭제되었습니다.", ephemeral=True)
+            await interaction.followup.send("프로필이 삭제되었습니다.")
         else:
-            await interaction.response.send_message("삭제할 프로필이 없습니다.", ephemeral=True)
+            await interaction.followup.send("삭제할 프로필이 없습니다.")
 
 
 async def setup(bot: SRTGoBot) -> None:
@@ -3,8 +3,21 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
+
+
+class ConfigError(ValueError):
+    """설정 오류 (발견된 모든 오류 메시지를 errors에 담는다)."""
+
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
 
 
 @dataclass(frozen=True)
@@ -33,6 +46,10 @@ class Config:
     poll_interval_min: float = 1.0      # 최소 대기 시간 (초)
     poll_interval_max: float = 5.0      # 최대 대기 시간 (초)
 
+    # 적응형 백오프: 폴링 결과가 계속 같으면 대기 상한을 점차 늘림 (상태 변화 시 초기화)
+    poll_backoff_base: float = 1.3      # 단계마다 대기 상한에 곱하는 배수
+    poll_backoff_max: float = 15.0      # 대기 상한의 최댓값 (초, poll_interval_max 이하면 비활성)
+
     # 미세 휴식 (micro-break): 일정 시간 검색 후 짧은 휴식
     micro_break_interval_minutes_min: float = 1.0  # 미세 휴식 간격 최소 (분)
     micro_break_interval_minutes_max: float = 2.0  # 미세 휴식 간격 최대 (분)
@@ -59,51 +76,35 @@ class Config:
     gluetun_api_url: str = ""     # Gluetun 제어 API (예: "http://gluetun:8000")
 
     # ThreadPool
-    thread_pool_workers: int = 8
+    thread_pool_workers: int = 0  # 0이면 슬롯 수 기준 자동 (workers 프로퍼티)
+    search_concurrency: int = 4   # 대화 단계 열차 검색 동시 실행 수 (전체 대화 합산)
+
+    # 이벤트 루프: uvloop 설치 시 사용 (POSIX 전용, 없으면 기본 asyncio 루프)
+    use_uvloop: bool = True
 
     @classmethod
     def from_env(cls) -> Config:
-        """환경변수에서 Config 인스턴스 생성."""
-        return cls(
-            discord_token=os.environ.get("DISCORD_TOKEN", ""),
-            main_channel_id=int(os.environ.get("MAIN_CHANNEL_ID", "0")),
-            category_id=int(os.environ.get("CATEGORY_ID", "0")),
-            success_share_channel_id=int(
-                os.environ.get("SUCCESS_SHARE_CHANNEL_ID", "1467725573534257388")
-            ),
-            master_key=os.environ.get("SRTGO_MASTER_KEY", ""),
-            db_path=os.environ.get("SRTGO_DB_PATH", "data/srtgo.db"),
-            max_slots=int(os.environ.get("MAX_SLOTS", "4")),
-            conversation_timeout=int(os.environ.get("CONVERSATION_TIMEOUT", "300")),
-            # 폴링 간격
-            poll_interval_min=float(os.environ.get("POLL_INTERVAL_MIN", "1.0")),
-            poll_interval_max=float(os.environ.get("POLL_INTERVAL_MAX", "5.0")),
-            # 미세 휴식
-            micro_break_interval_minutes_min=float(
-                os.environ.get("MICRO_BREAK_INTERVAL_MINUTES_MIN", "1.0")
-            ),
-            micro_break_interval_minutes_max=float(
-                os.environ.get("MICRO_BREAK_INTERVAL_MINUTES_MAX", "2.0")
-            ),
-            micro_break_duration_min=float(os.environ.get("MICRO_BREAK_DURATION_MIN", "10.0")),
-            micro_break_duration_max=float(os.environ.get("MICRO_BREAK_DURATION_MAX", "30.0")),
-            # 활동/휴식 사이클
-            poll_active_minutes=int(os.environ.get("POLL_ACTIVE_MINUTES", "60")),
-            poll_active_jitter=float(os.environ.get("POLL_ACTIVE_JITTER", "0.15")),
-            poll_rest_minutes_min=int(os.environ.get("POLL_REST_MINUTES_MIN", "10")),
-            poll_rest_minutes_max=int(os.environ.get("POLL_REST_MINUTES_MAX", "30")),
-            # 전체 제한
-            poll_max_hours=float(os.environ.get("POLL_MAX_HOURS", "0")),
-            poll_max_cycles=int(os.environ.get("POLL_MAX_CYCLES", "0")),
-            # VPN/프록시
-            proxy_enabled=os.environ.get("PROXY_ENABLED", "").lower() in ("true", "1", "yes"),
-            proxy_user=os.environ.get("PROXY_USER", ""),
-            proxy_pass=os.environ.get("PROXY_PASS", ""),
-            proxy_servers=os.environ.get("PROXY_SERVERS", ""),
-            proxy_port=int(os.environ.get("PROXY_PORT", "1080")),
-            proxy_rotate=os.environ.get("PROXY_ROTATE", "true").lower() in ("true", "1", "yes"),
-            gluetun_api_url=os.environ.get("GLUETUN_API_URL", ""),
-        )
+        """환경변수에서 Config 인스턴스 생성.
+
+        값 변환 오류와 validate() 오류를 모아 ConfigError 하나로 발생시킨다.
+        """
+        env = os.environ
+        kwargs: dict[str, Any] = {}
+        errors: list[str] = []
+        for name, env_name, parse in _ENV_SPEC:
+            raw = env.get(env_name)
+            if raw is None:
+                continue  # dataclass 기본값 사용
+            try:
+                kwargs[name] = parse(raw)
+            except ValueError:
+                errors.append(f"{env_name} 값이 올바르지 않습니다: {raw!r}")
+
+        config = cls(**kwargs)
+        errors.extend(config.validate())
+        if errors:
+            raise ConfigError(errors)
+        return config
 
     def validate(self) -> list[str]:
         """설정 유효성 검사. 오류 목록 반환."""
@@ -116,8 +117,64 @@ class Config:
             errors.append("MAIN_CHANNEL_ID 누락")
         if self.category_id == 0:
             errors.append("CATEGORY_ID 누락")
+        if self.search_concurrency < 1:
+            errors.append("SEARCH_CONCURRENCY는 1 이상이어야 합니다")
         return errors
 
+    @property
+    def workers(self) -> int:
+        """스레드 풀 워커 수. 세션마다 로그인/폴링 호출이 대기 없이 돌 수 있도록 슬롯당 2개."""
+        if self.thread_pool_workers > 0:
+            return self.thread_pool_workers
+        return max(self.max_slots * 2, 4)
+
     def ensure_db_dir(self) -> None:
         """DB 파일 디렉토리가 존재하도록 생성."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+
+# (필드명, 환경변수명, 변환 함수) - 환경변수가 없으면 dataclass 기본값 사용
+_ENV_SPEC: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    # Discord
+    ("discord_token", "DISCORD_TOKEN", str),
+    ("main_channel_id", "MAIN_CHANNEL_ID", int),
+    ("category_id", "CATEGORY_ID", int),
+    ("success_share_channel_id", "SUCCESS_SHARE_CHANNEL_ID", int),
+    # 보안 / DB
+    ("master_key", "SRTGO_MASTER_KEY", str),
+    ("db_path", "SRTGO_DB_PATH", str),
+    # 슬롯 / 대화
+    ("max_slots", "MAX_SLOTS", int),
+    ("conversation_timeout", "CONVERSATION_TIMEOUT", int),
+    # 폴링 간격
+    ("poll_interval_min", "POLL_INTERVAL_MIN", float),
+    ("poll_interval_max", "POLL_INTERVAL_MAX", float),
+    ("poll_backoff_base", "POLL_BACKOFF_BASE", float),
+    ("poll_backoff_max", "POLL_BACKOFF_MAX", float),
+    # 미세 휴식
+    ("micro_break_interval_minutes_min", "MICRO_BREAK_INTERVAL_MINUTES_MIN", float),
+    ("micro_break_interval_minutes_max", "MICRO_BREAK_INTERVAL_MINUTES_MAX", float),
+    ("micro_break_duration_min", "MICRO_BREAK_DURATION_MIN", float),
+    ("micro_break_duration_max", "MICRO_BREAK_DURATION_MAX", float),
+    # 활동/휴식 사이클
+    ("poll_active_minutes", "POLL_ACTIVE_MINUTES", int),
+    ("poll_active_jitter", "POLL_ACTIVE_JITTER", float),
+    ("poll_rest_minutes_min", "POLL_REST_MINUTES_MIN", int),
+    ("poll_rest_minutes_max", "POLL_REST_MINUTES_MAX", int),
+    # 전체 제한
+    ("poll_max_hours", "POLL_MAX_HOURS", float),
+    ("poll_max_cycles", "POLL_MAX_CYCLES", int),
+    # VPN/프록시
+    ("proxy_enabled", "PROXY_ENABLED", _parse_bool),
+    ("proxy_user", "PROXY_USER", str),
+    ("proxy_pass", "PROXY_PASS", str),
+    ("proxy_servers", "PROXY_SERVERS", str),
+    ("proxy_port", "PROXY_PORT", int),
+    ("proxy_rotate", "PROXY_ROTATE", _parse_bool),
+    ("gluetun_api_url", "GLUETUN_API_URL", str),
+    # ThreadPool
+    ("thread_pool_workers", "THREAD_POOL_WORKERS", int),
+    ("search_concurrency", "SEARCH_CONCURRENCY", int),
+    # 이벤트 루프
+    ("use_uvloop", "USE_UVLOOP", _parse_bool),
+)
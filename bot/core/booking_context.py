@@ -0,0 +1,70 @@
+"""예매 세션 자원(DB 세션 + 슬롯 + 전용 채널) 수명 관리."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from ..main import SRTGoBot
+
+log = logging.getLogger(__name__)
+
+
+class SlotUnavailableError(RuntimeError):
+    """슬롯 할당 실패."""
+
+
+@asynccontextmanager
+async def booking_resources(
+    bot: SRTGoBot,
+    channel: discord.TextChannel,
+    user_db_id: int,
+    discord_id: str,
+    rail_type: str,
+) -> AsyncIterator[int]:
+    """DB 세션 생성 → 슬롯 할당 후 session_id를 반환.
+
+    블록 안에서 예외가 발생하면 슬롯 해제 / DB 세션 error 처리 / 채널 삭제를
+    한 번에 롤백한다. 슬롯 할당 실패 시 SlotUnavailableError.
+    """
+    session_id: int | None = None
+    try:
+        session_id = await bot.session_repo.create_session(
+            user_id=user_db_id,
+            rail_type=rail_type,
+            channel_id=str(channel.id),
+        )
+        acquired = await bot.slot_manager.acquire(
+            session_id=session_id,
+            discord_id=discord_id,
+            channel_id=str(channel.id),
+            rail_type=rail_type,
+        )
+        if not acquired:
+            raise SlotUnavailableError("슬롯 할당 실패")
+        yield session_id
+    except BaseException:
+        await _rollback(bot, channel, session_id)
+        raise
+
+
+async def _rollback(
+    bot: SRTGoBot, channel: discord.TextChannel, session_id: int | None
+) -> None:
+    """부분적으로 생성된 예매 자원 정리."""
+    bot.conversations.pop(channel.id, None)
+
+    cleanup = [channel.delete(reason="예매 세션 시작 실패")]
+    if session_id is not None:
+        cleanup.append(bot.slot_manager.release(session_id))
+        cleanup.append(bot.session_repo.set_status(session_id, "error"))
+
+    results = await asyncio.gather(*cleanup, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception) and not isinstance(result, discord.NotFound):
+            log.error("예매 자원 롤백 실패: 채널 %s", channel.id, exc_info=result)
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import operator
+import random
+import re
 import time
+import weakref
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from random import randint, uniform
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 import requests as req_lib
 
@@ -37,6 +42,57 @@ from srtgo.ktx import (
     SeniorPassenger,
 )
 
+# 폴링 대기/휴식 시간 전용 난수 생성기
+_rng = random.Random()
+
+# 백오프 없이 기본 랜덤 대기를 유지하는 초기 단계 수
+BACKOFF_WARMUP_STEPS = 2
+
+# 중복 제거 키: (열차번호, 출발시간) — SRTTrain.train_number / Train.train_no
+_train_key_getter = {
+    True: operator.attrgetter("train_number", "dep_time"),
+    False: operator.attrgetter("train_no", "dep_time"),
+}
+_dep_time_getter = operator.attrgetter("dep_time")
+# 검색 결과 비교용: 열차 식별 + 좌석 상태 필드
+_train_state_getter = {
+    True: operator.attrgetter(
+        "train_number", "dep_time",
+        "general_seat_state", "special_seat_state", "reserve_wait_possible_code",
+    ),
+    False: operator.attrgetter(
+        "train_no", "dep_time", "general_seat", "special_seat", "wait_reserve_flag",
+    ),
+}
+
+# 폴링을 계속해도 되는 일시적 오류 메시지
+_SRT_TRANSIENT_RE = re.compile("|".join(map(re.escape, (
+    "잔여석없음",
+    "사용자가 많아 접속이 원활하지 않습니다",
+    "예약대기 접수가 마감되었습니다",
+    "예약대기자한도수초과",
+))))
+_KORAIL_TRANSIENT_RE = re.compile("|".join(map(re.escape, (
+    "Sold out",
+    "잔여석없음",
+    "예약대기자한도수초과",
+))))
+
+
+def _is_transient(ex: SRTError | KorailError) -> bool:
+    """폴링을 계속해도 되는 일시적 오류인지 (매진 등)."""
+    if isinstance(ex, SRTError):
+        return bool(_SRT_TRANSIENT_RE.search(getattr(ex, "msg", str(ex))))
+    return bool(_KORAIL_TRANSIENT_RE.search(str(ex)))
+
+
+# 예기치 않은 오류의 traceback 기록 최소 간격 (초, 세션별)
+TRACEBACK_LOG_INTERVAL = 60.0
+
+# 동일 조건 검색 결과 재사용 (폴링 간격보다 짧게 유지)
+SEARCH_CACHE_TTL = 0.8   # 초
+SEARCH_CACHE_SIZE = 256
+
 
 def _build_passengers_srt(info: PassengerInfo) -> list:
     """SRT 승객 객체 목록 생성."""
@@ -62,66 +118,94 @@ def _build_passengers_ktx(info: PassengerInfo) -> list:
     return passengers
 
 
+# 좌석 유형 문자열 → SeatType/ReserveOption
+_SRT_SEAT_MAP = {
+    "GENERAL_FIRST": SeatType.GENERAL_FIRST,
+    "GENERAL_ONLY": SeatType.GENERAL_ONLY,
+    "SPECIAL_FIRST": SeatType.SPECIAL_FIRST,
+    "SPECIAL_ONLY": SeatType.SPECIAL_ONLY,
+}
+_KTX_SEAT_MAP = {
+    "GENERAL_FIRST": ReserveOption.GENERAL_FIRST,
+    "GENERAL_ONLY": ReserveOption.GENERAL_ONLY,
+    "SPECIAL_FIRST": ReserveOption.SPECIAL_FIRST,
+    "SPECIAL_ONLY": ReserveOption.SPECIAL_ONLY,
+}
+
+
 def _get_seat_option(seat_type_str: str, is_srt: bool):
     """좌석 유형 문자열 → SeatType/ReserveOption 변환."""
-    if is_srt:
-        return {
-            "GENERAL_FIRST": SeatType.GENERAL_FIRST,
-            "GENERAL_ONLY": SeatType.GENERAL_ONLY,
-            "SPECIAL_FIRST": SeatType.SPECIAL_FIRST,
-            "SPECIAL_ONLY": SeatType.SPECIAL_ONLY,
-        }[seat_type_str]
-    else:
-        return {
-            "GENERAL_FIRST": ReserveOption.GENERAL_FIRST,
-            "GENERAL_ONLY": ReserveOption.GENERAL_ONLY,
-            "SPECIAL_FIRST": ReserveOption.SPECIAL_FIRST,
-            "SPECIAL_ONLY": ReserveOption.SPECIAL_ONLY,
-        }[seat_type_str]
-
-
-def _is_seat_available(train, seat_type_str: str, is_srt: bool) -> bool:
-    """좌석 가용성 확인 (기존 srtgo.py 로직 동일)."""
-    if is_srt:
-        seat_type = _get_seat_option(seat_type_str, True)
-        if not train.seat_available():
-            return train.reserve_standby_available()
-        if seat_type in (SeatType.GENERAL_FIRST, SeatType.SPECIAL_FIRST):
-            return train.seat_available()
-        if seat_type == SeatType.GENERAL_ONLY:
-            return train.general_seat_available()
-        return train.special_seat_available()
-    else:
-        seat_type = _get_seat_option(seat_type_str, False)
-        if not train.has_seat():
-            return train.has_waiting_list()
-        if seat_type in (ReserveOption.GENERAL_FIRST, ReserveOption.SPECIAL_FIRST):
-            return train.has_seat()
-        if seat_type == ReserveOption.GENERAL_ONLY:
-            return train.has_general_seat()
-        return train.has_special_seat()
-
-
-def _has_confirmed_seat(train, seat_type_str: str, is_srt: bool) -> bool:
-    """확정 좌석 가용성만 확인 (예약대기/대기 제외)."""
-    if is_srt:
-        if not train.seat_available():
-            return False
-        seat_type = _get_seat_option(seat_type_str, True)
-        if seat_type in (SeatType.GENERAL_FIRST, SeatType.SPECIAL_FIRST):
-            return train.seat_available()
-        if seat_type == SeatType.GENERAL_ONLY:
-            return train.general_seat_available()
-        return train.special_seat_available()
-    else:
-        if not train.has_seat():
-            return False
-        seat_type = _get_seat_option(seat_type_str, False)
-        if seat_type in (ReserveOption.GENERAL_FIRST, ReserveOption.SPECIAL_FIRST):
-            return train.has_seat()
-        if seat_type == ReserveOption.GENERAL_ONLY:
-            return train.has_general_seat()
-        return train.has_special_seat()
+    return (_SRT_SEAT_MAP if is_srt else _KTX_SEAT_MAP)[seat_type_str]
+
+
+def _with_standby(check: Callable[[Any], bool], has_any_seat: Callable[[Any], bool],
+                  standby: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """빈 좌석이 있으면 check, 매진이면 예약대기 가능 여부로 판단하는 함수 생성."""
+    return lambda train: check(train) if has_any_seat(train) else standby(train)
+
+
+_srt_any = operator.methodcaller("seat_available")
+_srt_general = operator.methodcaller("general_seat_available")
+_srt_special = operator.methodcaller("special_seat_available")
+_srt_standby = operator.methodcaller("reserve_standby_available")
+_ktx_any = operator.methodcaller("has_seat")
+_ktx_general = operator.methodcaller("has_general_seat")
+_ktx_special = operator.methodcaller("has_special_seat")
+_ktx_waiting = operator.methodcaller("has_waiting_list")
+
+# (is_srt, 좌석 유형) → 좌석 가용성 확인 함수 (기존 srtgo.py 로직 동일, 매진 시 예약대기 포함)
+_SEAT_AVAILABLE: dict[tuple[bool, str], Callable[[Any], bool]] = {
+    (True, "GENERAL_FIRST"): _with_standby(_srt_any, _srt_any, _srt_standby),
+    (True, "SPECIAL_FIRST"): _with_standby(_srt_any, _srt_any, _srt_standby),
+    (True, "GENERAL_ONLY"): _with_standby(_srt_general, _srt_any, _srt_standby),
+    (True, "SPECIAL_ONLY"): _with_standby(_srt_special, _srt_any, _srt_standby),
+    (False, "GENERAL_FIRST"): _with_standby(_ktx_any, _ktx_any, _ktx_waiting),
+    (False, "SPECIAL_FIRST"): _with_standby(_ktx_any, _ktx_any, _ktx_waiting),
+    (False, "GENERAL_ONLY"): _with_standby(_ktx_general, _ktx_any, _ktx_waiting),
+    (False, "SPECIAL_ONLY"): _with_standby(_ktx_special, _ktx_any, _ktx_waiting),
+}
+
+# (is_srt, 좌석 유형) → 확정 좌석 가용성 확인 함수 (예약대기/대기 제외)
+_SEAT_CONFIRMED: dict[tuple[bool, str], Callable[[Any], bool]] = {
+    (True, "GENERAL_FIRST"): _srt_any,
+    (True, "SPECIAL_FIRST"): _srt_any,
+    (True, "GENERAL_ONLY"): _srt_general,
+    (True, "SPECIAL_ONLY"): _srt_special,
+    (False, "GENERAL_FIRST"): _ktx_any,
+    (False, "SPECIAL_FIRST"): _ktx_any,
+    (False, "GENERAL_ONLY"): _ktx_general,
+    (False, "SPECIAL_ONLY"): _ktx_special,
+}
+
+
+def _session_passengers(session: BookingSession, is_srt: bool) -> tuple[list, list]:
+    """세션의 (예약용, 검색용) 승객 객체 목록. passengers가 바뀔 때만 새로 만든다."""
+    cache = session.passenger_cache
+    if cache is None or cache[0] is not session.passengers:
+        info = session.passengers
+        if is_srt:
+            cache = (info, _build_passengers_srt(info), [Adult(info.total)])
+        else:
+            cache = (info, _build_passengers_ktx(info), [AdultPassenger(info.total)])
+        session.passenger_cache = cache
+    return cache[1], cache[2]
+
+
+# 진행 중인 자격증명 조회: (discord_id, rail_type) → Task (엔진 인스턴스 간 공유)
+_credential_tasks: dict[tuple[str, str], asyncio.Task] = {}
+
+# 클라이언트별 호출 잠금 — SRT/Korail 클라이언트는 NetFunnel 키·requests 세션 상태를
+# 잠금 없이 갱신하므로 같은 클라이언트 호출은 한 번에 하나만 실행한다.
+# 스레드 풀에 넘기기 전에 이벤트 루프에서 기다리므로 대기 중인 호출이 워커를 잡지 않는다.
+_client_locks: weakref.WeakKeyDictionary[Any, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+
+def _client_lock(client) -> asyncio.Lock:
+    """클라이언트 전용 잠금."""
+    lock = _client_locks.get(client)
+    if lock is None:
+        lock = _client_locks[client] = asyncio.Lock()
+    return lock
 
 
 class BookingEngine:
@@ -134,14 +218,29 @@ class BookingEngine:
         self._executor = executor
         self._proxy_servers: list[str] = []
         self._proxy_index: int = 0
+        # (rail_type, dep, arr, date, time, 인원) → (검색 시각, 열차 목록)
+        self._search_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
 
     async def _run_sync(self, func, *args, **kwargs):
         """동기 함수를 비동기로 실행."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            self._executor, lambda: func(*args, **kwargs)
+            self._executor, functools.partial(func, *args, **kwargs)
         )
 
+    async def _run_client(self, client, method: str, *args, **kwargs):
+        """클라이언트 메서드를 클라이언트 잠금 안에서 실행 (같은 클라이언트 호출은 직렬화)."""
+        async with _client_lock(client):
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(getattr(client, method), *args, **kwargs)
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 스레드에서 실행 중인 호출은 멈출 수 없으므로 끝날 때까지 잠금 유지
+                await asyncio.wait((future,))
+                raise
+
     def _get_proxy_url(self, bot: SRTGoBot) -> str | None:
         """현재 프록시 URL 반환. 비활성화 시 None."""
         cfg = bot.config
@@ -173,7 +272,7 @@ class BookingEngine:
         if not api_url:
             return
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             # VPN 중지
             await loop.run_in_executor(self._executor, lambda: req_lib.put(
@@ -234,80 +333,120 @@ class BookingEngine:
             self._apply_proxy(client, bot)
         return client
 
+    def _cached_search(self, key: tuple) -> list | None:
+        """TTL 이내의 동일 조건 검색 결과 반환. 없거나 만료되면 None."""
+        cached = self._search_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= SEARCH_CACHE_TTL:
+            del self._search_cache[key]
+            return None
+        self._search_cache.move_to_end(key)
+        return cached[1]
+
+    def _store_search(self, key: tuple, trains: list) -> None:
+        """검색 결과 저장. 크기 초과 시 가장 오래 안 쓴 항목부터 제거."""
+        self._search_cache[key] = (time.monotonic(), trains)
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
     async def search_trains(self, session: BookingSession) -> list:
         """열차 검색. 복수 시간이 콤마로 구분되어 있으면 각각 검색 후 합산."""
         is_srt = session.rail_type == "SRT"
 
         total_count = session.passengers.total
-        if is_srt:
-            search_passengers = [Adult(total_count)]
-        else:
-            search_passengers = [AdultPassenger(total_count)]
+        _, search_passengers = _session_passengers(session, is_srt)
 
         # 복수 시간 지원: 콤마 구분
         times = session.time.split(",") if "," in session.time else [session.time]
-        all_trains = []
-        seen_keys: set[str] = set()
+        if is_srt:
+            base_params = {"available_only": False}
+        else:
+            base_params = {"include_no_seats": True}
 
+        # 시간대별 검색은 순서대로 (한 클라이언트로는 동시에 요청할 수 없음)
+        results = []
         for t in times:
-            if is_srt:
-                params = {
-                    "dep": session.departure,
-                    "arr": session.arrival,
-                    "date": session.date,
-                    "time": t,
-                    "passengers": search_passengers,
-                    "available_only": False,
-                }
-            else:
-                params = {
-                    "dep": session.departure,
-                    "arr": session.arrival,
-                    "date": session.date,
-                    "time": t,
-                    "passengers": search_passengers,
-                    "include_no_seats": True,
-                }
+            key = (session.rail_type, session.departure, session.arrival, session.date, t, total_count)
+            trains = self._cached_search(key)
+            if trains is None:
+                trains = await self._run_client(
+                    session.rail_client, "search_train",
+                    dep=session.departure,
+                    arr=session.arrival,
+                    date=session.date,
+                    time=t,
+                    passengers=search_passengers,
+                    **base_params,
+                )
+                self._store_search(key, trains)
+            results.append(trains)
 
-            trains = await self._run_sync(session.rail_client.search_train, **params)
+        # 직전 폴링과 열차/좌석 상태가 같으면 병합·정렬 생략
+        state_of = _train_state_getter[is_srt]
+        fingerprint = tuple(tuple(map(state_of, trains)) for trains in results)
+        if fingerprint == session.trains_fingerprint:
+            return session.trains_cache
+        session.trains_fingerprint = fingerprint
 
+        all_trains = []
+        seen_keys: set[tuple[str, str]] = set()
+        train_key = _train_key_getter[is_srt]
+        for trains in results:
             for train in trains:
                 # 중복 제거: 열차번호 + 출발시간
-                train_no = getattr(train, "train_number", None) or getattr(train, "train_no", "")
-                dep_time = getattr(train, "dep_time", "")
-                key = f"{train_no}_{dep_time}"
+                key = train_key(train)
                 if key not in seen_keys:
                     seen_keys.add(key)
                     all_trains.append(train)
 
         # 출발시간 기준 정렬
-        all_trains.sort(key=lambda tr: getattr(tr, "dep_time", ""))
+        all_trains.sort(key=_dep_time_getter)
         session.trains_cache = all_trains
         return all_trains
 
     async def reserve(self, session: BookingSession, train) -> Any:
         """예약 실행."""
         is_srt = session.rail_type == "SRT"
-        passengers = _build_passengers_srt(session.passengers) if is_srt else _build_passengers_ktx(session.passengers)
+        passengers, _ = _session_passengers(session, is_srt)
         option = _get_seat_option(session.seat_type, is_srt)
 
         if is_srt:
             # SRT: 매진이면 예약대기 시도
             if not train.seat_available() and train.reserve_standby_available():
-                return await self._run_sync(
-                    session.rail_client.reserve_standby,
+                return await self._run_client(
+                    session.rail_client, "reserve_standby",
                     train, passengers, option,
                 )
-            return await self._run_sync(
-                session.rail_client.reserve,
+            return await self._run_client(
+                session.rail_client, "reserve",
                 train, passengers, option,
             )
         else:
-            return await self._run_sync(
-                session.rail_client.reserve,
+            return await self._run_client(
+                session.rail_client, "reserve",
                 train, passengers, option,
             )
 
+    async def _reserve_any(self, session: BookingSession, trains: list) -> Any:
+        """선택 순서대로 예약을 시도해 처음 성공한 예약을 반환.
+
+        한 클라이언트의 요청은 어차피 하나씩 실행되므로 하나를 잡으면 바로 멈춘다
+        (열린 열차를 모두 예약했다가 취소하지 않음). 매진 등 일시적 오류면 다음 열차로
+        넘어가고, 모두 실패하면 첫 번째 오류를 그대로 올린다.
+        """
+        first_error: Exception | None = None
+        for train in trains:
+            try:
+                return await self.reserve(session, train)
+            except (SRTError, KorailError) as ex:
+                if not _is_transient(ex):
+                    raise
+                if first_error is None:
+                    first_error = ex
+        raise first_error
+
     async def pay_with_card(
         self,
         session: BookingSession,
@@ -317,8 +456,8 @@ class BookingEngine:
         """카드 결제."""
         birthday = card_info["birthday"]
         card_type = "J" if len(birthday) == 6 else "S"
-        return await self._run_sync(
-            session.rail_client.pay_with_card,
+        return await self._run_client(
+            session.rail_client, "pay_with_card",
             reservation,
             card_info["number"],
             card_info["password"],
@@ -331,51 +470,101 @@ class BookingEngine:
     async def get_reservations(self, session: BookingSession) -> list:
         """예약 목록 조회."""
         if session.rail_type == "SRT":
-            return await self._run_sync(session.rail_client.get_reservations)
+            return await self._run_client(session.rail_client, "get_reservations")
         else:
-            return await self._run_sync(session.rail_client.reservations)
+            return await self._run_client(session.rail_client, "reservations")
 
     async def cancel_reservation(self, session: BookingSession, reservation) -> bool:
         """예약 취소."""
-        return await self._run_sync(session.rail_client.cancel, reservation)
+        return await self._run_client(session.rail_client, "cancel", reservation)
+
+    async def _relogin(self, session: BookingSession, bot: SRTGoBot) -> None:
+        """저장된 자격증명으로 재로그인해 session.rail_client 교체.
+
+        자격증명 조회는 같은 사용자·열차 종류끼리 함께 기다리지만, 로그인은 세션마다
+        따로 해서 클라이언트를 공유하지 않는다 (왕복 두 구간도 각자 클라이언트 사용).
+        """
+        key = (session.discord_id, session.rail_type)
+        task = _credential_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(bot.user_repo.get_credentials(*key))
+            _credential_tasks[key] = task
+            task.add_done_callback(lambda _: _credential_tasks.pop(key, None))
+        # 한 세션이 취소돼도 다른 세션이 기다리는 조회는 계속되도록 shield
+        creds = await asyncio.shield(task)
+        if not creds:
+            return
+        session.rail_client = await self.login(session.rail_type, creds[0], creds[1], bot=bot)
+
+    async def _flush_attempts(self, session: BookingSession, bot: SRTGoBot) -> None:
+        """아직 DB에 반영하지 않은 시도 횟수를 한 번에 기록."""
+        count = session.unflushed_attempts
+        if not count:
+            return
+        session.unflushed_attempts = 0
+        try:
+            await bot.session_repo.increment_attempt(session.session_id, count)
+        except Exception:
+            log.exception("시도 횟수 기록 실패: 세션 %s", session.session_id)
+
+    def _advance_backoff(self, session: BookingSession, state: Any) -> None:
+        """폴링 결과 상태가 바뀌면 백오프 단계 초기화, 같으면 한 단계 증가."""
+        if state != session.poll_state:
+            session.poll_state = state
+            session.backoff_step = 0
+        else:
+            session.backoff_step += 1
+
+    async def _poll_sleep(self, session: BookingSession, bot: SRTGoBot, state: Any) -> None:
+        """폴링 결과 state를 반영해 백오프를 갱신하고 다음 폴링까지 대기."""
+        self._advance_backoff(session, state)
+        await asyncio.sleep(self._next_delay(session, bot))
 
-    def _random_delay(self, bot: SRTGoBot) -> float:
-        """균등분포 기반 랜덤 대기 시간 생성 (초)."""
+    def _next_delay(self, session: BookingSession, bot: SRTGoBot) -> float:
+        """다음 폴링까지 대기 시간 (초).
+
+        처음 BACKOFF_WARMUP_STEPS 단계는 설정 범위의 균등 랜덤 대기를 그대로 쓰고,
+        이후 결과가 계속 같으면 상한만 poll_backoff_base배씩 poll_backoff_max까지 늘린다.
+        하한은 그대로 두어 매 요청의 랜덤성(매크로 회피)은 유지한다.
+        """
         cfg = bot.config
         low = min(cfg.poll_interval_min, cfg.poll_interval_max)
         high = max(cfg.poll_interval_min, cfg.poll_interval_max)
-        return uniform(low, high)
+        step = session.backoff_step - BACKOFF_WARMUP_STEPS
+        if step > 0 and cfg.poll_backoff_max > high:
+            high = min(cfg.poll_backoff_max, high * cfg.poll_backoff_base ** step)
+        return _rng.uniform(low, high)
 
     def _next_micro_break_after(self, bot: SRTGoBot) -> float:
         """다음 미세 휴식까지의 활동 시간 (랜덤, 초)."""
         cfg = bot.config
         low = min(cfg.micro_break_interval_minutes_min, cfg.micro_break_interval_minutes_max)
         high = max(cfg.micro_break_interval_minutes_min, cfg.micro_break_interval_minutes_max)
-        return uniform(low, high) * 60
+        return _rng.uniform(low, high) * 60
 
     def _micro_break_duration(self, bot: SRTGoBot) -> float:
         """미세 휴식 시간 (랜덤, 초)."""
         cfg = bot.config
-        return uniform(cfg.micro_break_duration_min, cfg.micro_break_duration_max)
+        return _rng.uniform(cfg.micro_break_duration_min, cfg.micro_break_duration_max)
 
     def _active_duration(self, bot: SRTGoBot) -> float:
         """활동 시간 (기준값 ± jitter%, 초). 매 사이클마다 다른 값."""
         cfg = bot.config
         base = cfg.poll_active_minutes * 60
         jitter = cfg.poll_active_jitter
-        return uniform(base * (1 - jitter), base * (1 + jitter))
+        return _rng.uniform(base * (1 - jitter), base * (1 + jitter))
 
     def _rest_duration(self, bot: SRTGoBot) -> float:
         """활동/휴식 사이클의 휴식 시간 (랜덤, 초)."""
         cfg = bot.config
         low = min(cfg.poll_rest_minutes_min, cfg.poll_rest_minutes_max)
         high = max(cfg.poll_rest_minutes_min, cfg.poll_rest_minutes_max)
-        return randint(low, high) * 60
+        return _rng.randint(low, high) * 60
 
     async def polling_loop(
         self,
         session: BookingSession,
-        on_progress: Any,  # Callable[[int, str], Awaitable]
+        on_progress: Any,  # Callable[[int, int], Awaitable] - (시도 횟수, 경과 초)
         on_success: Any,   # Callable[[Any], Awaitable]
         on_error: Any,     # Callable[[str], Awaitable]
         bot: SRTGoBot,
@@ -394,242 +583,230 @@ class BookingEngine:
         3. 활동/휴식 사이클: 활성 검색 → 장시간 휴식 → 반복
         4. 최대 시간 제한: 전체 검색 시간 초과 시 자동 종료
         """
-        is_srt = session.rail_type == "SRT"
-        cfg = bot.config
-        session.status = SessionStatus.SEARCHING
-        await bot.session_repo.set_status(session.session_id, "searching")
-
-        total_start_time = time.time()
-        cycle_start_time = time.time()
-        current_active_limit = self._active_duration(bot)  # 이번 사이클 활동 시간 (±jitter)
-        has_waiting = False  # 예약대기 확보 여부
-        cycle_count = 0      # 현재 사이클 번호
-        micro_break_start_time = time.time()
-        next_micro_break_after = self._next_micro_break_after(bot)
-
-        while session.status == SessionStatus.SEARCHING:
-            try:
-                # ── 전체 시간 제한 확인 ──
-                total_elapsed = time.time() - total_start_time
-                if cfg.poll_max_hours > 0 and total_elapsed >= cfg.poll_max_hours * 3600:
-                    log.info(
-                        "최대 검색 시간 초과 (%.1f시간): 세션 %s 종료",
-                        cfg.poll_max_hours, session.session_id,
-                    )
-                    session.status = SessionStatus.TIMEOUT
-                    await bot.session_repo.set_status(session.session_id, "timeout")
-                    await on_error(
-                        f"최대 검색 시간({cfg.poll_max_hours}시간)이 초과되어 자동 종료됩니다."
-                    )
-                    return
-
-                # ── 활동/휴식 사이클 확인 ──
-                cycle_elapsed = time.time() - cycle_start_time
-                if cfg.poll_active_minutes > 0 and cycle_elapsed >= current_active_limit:
-                    cycle_count += 1
-                    active_mins = int(current_active_limit / 60)
-
-                    # 최대 사이클 수 확인
-                    if cfg.poll_max_cycles > 0 and cycle_count >= cfg.poll_max_cycles:
+        try:
+            is_srt = session.rail_type == "SRT"
+            is_available = _SEAT_AVAILABLE[(is_srt, session.seat_type)]
+            has_confirmed_seat = _SEAT_CONFIRMED[(is_srt, session.seat_type)]
+            cfg = bot.config
+            # 대화 확인 단계에서 세션 정보와 함께 이미 저장했으면 생략
+            if session.status is not SessionStatus.SEARCHING:
+                session.status = SessionStatus.SEARCHING
+                await bot.session_repo.set_status(session.session_id, "searching")
+
+            total_start_time = time.monotonic()
+            cycle_start_time = time.monotonic()
+            current_active_limit = self._active_duration(bot)  # 이번 사이클 활동 시간 (±jitter)
+            has_waiting = False  # 예약대기 확보 여부
+            cycle_count = 0      # 현재 사이클 번호
+            micro_break_start_time = time.monotonic()
+            next_micro_break_after = self._next_micro_break_after(bot)
+
+            while session.status is SessionStatus.SEARCHING:
+                try:
+                    # ── 전체 시간 제한 확인 ──
+                    total_elapsed = time.monotonic() - total_start_time
+                    if cfg.poll_max_hours > 0 and total_elapsed >= cfg.poll_max_hours * 3600:
                         log.info(
-                            "최대 사이클 초과 (%d회): 세션 %s 종료",
-                            cfg.poll_max_cycles, session.session_id,
+                            "최대 검색 시간 초과 (%.1f시간): 세션 %s 종료",
+                            cfg.poll_max_hours, session.session_id,
                         )
                         session.status = SessionStatus.TIMEOUT
                         await bot.session_repo.set_status(session.session_id, "timeout")
                         await on_error(
-                            f"최대 검색 사이클({cfg.poll_max_cycles}회)이 초과되어 자동 종료됩니다."
+                            f"최대 검색 시간({cfg.poll_max_hours}시간)이 초과되어 자동 종료됩니다."
                         )
                         return
 
-                    # 휴식 진입
-                    rest_secs = self._rest_duration(bot)
-                    rest_mins = int(rest_secs / 60)
-                    log.info(
-                        "세션 %s: %d분 활동 후 약 %d분 휴식 (사이클 %d)",
-                        session.session_id, active_mins, rest_mins, cycle_count,
-                    )
+                    # ── 활동/휴식 사이클 확인 ──
+                    cycle_elapsed = time.monotonic() - cycle_start_time
+                    if cfg.poll_active_minutes > 0 and cycle_elapsed >= current_active_limit:
+                        cycle_count += 1
+                        active_mins = int(current_active_limit / 60)
+
+                        # 최대 사이클 수 확인
+                        if cfg.poll_max_cycles > 0 and cycle_count >= cfg.poll_max_cycles:
+                            log.info(
+                                "최대 사이클 초과 (%d회): 세션 %s 종료",
+                                cfg.poll_max_cycles, session.session_id,
+                            )
+                            session.status = SessionStatus.TIMEOUT
+                            await bot.session_repo.set_status(session.session_id, "timeout")
+                            await on_error(
+                                f"최대 검색 사이클({cfg.poll_max_cycles}회)이 초과되어 자동 종료됩니다."
+                            )
+                            return
+
+                        # 휴식 진입
+                        rest_secs = self._rest_duration(bot)
+                        rest_mins = int(rest_secs / 60)
+                        log.info(
+                            "세션 %s: %d분 활동 후 약 %d분 휴식 (사이클 %d)",
+                            session.session_id, active_mins, rest_mins, cycle_count,
+                        )
 
-                    if on_rest:
-                        await on_rest(rest_mins, f"사이클 {cycle_count}")
+                        if on_rest:
+                            await on_rest(rest_mins, f"사이클 {cycle_count}")
 
-                    # 휴식 시작 전 Gluetun IP 변경 (다음 사이클 준비)
-                    await self._rotate_gluetun_ip(bot)
+                        # 휴식 시작 전 Gluetun IP 변경 (다음 사이클 준비)
+                        await self._rotate_gluetun_ip(bot)
 
-                    await asyncio.sleep(rest_secs)
+                        await asyncio.sleep(rest_secs)
 
-                    # 휴식 후 재로그인 (세션 만료 방지)
-                    try:
-                        creds = await bot.user_repo.get_credentials(
-                            session.discord_id, session.rail_type
+                        # 휴식 후 재로그인 (세션 만료 방지)
+                        try:
+                            await self._relogin(session, bot)
+                        except Exception:
+                            log.exception("휴식 후 재로그인 실패")
+                            session.status = SessionStatus.ERROR
+                            await on_error("휴식 후 재로그인 실패")
+                            return
+
+                        # 프록시 로테이션 (휴식 후 새 IP로 전환)
+                        self._rotate_proxy(bot)
+                        session.backoff_step = 0
+
+                        cycle_start_time = time.monotonic()
+                        current_active_limit = self._active_duration(bot)  # 새 사이클마다 다른 활동 시간
+                        micro_break_start_time = time.monotonic()
+                        next_micro_break_after = self._next_micro_break_after(bot)
+
+                        if on_resume:
+                            await on_resume(cycle_count + 1)
+
+                    # ── 미세 휴식 확인 ──
+                    micro_break_elapsed = time.monotonic() - micro_break_start_time
+                    if micro_break_elapsed >= next_micro_break_after:
+                        break_duration = self._micro_break_duration(bot)
+                        log.debug(
+                            "세션 %s: 미세 휴식 %.1f초 (%.1f분 활동 후)",
+                            session.session_id, break_duration, micro_break_elapsed / 60,
+                        )
+                        await asyncio.sleep(break_duration)
+                        micro_break_start_time = time.monotonic()
+                        next_micro_break_after = self._next_micro_break_after(bot)
+
+                    # ── 실제 검색/예약 로직 ──
+                    session.attempt_count += 1
+                    session.unflushed_attempts += 1
+
+                    # 진행 상태 업데이트 + 시도 횟수 DB 반영 (10회마다)
+                    if session.attempt_count % 10 == 0:
+                        await self._flush_attempts(session, bot)
+                        # 경과 시간 문자열은 콜백이 실제로 메시지를 수정할 때만 만든다
+                        await on_progress(
+                            session.attempt_count, int(time.monotonic() - total_start_time)
                         )
-                        if creds:
-                            session.rail_client = await self.login(
-                                session.rail_type, creds[0], creds[1], bot=bot,
-                            )
-                    except Exception:
-                        log.exception("휴식 후 재로그인 실패")
-                        session.status = SessionStatus.ERROR
-                        await on_error("휴식 후 재로그인 실패")
-                        return
 
-                    # 프록시 로테이션 (휴식 후 새 IP로 전환)
-                    self._rotate_proxy(bot)
-
-                    cycle_start_time = time.time()
-                    current_active_limit = self._active_duration(bot)  # 새 사이클마다 다른 활동 시간
-                    micro_break_start_time = time.time()
-                    next_micro_break_after = self._next_micro_break_after(bot)
-
-                    if on_resume:
-                        await on_resume(cycle_count + 1)
-
-                # ── 미세 휴식 확인 ──
-                micro_break_elapsed = time.time() - micro_break_start_time
-                if micro_break_elapsed >= next_micro_break_after:
-                    break_duration = self._micro_break_duration(bot)
-                    log.debug(
-                        "세션 %s: 미세 휴식 %.1f초 (%.1f분 활동 후)",
-                        session.session_id, break_duration, micro_break_elapsed / 60,
-                    )
-                    await asyncio.sleep(break_duration)
-                    micro_break_start_time = time.time()
-                    next_micro_break_after = self._next_micro_break_after(bot)
-
-                # ── 실제 검색/예약 로직 ──
-                session.attempt_count += 1
-                await bot.session_repo.increment_attempt(session.session_id)
-
-                # 진행 상태 업데이트 (10회마다)
-                if session.attempt_count % 10 == 0:
-                    elapsed = time.time() - total_start_time
-                    hours, remainder = divmod(int(elapsed), 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    elapsed_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    await on_progress(session.attempt_count, elapsed_str)
-
-                # 열차 검색
-                trains = await self.search_trains(session)
-
-                # 선택된 열차 확인
-                for idx in session.selected_train_indices:
-                    if idx < len(trains):
-                        train = trains[idx]
-
-                        # 예약대기 확보 후에는 확정 좌석만 확인
-                        if has_waiting:
-                            available = _has_confirmed_seat(train, session.seat_type, is_srt)
-                        else:
-                            available = _is_seat_available(train, session.seat_type, is_srt)
+                    # 열차 검색
+                    trains = await self.search_trains(session)
 
-                        if available:
-                            # 예약 시도
-                            reservation = await self.reserve(session, train)
-                            is_waiting_rsv = getattr(reservation, "is_waiting", False)
+                    # 선택된 열차 확인
+                    seat_state: list[bool] = []
+                    candidates = []
+                    for idx in session.selected_train_indices:
+                        if idx < len(trains):
+                            train = trains[idx]
 
-                            # 예약번호 저장
-                            if is_srt:
-                                rsv_number = reservation.reservation_number
+                            # 예약대기 확보 후에는 확정 좌석만 확인
+                            if has_waiting:
+                                available = has_confirmed_seat(train)
                             else:
-                                rsv_number = reservation.rsv_id
-
-                            if is_waiting_rsv and not has_waiting:
-                                # 예약대기 → 저장하고 계속 진행
-                                has_waiting = True
-                                session.reservation_number = rsv_number
-                                await bot.session_repo.update_session(
-                                    session.session_id,
-                                    reservation_number=rsv_number,
-                                )
-                                if on_waiting:
-                                    await on_waiting(reservation)
-                                break  # 이번 루프의 열차 탐색 중단, 다음 폴링으로
-
-                            elif not is_waiting_rsv:
-                                # 확정 예약 → 성공
-                                session.status = SessionStatus.RESERVED
-                                session.reservation_number = rsv_number
-
-                                await bot.session_repo.set_status(session.session_id, "reserved")
-                                await bot.session_repo.update_session(
-                                    session.session_id,
-                                    reservation_number=rsv_number,
-                                )
-
-                                await on_success(reservation)
-                                return
+                                available = is_available(train)
+                            seat_state.append(available)
+                            if available:
+                                candidates.append(train)
+
+                    if candidates:
+                        # 예약 시도 (여러 열차가 열렸으면 선택 순서대로)
+                        reservation = await self._reserve_any(session, candidates)
+                        is_waiting_rsv = getattr(reservation, "is_waiting", False)
+
+                        # 예약번호 저장
+                        if is_srt:
+                            rsv_number = reservation.reservation_number
+                        else:
+                            rsv_number = reservation.rsv_id
+
+                        if is_waiting_rsv and not has_waiting:
+                            # 예약대기 → 저장하고 다음 폴링으로 계속 진행
+                            has_waiting = True
+                            session.reservation_number = rsv_number
+                            await bot.session_repo.update_session(
+                                session.session_id,
+                                reservation_number=rsv_number,
+                            )
+                            if on_waiting:
+                                await on_waiting(reservation)
 
-                # 설정된 범위(기본 1~5초)의 균등 랜덤 대기
-                await asyncio.sleep(self._random_delay(bot))
+                        elif not is_waiting_rsv:
+                            # 확정 예약 → 성공
+                            session.status = SessionStatus.RESERVED
+                            session.reservation_number = rsv_number
 
-            except (SRTError, KorailError) as ex:
-                msg = str(ex)
-                err_msg = getattr(ex, "msg", msg)
-
-                if isinstance(ex, SRTError):
-                    if "정상적인 경로로 접근 부탁드립니다" in err_msg:
-                        session.rail_client.clear()
-                        log.debug("NetFunnel 키 클리어 후 재시도")
-                    elif "로그인 후 사용하십시오" in err_msg:
-                        log.info("세션 만료, 재로그인 시도")
-                        try:
-                            creds = await bot.user_repo.get_credentials(
-                                session.discord_id, session.rail_type
+                            await bot.session_repo.set_status(
+                                session.session_id, "reserved",
+                                reservation_number=rsv_number,
                             )
-                            if creds:
-                                session.rail_client = await self.login(
-                                    session.rail_type, creds[0], creds[1], bot=bot,
-                                )
-                        except Exception:
-                            log.exception("재로그인 실패")
-                            session.status = SessionStatus.ERROR
-                            await on_error("재로그인 실패")
+
+                            await on_success(reservation)
                             return
-                    elif not any(
-                        e in err_msg
-                        for e in (
-                            "잔여석없음",
-                            "사용자가 많아 접속이 원활하지 않습니다",
-                            "예약대기 접수가 마감되었습니다",
-                            "예약대기자한도수초과",
-                        )
-                    ):
-                        log.warning("SRT 에러: %s", err_msg)
-                        session.status = SessionStatus.ERROR
-                        await on_error(f"예매 오류: {err_msg}")
-                        return
-                else:
-                    # KorailError
-                    if not any(
-                        e in msg
-                        for e in ("Sold out", "잔여석없음", "예약대기자한도수초과")
-                    ):
-                        log.warning("Korail 에러: %s", msg)
-                        session.status = SessionStatus.ERROR
-                        await on_error(f"예매 오류: {msg}")
-                        return
 
-                await asyncio.sleep(self._random_delay(bot))
+                    # 좌석 현황이 그대로면 대기 상한을 점차 늘림 (변화 시 초기화)
+                    await self._poll_sleep(session, bot, ("seats", len(trains), tuple(seat_state)))
+
+                except (SRTError, KorailError) as ex:
+                    msg = str(ex)
+                    err_msg = getattr(ex, "msg", msg)
+
+                    if isinstance(ex, SRTError):
+                        if "정상적인 경로로 접근 부탁드립니다" in err_msg:
+                            await self._run_client(session.rail_client, "clear")
+                            log.debug("NetFunnel 키 클리어 후 재시도")
+                        elif "로그인 후 사용하십시오" in err_msg:
+                            log.info("세션 만료, 재로그인 시도")
+                            try:
+                                await self._relogin(session, bot)
+                            except Exception:
+                                log.exception("재로그인 실패")
+                                session.status = SessionStatus.ERROR
+                                await on_error("재로그인 실패")
+                                return
+                        elif not _SRT_TRANSIENT_RE.search(err_msg):
+                            log.warning("SRT 에러: %s", err_msg)
+                            session.status = SessionStatus.ERROR
+                            await on_error(f"예매 오류: {err_msg}")
+                            return
+                    else:
+                        # KorailError
+                        if not _KORAIL_TRANSIENT_RE.search(msg):
+                            log.warning("Korail 에러: %s", msg)
+                            session.status = SessionStatus.ERROR
+                            await on_error(f"예매 오류: {msg}")
+                            return
 
-            except asyncio.CancelledError:
-                session.status = SessionStatus.CANCELLED
-                await bot.session_repo.set_status(session.session_id, "cancelled")
-                return
+                    await self._poll_sleep(session, bot, ("error", err_msg))
 
-            except Exception as ex:
-                log.exception("예기치 않은 오류")
-                # 재로그인 시도
-                try:
-                    creds = await bot.user_repo.get_credentials(
-                        session.discord_id, session.rail_type
-                    )
-                    if creds:
-                        session.rail_client = await self.login(
-                            session.rail_type, creds[0], creds[1], bot=bot,
-                        )
-                except Exception:
-                    session.status = SessionStatus.ERROR
-                    await on_error(f"예기치 않은 오류: {ex}")
+                except asyncio.CancelledError:
+                    session.status = SessionStatus.CANCELLED
+                    await bot.session_repo.set_status(session.session_id, "cancelled")
                     return
 
-                await asyncio.sleep(self._random_delay(bot))
+                except Exception as ex:
+                    # 같은 오류가 반복될 때 traceback은 세션당 주기적으로만 기록
+                    now = time.monotonic()
+                    if now - session.last_traceback_at >= TRACEBACK_LOG_INTERVAL:
+                        session.last_traceback_at = now
+                        log.exception("예기치 않은 오류: 세션 %s", session.session_id)
+                    else:
+                        log.warning("예기치 않은 오류: 세션 %s: %r", session.session_id, ex)
+                    # 재로그인 시도
+                    try:
+                        await self._relogin(session, bot)
+                    except Exception:
+                        session.status = SessionStatus.ERROR
+                        await on_error(f"예기치 않은 오류: {ex}")
+                        return
+
+                    await self._poll_sleep(session, bot, ("exception", type(ex).__name__))
+        finally:
+            await self._flush_attempts(session, bot)
@@ -18,20 +18,44 @@ class SessionStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PassengerInfo:
-    """승객 정보."""
+    """승객 정보 (불변 — 인원이 바뀌면 새로 생성)."""
 
     adults: int = 1
     children: int = 0
     seniors: int = 0
 
+    # 생성 시 한 번 계산해 두는 파생 값
+    _dict: dict[str, int] = field(init=False, repr=False, compare=False)
+    _json: str = field(init=False, repr=False, compare=False)
+    _description: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_dict", {
+            "adults": self.adults, "children": self.children, "seniors": self.seniors,
+        })
+        object.__setattr__(self, "_json", json.dumps(self._dict))
+        parts = []
+        if self.adults:
+            parts.append(f"어른 {self.adults}명")
+        if self.children:
+            parts.append(f"어린이 {self.children}명")
+        if self.seniors:
+            parts.append(f"경로 {self.seniors}명")
+        object.__setattr__(self, "_description", ", ".join(parts) if parts else "승객 없음")
+
     @property
     def total(self) -> int:
         return self.adults + self.children + self.seniors
 
     def to_dict(self) -> dict[str, int]:
-        return {"adults": self.adults, "children": self.children, "seniors": self.seniors}
+        """직렬화용 dict (공유 객체이므로 수정하지 말 것)."""
+        return self._dict
+
+    def to_json(self) -> str:
+        """passengers_json 컬럼 값 (DB 저장 시 그대로 전달)."""
+        return self._json
 
     @classmethod
     def from_dict(cls, d: dict[str, int]) -> PassengerInfo:
@@ -42,17 +66,10 @@ class PassengerInfo:
         )
 
     def description(self) -> str:
-        parts = []
-        if self.adults:
-            parts.append(f"어른 {self.adults}명")
-        if self.children:
-            parts.append(f"어린이 {self.children}명")
-        if self.seniors:
-            parts.append(f"경로 {self.seniors}명")
-        return ", ".join(parts) if parts else "승객 없음"
+        return self._description
 
 
-@dataclass
+@dataclass(slots=True)
 class BookingSession:
     """예약 세션 메모리 상태."""
 
@@ -75,12 +92,19 @@ class BookingSession:
     # 상태
     status: SessionStatus = SessionStatus.SETUP
     attempt_count: int = 0
+    unflushed_attempts: int = field(default=0, repr=False)  # DB 미반영 시도 횟수
     reservation_number: str = ""
 
     # 런타임 (DB에 저장하지 않음)
     rail_client: Any = field(default=None, repr=False)
     status_message: Any = field(default=None, repr=False)  # discord.Message
     trains_cache: list[Any] = field(default_factory=list, repr=False)
+    trains_fingerprint: Any = field(default=None, repr=False)  # trains_cache 생성 당시 검색 결과 요약
+    backoff_step: int = field(default=0, repr=False)   # 폴링 백오프 단계
+    poll_state: Any = field(default=None, repr=False)  # 직전 폴링 결과 요약 (백오프 초기화 판단용)
+    last_traceback_at: float = field(default=float("-inf"), repr=False)  # 마지막 traceback 기록 시각 (monotonic)
+    # (PassengerInfo, 예약용 승객 목록, 검색용 승객 목록) — passengers 교체 시 재생성
+    passenger_cache: tuple[PassengerInfo, list, list] | None = field(default=None, repr=False)
 
     @property
     def seat_type_desc(self) -> str:
@@ -8,24 +8,34 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
+import time
+from dataclasses import replace
 from enum import Enum, auto
-from typing import Any, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Coroutine, Sequence, TYPE_CHECKING
 
 import discord
 
 from .booking_engine import BookingEngine
 from .booking_session import BookingSession, PassengerInfo, SessionStatus
 from ..ui.embeds import (
-    train_list_embed,
+    add_train_field,
+    train_list_embed_base,
     booking_summary_embed,
     searching_embed,
+    set_searching_progress,
     success_embed,
     waiting_embed,
     rest_embed,
     resume_embed,
     error_embed,
 )
-from ..ui.formatters import format_train_for_select, format_reservation_detail, format_trains_summary
+from ..ui.formatters import (
+    format_elapsed,
+    format_reservation_detail,
+    format_train_for_select,
+    format_trains_summary,
+)
 from ..ui.views import (
     StationSelectView,
     DateSelectView,
@@ -38,14 +48,49 @@ from ..ui.views import (
     FavoriteRouteSelectView,
     TripTypeView,
     StopBookingView,
+    build_station_options,
 )
-from srtgo.stations import STATIONS
+from srtgo.stations import STATION_SETS, STATIONS
 
 if TYPE_CHECKING:
     from ..main import SRTGoBot
 
 log = logging.getLogger(__name__)
 
+# 검색 진행 상황 메시지 최소 수정 간격 (초) — Discord 메시지 수정 rate limit 여유
+PROGRESS_EDIT_INTERVAL = 15.0
+
+# 대화 단계 검색 결과 재사용 시간 (초) — 같은 조건을 다시 고르거나 다른 대화가 같은 노선을 검색할 때
+SEARCH_RESULT_TTL = 30.0
+
+# 열차 종류별 역 선택 옵션 (모든 대화에서 공유)
+STATION_OPTIONS = {
+    rail_type: build_station_options(stations) for rail_type, stations in STATIONS.items()
+}
+
+
+def _format_train_list(
+    trains: list, rail_type: str, departure: str, arrival: str, date: str
+) -> tuple[tuple[dict[str, str], ...], discord.Embed]:
+    """열차 목록 포맷팅 (이벤트 루프 밖에서 실행). 선택용 데이터와 Embed를 한 번에 만든다."""
+    embed = train_list_embed_base(rail_type, departure, arrival, date)
+    trains_data = []
+    for i, t in enumerate(trains):
+        row = format_train_for_select(t, i, rail_type)
+        trains_data.append(row)
+        add_train_field(embed, i, row, rail_type)
+    return tuple(trains_data), embed
+
+
+def _selected_trains_summary(
+    trains_data: tuple[dict[str, str], ...], indices: list[int]
+) -> str:
+    """선택한 인덱스의 열차만 요약 문자열로 (인덱스는 TrainSelect에서 범위 검증됨)."""
+    if not indices:
+        return format_trains_summary([])
+    selected = operator.itemgetter(*indices)(trains_data)
+    return format_trains_summary(selected if len(indices) > 1 else [selected])
+
 
 class ConvStep(Enum):
     """대화 단계."""
@@ -69,6 +114,134 @@ class ConvStep(Enum):
     DONE = auto()
 
 
+class _LegCallbacks:
+    """예매 구간 하나의 폴링 콜백 (편도 / 왕복 가는 편·오는 편 공용).
+
+    terminal이면 이 구간의 성공/오류가 곧 대화 종료 (편도).
+    아니면 결과만 기록하고 정리는 _watch_legs에 맡긴다 (왕복).
+    """
+
+    __slots__ = ("mgr", "session", "label", "terminal", "live_embed", "status_msg", "last_edit")
+
+    def __init__(
+        self, mgr: ConversationManager, session: BookingSession, label: str, terminal: bool,
+    ) -> None:
+        self.mgr = mgr
+        self.session = session
+        self.label = label
+        self.terminal = terminal
+        # 진행 상태 Embed는 하나를 만들어 두고 제자리 수정
+        self.live_embed = searching_embed(session.rail_type, 0, "00:00:00", leg_label=label)
+        self.status_msg: discord.Message | None = None
+        self.last_edit = float("-inf")
+
+    @property
+    def _prefix(self) -> str:
+        return f"**{self.label}** " if self.label else ""
+
+    def polling(self) -> Coroutine[Any, Any, None]:
+        """이 구간의 polling_loop 코루틴."""
+        mgr = self.mgr
+        return mgr.engine.polling_loop(
+            self.session, self.on_progress, self.on_success, self.on_error, mgr.bot,
+            on_waiting=self.on_waiting,
+            on_rest=self.on_rest,
+            on_resume=self.on_resume,
+        )
+
+    async def on_progress(self, attempt: int, elapsed_seconds: int) -> None:
+        if self.status_msg is None:
+            return
+        now = time.monotonic()
+        if now - self.last_edit < PROGRESS_EDIT_INTERVAL:
+            return
+        self.last_edit = now
+        try:
+            await self.status_msg.edit(
+                embed=set_searching_progress(
+                    self.live_embed, attempt, format_elapsed(elapsed_seconds)
+                )
+            )
+        except discord.HTTPException:
+            pass
+
+    async def on_success(self, reservation) -> None:
+        mgr, session = self.mgr, self.session
+        # 결제도 잠금 안에서 — 취소/타임아웃이 먼저 처리됐으면 결제하지 않고,
+        # 결제 도중에는 취소가 끼어들지 않음
+        async with mgr._terminal_lock:
+            if mgr._terminal_reached:
+                return
+            if self.terminal:
+                mgr._terminal_reached = True
+
+            detail = format_reservation_detail(reservation, session.rail_type)
+            embed = success_embed(
+                session.rail_type,
+                session.reservation_number,
+                detail,
+                leg_label=self.label,
+            )
+            await mgr.channel.send(embed=embed)
+            await mgr._share_success_message(embed, session, leg_label=self.label)
+
+            # 자동 결제
+            final_status = None
+            if session.auto_pay:
+                card_info = mgr._card_info
+                if card_info and not getattr(reservation, "is_waiting", False):
+                    try:
+                        paid = await mgr.engine.pay_with_card(session, reservation, card_info)
+                        if paid:
+                            await mgr.channel.send(f"{self._prefix}카드 결제가 완료되었습니다!")
+                            session.status = SessionStatus.PAID
+                            final_status = "paid"
+                    except Exception as ex:
+                        await mgr.channel.send(f"{self._prefix}결제 실패: {ex}")
+
+            if final_status and not self.terminal:
+                await mgr.bot.session_repo.set_status(session.session_id, final_status)
+
+        if self.terminal:
+            await mgr._cleanup(delay=30, final_status=final_status)
+
+    async def on_error(self, msg: str) -> None:
+        mgr = self.mgr
+        async with mgr._terminal_lock:
+            if mgr._terminal_reached:
+                return
+            if self.terminal:
+                mgr._terminal_reached = True
+        await mgr.channel.send(embed=error_embed(f"{self._prefix}{msg}"))
+        if self.terminal:
+            await mgr._cleanup(delay=30, final_status="error")
+        else:
+            await mgr.bot.session_repo.set_status(self.session.session_id, "error")
+
+    async def on_waiting(self, reservation) -> None:
+        session = self.session
+        detail = format_reservation_detail(reservation, session.rail_type)
+        embed = waiting_embed(
+            session.rail_type,
+            session.reservation_number,
+            detail,
+            leg_label=self.label,
+        )
+        await self.mgr.channel.send(embed=embed)
+
+    async def on_rest(self, rest_minutes: int, cycle_info: str) -> None:
+        await self.mgr.channel.send(
+            embed=rest_embed(
+                self.session.rail_type, rest_minutes, cycle_info, leg_label=self.label,
+            )
+        )
+
+    async def on_resume(self, cycle_number: int) -> None:
+        await self.mgr.channel.send(
+            embed=resume_embed(self.session.rail_type, cycle_number, leg_label=self.label)
+        )
+
+
 class ConversationManager:
     """전용 채널에서의 대화형 예약 흐름 관리.
 
@@ -77,6 +250,19 @@ class ConversationManager:
     "종료" 입력 시 취소.
     """
 
+    # 동시 대화 수만큼 인스턴스가 생기므로 __dict__ 없이 (bot.conversations가 약한 참조로 보관)
+    __slots__ = (
+        "__weakref__",
+        "bot", "session", "channel", "step", "engine", "_view_timeout",
+        "_polling_task", "_timeout_task", "_deadline",
+        "_prefetched_routes", "_trains_data", "_card_info", "_is_round_trip",
+        "_return_date", "_return_time", "_return_trains_cache", "_return_trains_data",
+        "_return_selected_train_indices",
+        "_return_session", "_return_polling_task", "_legs_task",
+        "_cleanup_done", "_timeout_disabled",
+        "_terminal_lock", "_terminal_reached", "_closed", "_active_view",
+    )
+
     def __init__(
         self,
         bot: SRTGoBot,
@@ -87,38 +273,60 @@ class ConversationManager:
         self.session = session
         self.channel = channel
         self.step = ConvStep.FAVORITE
+        # 무응답 타임아웃 (View 대기 + 대화 전체), 대화 시작 시점 설정값으로 고정
+        self._view_timeout: float = bot.config.conversation_timeout
         self.engine = BookingEngine(bot.executor)
         self._polling_task: asyncio.Task | None = None
         self._timeout_task: asyncio.Task | None = None
-        self._message_event = asyncio.Event()
-        self._latest_message: discord.Message | None = None
+        self._deadline: float = 0.0  # 무응답 타임아웃 시각 (loop.time 기준)
+
+        # start()에서 안내 메시지와 함께 미리 조회한 즐겨찾기
+        self._prefetched_routes: list[dict[str, Any]] | None = None
+
+        # 가는 편 검색 결과 (TrainSelect 옵션용)
+        self._trains_data: tuple[dict[str, str], ...] = ()
 
         # 왕복 예매 상태
         self._is_round_trip: bool = False
 
+        # 자동결제 단계에서 조회한 카드 정보 (결제 시 재사용)
+        self._card_info: dict[str, str] | None = None
+
         # 오는 편 사전 입력 데이터
         self._return_date: str = ""
         self._return_time: str = ""
         self._return_trains_cache: list[Any] = []
-        self._return_trains_data: list[dict[str, str]] = []
+        self._return_trains_data: tuple[dict[str, str], ...] = ()
         self._return_selected_train_indices: list[int] = []
 
         # 병렬 실행 상태
         self._return_session: BookingSession | None = None
         self._return_polling_task: asyncio.Task | None = None
-        self._legs_done: int = 0
-        self._legs_total: int = 1  # 편도=1, 왕복=2
+        self._legs_task: asyncio.Task | None = None  # 왕복 두 구간 종료 감시
         self._cleanup_done: bool = False
+        self._timeout_disabled: bool = False  # 폴링 시작 후에는 무응답 타임아웃 없음
+        # 종료 처리(성공/오류/취소/타임아웃)는 한 번만 — 결제 중 취소가 끼어들지 않도록 잠금
+        self._terminal_lock = asyncio.Lock()
+        self._terminal_reached: bool = False
+        self._closed = asyncio.Event()  # 대화 종료 신호 (대기 중인 View 단계 해제)
         self._active_view: discord.ui.View | None = None  # 현재 활성 View (취소 시 정리용)
 
+        # 채널 메시지 라우팅 등록 (약한 참조라 정리에 실패해도 인스턴스가 남지 않음)
+        bot.conversations[channel.id] = self
+
     async def start(self) -> None:
         """대화 시작."""
-        await self.channel.send(
-            f"**{self.session.rail_type}** 예매를 시작합니다.\n"
-            f"'종료'를 입력하면 언제든 취소할 수 있습니다.\n"
-            f"5분 동안 응답이 없으면 자동으로 취소됩니다."
+        # 안내 메시지 전송과 첫 단계의 즐겨찾기 조회를 동시에
+        _, self._prefetched_routes = await asyncio.gather(
+            self.channel.send(
+                f"**{self.session.rail_type}** 예매를 시작합니다.\n"
+                f"'종료'를 입력하면 언제든 취소할 수 있습니다.\n"
+                f"5분 동안 응답이 없으면 자동으로 취소됩니다."
+            ),
+            self.bot.fav_repo.get_all(self.session.user_db_id),
         )
-        self._reset_timeout()
+        self._deadline = asyncio.get_running_loop().time() + self._view_timeout
+        self._timeout_task = asyncio.create_task(self._timeout_loop())
         await self._run_step()
 
     async def handle_message(self, message: discord.Message) -> None:
@@ -130,78 +338,50 @@ class ConversationManager:
             await self._cancel("사용자가 취소하였습니다.")
             return
 
-        # View 기반이 아닌 텍스트 입력 (현재 단계에 따라 처리)
-        self._latest_message = message
-        self._message_event.set()
+        # 모든 단계가 View로 입력받으므로 그 밖의 메시지는 활동 신호로만 사용
         self._reset_timeout()
 
     async def _run_step(self) -> None:
-        """현재 단계 실행."""
+        """단계 루프. 각 단계는 다음 단계(self.step)만 정하고 반환한다.
+
+        같은 단계를 다시 묻는 경우에는 step을 그대로 두고 반환하면 된다.
+        대화가 종료되거나 폴링이 시작(RUNNING)되면 루프를 끝낸다.
+        """
         try:
-            if self.step == ConvStep.FAVORITE:
-                await self._step_favorite()
-            elif self.step == ConvStep.DEPARTURE:
-                await self._step_station("출발역을 선택하세요:", is_departure=True)
-            elif self.step == ConvStep.ARRIVAL:
-                await self._step_station("도착역을 선택하세요:", is_departure=False)
-            elif self.step == ConvStep.TRIP_TYPE:
-                await self._step_trip_type()
-            elif self.step == ConvStep.DATE:
-                await self._step_date()
-            elif self.step == ConvStep.TIME:
-                await self._step_time()
-            elif self.step == ConvStep.PASSENGERS:
-                await self._step_passengers()
-            elif self.step == ConvStep.SEARCH:
-                await self._step_search()
-            elif self.step == ConvStep.TRAIN_SELECT:
-                await self._step_train_select()
-            elif self.step == ConvStep.SEAT_TYPE:
-                await self._step_seat_type()
-            elif self.step == ConvStep.AUTO_PAY:
-                await self._step_auto_pay()
-            elif self.step == ConvStep.RETURN_DATE:
-                await self._step_return_date()
-            elif self.step == ConvStep.RETURN_TIME:
-                await self._step_return_time()
-            elif self.step == ConvStep.RETURN_SEARCH:
-                await self._step_return_search()
-            elif self.step == ConvStep.RETURN_TRAIN_SELECT:
-                await self._step_return_train_select()
-            elif self.step == ConvStep.CONFIRM:
-                await self._step_confirm()
-            elif self.step == ConvStep.RUNNING:
-                await self._step_running()
+            while not self._closed.is_set():
+                step = self.step
+                handler = _STEP_HANDLERS.get(step)
+                if handler is None:
+                    return
+                await handler(self)
+                if step is ConvStep.RUNNING:
+                    return
         except asyncio.CancelledError:
             pass
         except Exception:
             log.exception("대화 단계 오류")
             await self.channel.send(embed=error_embed("예기치 않은 오류가 발생했습니다."))
-            await self._cleanup()
+            await self._cleanup(final_status="error")
 
     # ──────────── 단계별 구현 ────────────
 
     async def _step_favorite(self) -> None:
         """즐겨찾기 노선 선택 단계."""
-        # 즐겨찾기 조회
-        user_row = await self.bot.user_repo.get_by_discord_id(self.session.discord_id)
-        if user_row is None:
-            self.step = ConvStep.DEPARTURE
-            await self._run_step()
-            return
-
-        routes = await self.bot.fav_repo.get_all(user_row["id"])
+        # 즐겨찾기 조회 (start()에서 미리 받아둔 결과가 있으면 사용)
+        routes = self._prefetched_routes
+        self._prefetched_routes = None
+        if routes is None:
+            routes = await self.bot.fav_repo.get_all(self.session.user_db_id)
         if not routes:
             # 즐겨찾기가 없으면 바로 DEPARTURE로
             self.step = ConvStep.DEPARTURE
-            await self._run_step()
             return
 
-        view = FavoriteRouteSelectView(routes, timeout=self.bot.config.conversation_timeout)
+        view = FavoriteRouteSelectView(routes, timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("노선을 선택하세요:", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_value is None:
             await self._timeout()
@@ -212,48 +392,64 @@ class ConversationManager:
             self.step = ConvStep.DEPARTURE
         else:
             # 즐겨찾기에서 선택 → 출발/도착 설정 후 TRIP_TYPE으로
-            route_id = int(view.selected_value)
-            for r in routes:
-                if r["id"] == route_id:
-                    self.session.departure = r["departure"]
-                    self.session.arrival = r["arrival"]
-                    break
-            self.step = ConvStep.TRIP_TYPE
+            route = {r["id"]: r for r in routes}.get(int(view.selected_value))
+            stations = STATION_SETS[self.session.rail_type]
+            if route is None:
+                await self.channel.send("선택한 노선을 찾을 수 없습니다. 역을 직접 선택해주세요.")
+                self.step = ConvStep.DEPARTURE
+            elif route["departure"] not in stations or route["arrival"] not in stations:
+                # 즐겨찾기는 SRT/KTX 전체 역 기준이라 현재 열차 종류에 없는 역일 수 있음
+                await self.channel.send(
+                    f"**{route['departure']} → {route['arrival']}** 노선은 "
+                    f"{self.session.rail_type}에서 지원하지 않습니다. 역을 직접 선택해주세요."
+                )
+                self.step = ConvStep.DEPARTURE
+            else:
+                self.session.departure = route["departure"]
+                self.session.arrival = route["arrival"]
+                self.step = ConvStep.TRIP_TYPE
 
-        await self._run_step()
+    async def _step_departure(self) -> None:
+        await self._step_station("출발역을 선택하세요:", is_departure=True)
+
+    async def _step_arrival(self) -> None:
+        await self._step_station("도착역을 선택하세요:", is_departure=False)
 
     async def _step_station(self, prompt: str, is_departure: bool) -> None:
-        stations = STATIONS[self.session.rail_type]
-        view = StationSelectView(stations, prompt, timeout=self.bot.config.conversation_timeout)
+        view = StationSelectView(
+            STATION_OPTIONS[self.session.rail_type], prompt,
+            timeout=self._view_timeout,
+        )
         self._active_view = view
         await self.channel.send(prompt, view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_value is None:
             await self._timeout()
             return
 
+        if view.selected_value not in STATION_SETS[self.session.rail_type]:
+            await self.channel.send("선택할 수 없는 역입니다. 다시 선택해주세요.")
+            return
+
         if is_departure:
             self.session.departure = view.selected_value
             self.step = ConvStep.ARRIVAL
         else:
             if view.selected_value == self.session.departure:
                 await self.channel.send("출발역과 도착역이 같습니다. 다시 선택해주세요.")
-                await self._run_step()
                 return
             self.session.arrival = view.selected_value
             self.step = ConvStep.TRIP_TYPE
 
-        await self._run_step()
-
     async def _step_trip_type(self) -> None:
         """편도/왕복 선택 단계."""
-        view = TripTypeView(timeout=self.bot.config.conversation_timeout)
+        view = TripTypeView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("편도/왕복을 선택하세요:", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_value is None:
             await self._timeout()
@@ -261,14 +457,13 @@ class ConversationManager:
 
         self._is_round_trip = view.selected_value == "roundtrip"
         self.step = ConvStep.DATE
-        await self._run_step()
 
     async def _step_date(self) -> None:
-        view = DateSelectView(timeout=self.bot.config.conversation_timeout)
+        view = DateSelectView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("날짜를 선택하세요:", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_value is None:
             await self._timeout()
@@ -276,14 +471,13 @@ class ConversationManager:
 
         self.session.date = view.selected_value
         self.step = ConvStep.TIME
-        await self._run_step()
 
     async def _step_time(self) -> None:
-        view = TimeSelectView(timeout=self.bot.config.conversation_timeout)
+        view = TimeSelectView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("출발 시간을 선택하세요 (복수 선택 가능):", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_values is None:
             await self._timeout()
@@ -292,14 +486,13 @@ class ConversationManager:
         # 복수 시간을 콤마 구분자로 저장
         self.session.time = ",".join(view.selected_values)
         self.step = ConvStep.PASSENGERS
-        await self._run_step()
 
     async def _step_passengers(self) -> None:
-        view = PassengerCountView(timeout=self.bot.config.conversation_timeout)
+        view = PassengerCountView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("승객 수를 선택하세요:", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if not view.confirmed:
             await self._timeout()
@@ -311,16 +504,15 @@ class ConversationManager:
             seniors=view.seniors,
         )
         self.step = ConvStep.SEARCH
-        await self._run_step()
 
     async def _step_search(self) -> None:
         msg = await self.channel.send("열차를 검색 중입니다...")
 
         try:
-            trains = await self.engine.search_trains(self.session)
+            trains = await self._search_cached(self.session)
         except Exception as ex:
             await msg.edit(content=f"검색 실패: {ex}")
-            await self._cleanup()
+            await self._cleanup(final_status="error")
             return
 
         if not trains:
@@ -329,16 +521,8 @@ class ConversationManager:
             return
 
         # 열차 목록 Embed
-        trains_data = [
-            format_train_for_select(t, i, self.session.rail_type)
-            for i, t in enumerate(trains)
-        ]
-        embed = train_list_embed(
-            trains_data,
-            self.session.rail_type,
-            self.session.departure,
-            self.session.arrival,
-            self.session.date,
+        trains_data, embed = await self._build_train_list(
+            trains, self.session.departure, self.session.arrival, self.session.date,
         )
         await msg.edit(content=None, embed=embed)
 
@@ -346,15 +530,44 @@ class ConversationManager:
         self.session.trains_cache = trains
         self._trains_data = trains_data
         self.step = ConvStep.TRAIN_SELECT
-        await self._run_step()
+
+    async def _search_cached(self, session: BookingSession) -> list:
+        """열차 검색 (같은 조건의 최근 결과가 있으면 재사용, 모든 대화가 공유)."""
+        key = (
+            session.rail_type, session.departure, session.arrival,
+            session.date, session.time, session.passengers,
+        )
+        cache = self.bot.search_cache
+        cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < SEARCH_RESULT_TTL:
+            return cached[1]
+
+        async with self.bot.search_semaphore:
+            trains = await self.engine.search_trains(session)
+
+        now = time.monotonic()
+        # 만료 항목 정리 (저장할 때만)
+        for stale in [k for k, (ts, _) in cache.items() if now - ts >= SEARCH_RESULT_TTL]:
+            del cache[stale]
+        cache[key] = (now, trains)
+        return trains
+
+    async def _build_train_list(
+        self, trains: list, departure: str, arrival: str, date: str
+    ) -> tuple[tuple[dict[str, str], ...], discord.Embed]:
+        """검색 결과 → (선택용 열차 데이터, 목록 Embed). 포맷팅은 스레드 풀에서."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.bot.executor,
+            _format_train_list,
+            trains, self.session.rail_type, departure, arrival, date,
+        )
 
     async def _step_train_select(self) -> None:
-        trains_data = getattr(self, "_trains_data", [])
-        view = TrainSelectView(trains_data, timeout=self.bot.config.conversation_timeout)
+        view = TrainSelectView(self._trains_data, timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("예매할 열차를 선택하세요 (복수 선택 가능):", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_values is None:
             await self._timeout()
@@ -362,14 +575,13 @@ class ConversationManager:
 
         self.session.selected_train_indices = view.selected_values
         self.step = ConvStep.SEAT_TYPE
-        await self._run_step()
 
     async def _step_seat_type(self) -> None:
-        view = SeatTypeView(timeout=self.bot.config.conversation_timeout)
+        view = SeatTypeView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("좌석 유형을 선택하세요:", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_value is None:
             await self._timeout()
@@ -377,17 +589,17 @@ class ConversationManager:
 
         self.session.seat_type = view.selected_value
         self.step = ConvStep.AUTO_PAY
-        await self._run_step()
 
     async def _step_auto_pay(self) -> None:
         # 카드 정보가 등록된 경우에만 자동결제 옵션 표시
         card_info = await self.bot.user_repo.get_card_info(self.session.discord_id)
+        self._card_info = card_info
         if card_info:
-            view = ConfirmView(timeout=self.bot.config.conversation_timeout)
+            view = ConfirmView(timeout=self._view_timeout)
             self._active_view = view
             await self.channel.send("예매 성공 시 자동으로 카드 결제하시겠습니까?", view=view)
-            await view.wait()
-            self._active_view = None
+            if not await self._wait_view(view):
+                return
 
             if view.result is None:
                 await self._timeout()
@@ -401,7 +613,6 @@ class ConversationManager:
             self.step = ConvStep.RETURN_DATE
         else:
             self.step = ConvStep.CONFIRM
-        await self._run_step()
 
     # ──────────── 오는 편 사전 입력 ────────────
 
@@ -411,11 +622,11 @@ class ConversationManager:
             f"\n**오는 편** 정보를 입력합니다. "
             f"(**{self.session.arrival}** → **{self.session.departure}**)"
         )
-        view = DateSelectView(timeout=self.bot.config.conversation_timeout)
+        view = DateSelectView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("오는 편 날짜를 선택하세요:", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_value is None:
             await self._timeout()
@@ -423,15 +634,14 @@ class ConversationManager:
 
         self._return_date = view.selected_value
         self.step = ConvStep.RETURN_TIME
-        await self._run_step()
 
     async def _step_return_time(self) -> None:
         """오는 편 시간 선택."""
-        view = TimeSelectView(timeout=self.bot.config.conversation_timeout)
+        view = TimeSelectView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("오는 편 출발 시간을 선택하세요 (복수 선택 가능):", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_values is None:
             await self._timeout()
@@ -439,32 +649,27 @@ class ConversationManager:
 
         self._return_time = ",".join(view.selected_values)
         self.step = ConvStep.RETURN_SEARCH
-        await self._run_step()
 
     async def _step_return_search(self) -> None:
         """오는 편 열차 검색 (출발/도착 교환)."""
         msg = await self.channel.send("오는 편 열차를 검색 중입니다...")
 
-        # 임시 세션으로 오는 편 검색 (출발/도착 교환)
-        temp_session = BookingSession(
-            session_id=self.session.session_id,
-            user_db_id=self.session.user_db_id,
-            discord_id=self.session.discord_id,
-            channel_id=self.session.channel_id,
-            rail_type=self.session.rail_type,
+        # 임시 세션으로 오는 편 검색 (출발/도착 교환, 가는 편 검색 결과는 가져오지 않음)
+        temp_session = replace(
+            self.session,
             departure=self.session.arrival,      # 교환
             arrival=self.session.departure,      # 교환
             date=self._return_date,
             time=self._return_time,
-            passengers=self.session.passengers,
-            rail_client=self.session.rail_client,
+            trains_cache=[],
+            trains_fingerprint=None,
         )
 
         try:
-            trains = await self.engine.search_trains(temp_session)
+            trains = await self._search_cached(temp_session)
         except Exception as ex:
             await msg.edit(content=f"오는 편 검색 실패: {ex}")
-            await self._cleanup()
+            await self._cleanup(final_status="error")
             return
 
         if not trains:
@@ -472,16 +677,10 @@ class ConversationManager:
                 content="오는 편 검색 결과가 없습니다. 다른 날짜/시간을 선택해주세요."
             )
             self.step = ConvStep.RETURN_DATE
-            await self._run_step()
             return
 
-        trains_data = [
-            format_train_for_select(t, i, self.session.rail_type)
-            for i, t in enumerate(trains)
-        ]
-        embed = train_list_embed(
-            trains_data,
-            self.session.rail_type,
+        trains_data, embed = await self._build_train_list(
+            trains,
             self.session.arrival,       # 오는 편 출발역
             self.session.departure,     # 오는 편 도착역
             self._return_date,
@@ -491,17 +690,16 @@ class ConversationManager:
         self._return_trains_cache = trains
         self._return_trains_data = trains_data
         self.step = ConvStep.RETURN_TRAIN_SELECT
-        await self._run_step()
 
     async def _step_return_train_select(self) -> None:
         """오는 편 열차 선택."""
         view = TrainSelectView(
-            self._return_trains_data, timeout=self.bot.config.conversation_timeout
+            self._return_trains_data, timeout=self._view_timeout
         )
         self._active_view = view
         await self.channel.send("오는 편 열차를 선택하세요 (복수 선택 가능):", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.selected_values is None:
             await self._timeout()
@@ -509,18 +707,14 @@ class ConversationManager:
 
         self._return_selected_train_indices = view.selected_values
         self.step = ConvStep.CONFIRM
-        await self._run_step()
 
     # ──────────── 확인 / 실행 ────────────
 
     async def _step_confirm(self) -> None:
         # 가는 편 열차 요약
-        trains_data = getattr(self, "_trains_data", [])
-        selected_data = [
-            trains_data[i] for i in self.session.selected_train_indices
-            if i < len(trains_data)
-        ]
-        selected_desc = format_trains_summary(selected_data)
+        selected_desc = _selected_trains_summary(
+            self._trains_data, self.session.selected_train_indices
+        )
 
         title_prefix = "가는 편 " if self._is_round_trip else ""
         embed = booking_summary_embed(
@@ -540,12 +734,9 @@ class ConversationManager:
 
         # 왕복일 때 오는 편 요약도 표시
         if self._is_round_trip:
-            return_selected_data = [
-                self._return_trains_data[i]
-                for i in self._return_selected_train_indices
-                if i < len(self._return_trains_data)
-            ]
-            return_selected_desc = format_trains_summary(return_selected_data)
+            return_selected_desc = _selected_trains_summary(
+                self._return_trains_data, self._return_selected_train_indices
+            )
 
             return_embed = booking_summary_embed(
                 rail_type=self.session.rail_type,
@@ -561,34 +752,37 @@ class ConversationManager:
             )
             await self.channel.send(embed=return_embed)
 
-        view = StartCancelView(timeout=self.bot.config.conversation_timeout)
+        view = StartCancelView(timeout=self._view_timeout)
         self._active_view = view
         await self.channel.send("위 내용으로 예매를 시작하시겠습니까?", view=view)
-        await view.wait()
-        self._active_view = None
+        if not await self._wait_view(view):
+            return
 
         if view.result is None or not view.result:
             await self._cancel("예매가 취소되었습니다.")
             return
 
-        # DB에 세션 정보 저장
-        await self.bot.session_repo.update_session(
+        # DB에 세션 정보 저장 + 검색 시작 상태로 전환 (한 번의 UPDATE)
+        self.session.status = SessionStatus.SEARCHING
+        await self.bot.session_repo.set_status(
             self.session.session_id,
+            "searching",
             departure=self.session.departure,
             arrival=self.session.arrival,
             date=self.session.date,
             time=self.session.time,
-            passengers_json=self.session.passengers.to_dict(),
+            passengers_json=self.session.passengers.to_json(),
             seat_type=self.session.seat_type,
             selected_trains_json=self.session.selected_train_indices,
             auto_pay=1 if self.session.auto_pay else 0,
         )
 
         self.step = ConvStep.RUNNING
-        await self._run_step()
 
     async def _step_running(self) -> None:
         """예매 폴링 루프 시작 (라우팅)."""
+        # 이후 메시지가 와도 타이머가 다시 걸리지 않도록 먼저 비활성화
+        self._timeout_disabled = True
         self._cancel_timeout()
 
         if self._is_round_trip:
@@ -598,16 +792,13 @@ class ConversationManager:
 
     async def _run_single_booking(self, leg_label: str = "") -> None:
         """편도 예매 폴링 루프."""
+        leg = _LegCallbacks(self, self.session, leg_label, terminal=True)
+
         # 종료 버튼 View 생성
         stop_view = StopBookingView(timeout=None)
         self._active_view = stop_view
-        status_msg = await self.channel.send(
-            embed=searching_embed(
-                self.session.rail_type, 0, "00:00:00", leg_label=leg_label,
-            ),
-            view=stop_view,
-        )
-        self.session.status_message = status_msg
+        status_msg = await self.channel.send(embed=leg.live_embed, view=stop_view)
+        self.session.status_message = leg.status_msg = status_msg
 
         # 종료 버튼 감지 태스크
         async def _watch_stop_button() -> None:
@@ -617,153 +808,79 @@ class ConversationManager:
 
         asyncio.create_task(_watch_stop_button())
 
-        async def on_progress(attempt: int, elapsed: str) -> None:
-            try:
-                await status_msg.edit(
-                    embed=searching_embed(
-                        self.session.rail_type, attempt, elapsed,
-                        leg_label=leg_label,
-                    )
-                )
-            except discord.HTTPException:
-                pass
-
-        async def on_success(reservation) -> None:
-            detail = format_reservation_detail(reservation, self.session.rail_type)
-            embed = success_embed(
-                self.session.rail_type,
-                self.session.reservation_number,
-                detail,
-                leg_label=leg_label,
-            )
-            await self.channel.send(embed=embed)
-            await self._share_success_message(
-                embed, self.session, leg_label=leg_label
-            )
-
-            # 자동 결제
-            if self.session.auto_pay:
-                card_info = await self.bot.user_repo.get_card_info(self.session.discord_id)
-                if card_info and not getattr(reservation, "is_waiting", False):
-                    try:
-                        paid = await self.engine.pay_with_card(
-                            self.session, reservation, card_info
-                        )
-                        if paid:
-                            label_prefix = f"**{leg_label}** " if leg_label else ""
-                            await self.channel.send(f"{label_prefix}카드 결제가 완료되었습니다!")
-                            self.session.status = SessionStatus.PAID
-                            await self.bot.session_repo.set_status(
-                                self.session.session_id, "paid"
-                            )
-                    except Exception as ex:
-                        await self.channel.send(f"결제 실패: {ex}")
-
-            await self._cleanup(delay=30)
-
-        async def on_error(msg: str) -> None:
-            await self.channel.send(embed=error_embed(msg))
-            await self.bot.session_repo.set_status(self.session.session_id, "error")
-            await self._cleanup(delay=30)
-
-        async def on_waiting(reservation) -> None:
-            detail = format_reservation_detail(reservation, self.session.rail_type)
-            embed = waiting_embed(
-                self.session.rail_type,
-                self.session.reservation_number,
-                detail,
-                leg_label=leg_label,
-            )
-            await self.channel.send(embed=embed)
-
-        async def on_rest(rest_minutes: int, cycle_info: str) -> None:
-            await self.channel.send(
-                embed=rest_embed(
-                    self.session.rail_type, rest_minutes, cycle_info,
-                    leg_label=leg_label,
-                )
-            )
-
-        async def on_resume(cycle_number: int) -> None:
-            await self.channel.send(
-                embed=resume_embed(
-                    self.session.rail_type, cycle_number,
-                    leg_label=leg_label,
-                )
-            )
-
-        self._polling_task = asyncio.create_task(
-            self.engine.polling_loop(
-                self.session, on_progress, on_success, on_error, self.bot,
-                on_waiting=on_waiting,
-                on_rest=on_rest,
-                on_resume=on_resume,
-            )
-        )
+        self._polling_task = asyncio.create_task(leg.polling())
 
     async def _create_return_session(self) -> BookingSession:
         """오는 편 BookingSession 생성 (별도 로그인)."""
         old = self.session
 
-        # 새 DB 세션 생성
-        new_session_id = await self.bot.session_repo.create_session(
-            user_id=old.user_db_id,
-            rail_type=old.rail_type,
-            channel_id=str(self.channel.id),
+        async def _login() -> Any:
+            # 별도 로그인 (thread safety: 각 세션 별도 클라이언트)
+            creds = await self.bot.user_repo.get_credentials(old.discord_id, old.rail_type)
+            if not creds:
+                raise ValueError("계정 정보를 찾을 수 없습니다")
+            return await self.engine.login(old.rail_type, creds[0], creds[1], bot=self.bot)
+
+        # DB 세션 생성(예약 조건 + 검색 시작 상태까지 한 번의 INSERT)과 로그인은 서로 독립이므로 동시에
+        new_session_id, login_result = await asyncio.gather(
+            self.bot.session_repo.create_session(
+                user_id=old.user_db_id,
+                rail_type=old.rail_type,
+                channel_id=str(self.channel.id),
+                status="searching",
+                departure=old.arrival,
+                arrival=old.departure,
+                date=self._return_date,
+                time=self._return_time,
+                passengers_json=old.passengers.to_json(),
+                seat_type=old.seat_type,
+                selected_trains_json=self._return_selected_train_indices,
+                auto_pay=1 if old.auto_pay else 0,
+            ),
+            _login(),
+            return_exceptions=True,
         )
+        if isinstance(new_session_id, BaseException):
+            raise new_session_id
 
         # 새 슬롯 할당
-        await self.bot.slot_manager.acquire(
-            new_session_id,
-            old.discord_id,
-            old.rail_type,
-            self.channel,
-        )
-
-        # 별도 로그인 (thread safety: 각 세션 별도 클라이언트)
-        creds = await self.bot.user_repo.get_credentials(old.discord_id, old.rail_type)
-        if not creds:
-            raise ValueError("계정 정보를 찾을 수 없습니다")
-        return_client = await self.engine.login(old.rail_type, creds[0], creds[1], bot=self.bot)
-
-        session = BookingSession(
+        acquired = await self.bot.slot_manager.acquire(
             session_id=new_session_id,
-            user_db_id=old.user_db_id,
             discord_id=old.discord_id,
-            channel_id=old.channel_id,
+            channel_id=str(self.channel.id),
             rail_type=old.rail_type,
+        )
+
+        if not acquired or isinstance(login_result, BaseException):
+            # 오는 편 세션 자원 롤백 (가는 편은 그대로 진행)
+            await asyncio.gather(
+                self.bot.slot_manager.release(new_session_id),
+                self.bot.session_repo.set_status(new_session_id, "error"),
+                return_exceptions=True,
+            )
+            if isinstance(login_result, BaseException):
+                raise login_result
+            raise ValueError("빈 슬롯이 없습니다")
+        return_client = login_result
+
+        # 승객/좌석/자동결제 설정은 가는 편 그대로 (가는 편 폴링 시작 전이라 런타임 상태도 초기값)
+        session = replace(
+            old,
+            session_id=new_session_id,
             departure=old.arrival,       # 교환
             arrival=old.departure,       # 교환
             date=self._return_date,
             time=self._return_time,
-            passengers=old.passengers,
-            seat_type=old.seat_type,
             selected_train_indices=self._return_selected_train_indices,
-            auto_pay=old.auto_pay,
             rail_client=return_client,
             trains_cache=self._return_trains_cache,
+            trains_fingerprint=None,
+            status=SessionStatus.SEARCHING,
         )
-
-        # DB에 오는 편 세션 정보 저장
-        await self.bot.session_repo.update_session(
-            session.session_id,
-            departure=session.departure,
-            arrival=session.arrival,
-            date=session.date,
-            time=session.time,
-            passengers_json=session.passengers.to_dict(),
-            seat_type=session.seat_type,
-            selected_trains_json=session.selected_train_indices,
-            auto_pay=1 if session.auto_pay else 0,
-        )
-
         return session
 
     async def _run_parallel_booking(self) -> None:
         """왕복 예매: 가는 편/오는 편 동시 시작."""
-        self._legs_total = 2
-        self._legs_done = 0
-
         # 오는 편 세션 생성 (별도 로그인)
         try:
             self._return_session = await self._create_return_session()
@@ -772,7 +889,6 @@ class ConversationManager:
             await self.channel.send(
                 embed=error_embed(f"오는 편 세션 생성 실패: {ex}\n가는 편만 진행합니다.")
             )
-            self._legs_total = 1
             await self._run_single_booking(leg_label="가는 편")
             return
 
@@ -782,118 +898,18 @@ class ConversationManager:
             f"오는 편: **{self._return_session.departure}** → **{self._return_session.arrival}**"
         )
 
-        # 콜백 팩토리
-        def _make_callbacks(session: BookingSession, label: str):
-            status_msg_holder: list[discord.Message] = []
-
-            async def on_progress(attempt: int, elapsed: str) -> None:
-                if not status_msg_holder:
-                    return
-                try:
-                    await status_msg_holder[0].edit(
-                        embed=searching_embed(
-                            session.rail_type, attempt, elapsed, leg_label=label,
-                        )
-                    )
-                except discord.HTTPException:
-                    pass
-
-            async def on_success(reservation) -> None:
-                detail = format_reservation_detail(reservation, session.rail_type)
-                embed = success_embed(
-                    session.rail_type,
-                    session.reservation_number,
-                    detail,
-                    leg_label=label,
-                )
-                await self.channel.send(embed=embed)
-                await self._share_success_message(embed, session, leg_label=label)
-
-                # 자동 결제
-                if session.auto_pay:
-                    card_info = await self.bot.user_repo.get_card_info(session.discord_id)
-                    if card_info and not getattr(reservation, "is_waiting", False):
-                        try:
-                            paid = await self.engine.pay_with_card(
-                                session, reservation, card_info
-                            )
-                            if paid:
-                                await self.channel.send(
-                                    f"**{label}** 카드 결제가 완료되었습니다!"
-                                )
-                                session.status = SessionStatus.PAID
-                                await self.bot.session_repo.set_status(
-                                    session.session_id, "paid"
-                                )
-                        except Exception as ex:
-                            await self.channel.send(f"**{label}** 결제 실패: {ex}")
-
-                self._legs_done += 1
-                if self._legs_done >= self._legs_total:
-                    await self._cleanup(delay=30)
-
-            async def on_error(msg: str) -> None:
-                await self.channel.send(embed=error_embed(f"**{label}** {msg}"))
-                await self.bot.session_repo.set_status(session.session_id, "error")
-                self._legs_done += 1
-                if self._legs_done >= self._legs_total:
-                    await self._cleanup(delay=30)
-
-            async def on_waiting(reservation) -> None:
-                detail = format_reservation_detail(reservation, session.rail_type)
-                embed = waiting_embed(
-                    session.rail_type,
-                    session.reservation_number,
-                    detail,
-                    leg_label=label,
-                )
-                await self.channel.send(embed=embed)
-
-            async def on_rest(rest_minutes: int, cycle_info: str) -> None:
-                await self.channel.send(
-                    embed=rest_embed(
-                        session.rail_type, rest_minutes, cycle_info,
-                        leg_label=label,
-                    )
-                )
-
-            async def on_resume(cycle_number: int) -> None:
-                await self.channel.send(
-                    embed=resume_embed(
-                        session.rail_type, cycle_number,
-                        leg_label=label,
-                    )
-                )
-
-            return status_msg_holder, on_progress, on_success, on_error, on_waiting, on_rest, on_resume
-
-        # 가는 편 콜백
-        out_holder, out_progress, out_success, out_error, out_waiting, out_rest, out_resume = _make_callbacks(
-            self.session, "가는 편"
-        )
-        # 오는 편 콜백
-        ret_holder, ret_progress, ret_success, ret_error, ret_waiting, ret_rest, ret_resume = _make_callbacks(
-            self._return_session, "오는 편"
-        )
+        outbound = _LegCallbacks(self, self.session, "가는 편", terminal=False)
+        inbound = _LegCallbacks(self, self._return_session, "오는 편", terminal=False)
 
         # 종료 버튼 View 생성
         stop_view = StopBookingView(timeout=None)
         self._active_view = stop_view
 
         # 상태 메시지 생성
-        out_msg = await self.channel.send(
-            embed=searching_embed(self.session.rail_type, 0, "00:00:00", leg_label="가는 편")
-        )
-        self.session.status_message = out_msg
-        out_holder.append(out_msg)
-
-        ret_msg = await self.channel.send(
-            embed=searching_embed(
-                self._return_session.rail_type, 0, "00:00:00", leg_label="오는 편"
+        for leg in (outbound, inbound):
+            leg.session.status_message = leg.status_msg = await self.channel.send(
+                embed=leg.live_embed
             )
-        )
-        self._return_session.status_message = ret_msg
-        ret_holder.append(ret_msg)
 
         # 종료 버튼 메시지
         await self.channel.send("예매를 종료하려면 아래 버튼을 누르세요:", view=stop_view)
@@ -907,22 +923,40 @@ class ConversationManager:
         asyncio.create_task(_watch_stop_button())
 
         # 두 폴링 태스크 동시 시작
-        self._polling_task = asyncio.create_task(
-            self.engine.polling_loop(
-                self.session, out_progress, out_success, out_error, self.bot,
-                on_waiting=out_waiting,
-                on_rest=out_rest,
-                on_resume=out_resume,
-            )
-        )
-        self._return_polling_task = asyncio.create_task(
-            self.engine.polling_loop(
-                self._return_session, ret_progress, ret_success, ret_error, self.bot,
-                on_waiting=ret_waiting,
-                on_rest=ret_rest,
-                on_resume=ret_resume,
-            )
-        )
+        self._polling_task = asyncio.create_task(outbound.polling())
+        self._return_polling_task = asyncio.create_task(inbound.polling())
+        self._legs_task = asyncio.create_task(self._watch_legs({
+            self._polling_task: self.session,
+            self._return_polling_task: self._return_session,
+        }))
+
+    async def _watch_legs(self, legs: dict[asyncio.Task, BookingSession]) -> None:
+        """왕복 두 구간 폴링이 모두 끝나면 정리.
+
+        한 구간이 예기치 않은 예외로 끝나면 다른 구간도 중단한다 (TaskGroup과 같은 동작).
+        """
+        done, pending = await asyncio.wait(legs, return_when=asyncio.FIRST_EXCEPTION)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+        crashed = []
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                session = legs[task]
+                log.error(
+                    "폴링 태스크 비정상 종료: 세션 %s", session.session_id,
+                    exc_info=task.exception(),
+                )
+                session.status = SessionStatus.ERROR
+                crashed.append(session)
+
+        async with self._terminal_lock:
+            if self._terminal_reached:
+                return
+            self._terminal_reached = True
+        await self._cleanup(delay=30, final_status="error", final_legs=crashed)
 
     # ──────────── 유틸리티 ────────────
 
@@ -967,81 +1001,203 @@ class ConversationManager:
         except (discord.Forbidden, discord.HTTPException):
             log.exception("예매 성공 메시지 공유 실패: 채널 %s", target_channel_id)
 
+    async def _wait_view(self, view: discord.ui.View) -> bool:
+        """View 입력 대기. 그 사이 대화가 종료되면 False (호출한 단계는 바로 반환)."""
+        view_done = asyncio.ensure_future(view.wait())
+        closed = asyncio.ensure_future(self._closed.wait())
+        try:
+            await asyncio.wait({view_done, closed}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            view_done.cancel()
+            closed.cancel()
+            self._active_view = None
+        if self._closed.is_set():
+            if not view.is_finished():
+                view.stop()
+            return False
+        return True
+
     def _reset_timeout(self) -> None:
-        """타임아웃 타이머 리셋."""
-        self._cancel_timeout()
-        self._timeout_task = asyncio.create_task(self._timeout_countdown())
+        """타임아웃 마감 시각만 미룸 (대기 중인 태스크는 깨우지 않음)."""
+        if not self._timeout_disabled:
+            self._deadline = (
+                asyncio.get_running_loop().time() + self._view_timeout
+            )
 
     def _cancel_timeout(self) -> None:
-        if self._timeout_task and not self._timeout_task.done():
-            self._timeout_task.cancel()
-
-    async def _timeout_countdown(self) -> None:
-        await asyncio.sleep(self.bot.config.conversation_timeout)
-        await self._timeout()
+        # 타임아웃 태스크 안에서 정리 중이면 자기 자신은 취소하지 않음
+        task = self._timeout_task
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _timeout_loop(self) -> None:
+        """무응답 타임아웃 감시. 깨어났을 때 마감이 미뤄졌으면 남은 시간만큼 더 잔다."""
+        loop = asyncio.get_running_loop()
+        while (remaining := self._deadline - loop.time()) > 0:
+            await asyncio.sleep(remaining)
+        if not self._timeout_disabled:
+            await self._timeout()
 
     async def _timeout(self) -> None:
         """타임아웃 처리."""
+        async with self._terminal_lock:
+            if self._terminal_reached:
+                return
+            self._terminal_reached = True
+        self._closed.set()
         await self.channel.send("시간이 초과되어 예매가 취소됩니다.")
         self.session.status = SessionStatus.TIMEOUT
-        await self.bot.session_repo.set_status(self.session.session_id, "timeout")
-        await self._cleanup(delay=5)
+        await self._cleanup(delay=5, final_status="timeout")
+
+    async def cancel(self, message: str, *, keep_channel: bool = False) -> None:
+        """외부(관리자 명령 등)에서 예매를 취소. keep_channel이면 채널은 삭제하지 않는다."""
+        await self._cancel(message, keep_channel=keep_channel)
+
+    def abort(self) -> None:
+        """채널에 메시지를 남기지 않고 진행 중인 View/타이머/폴링만 중단.
+
+        채널이 이미 삭제되는 중일 때(관리자 채널 삭제 등) 사용한다.
+        """
+        self._cleanup_done = True
+        self._closed.set()
+        self._cancel_timeout()
+        if self._active_view and not self._active_view.is_finished():
+            self._active_view.stop()
+        for task in (self._polling_task, self._return_polling_task):
+            if task and not task.done():
+                task.cancel()
+
+    async def _cancel(self, message: str, *, keep_channel: bool = False) -> None:
+        """예매 취소.
+
+        왕복 중 한 구간이 결제 중이면 그 결제가 끝난 뒤에 취소한다.
+        """
+        async with self._terminal_lock:
+            if self._terminal_reached:
+                return
+            self._terminal_reached = True
+        self._closed.set()
 
-    async def _cancel(self, message: str) -> None:
-        """예매 취소."""
         # 활성 View 정리 (버튼/셀렉트 비활성화)
         if self._active_view and not self._active_view.is_finished():
             self._active_view.stop()
 
-        if self._polling_task and not self._polling_task.done():
-            self._polling_task.cancel()
-        if self._return_polling_task and not self._return_polling_task.done():
-            self._return_polling_task.cancel()
+        # 폴링이 완전히 멈춘 뒤에 남은 구간 상태를 판단
+        await self._cancel_polling()
 
         await self.channel.send(message)
-        self.session.status = SessionStatus.CANCELLED
-        await self.bot.session_repo.set_status(self.session.session_id, "cancelled")
+        # 이미 예약/결제까지 끝난 구간은 cancelled로 덮어쓰지 않음
+        open_legs = [
+            leg for leg in (self.session, self._return_session)
+            if leg and leg.status in (SessionStatus.SETUP, SessionStatus.SEARCHING)
+        ]
+        for leg in open_legs:
+            leg.status = SessionStatus.CANCELLED
 
-        if self._return_session:
-            self._return_session.status = SessionStatus.CANCELLED
-            await self.bot.session_repo.set_status(
-                self._return_session.session_id, "cancelled"
-            )
+        await self._cleanup(
+            delay=5, final_status="cancelled", final_legs=open_legs,
+            delete_channel=not keep_channel,
+        )
+
+    async def _cancel_polling(self) -> None:
+        """폴링 태스크를 취소하고 실제로 끝날 때까지(최대 1초) 기다린다.
 
-        await self._cleanup(delay=5)
+        현재 태스크가 폴링 태스크 자신인 경우 cancel하면
+        CancelledError가 발생하여 이후 await에서 정리가 중단되므로 제외.
+        """
+        current = asyncio.current_task()
+        tasks = {
+            task for task in (self._polling_task, self._return_polling_task)
+            if task and not task.done() and task is not current
+        }
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks, timeout=1.0)
+
+    async def _cleanup(
+        self,
+        delay: int = 10,
+        final_status: str | None = None,
+        final_legs: Sequence[BookingSession] | None = None,
+        delete_channel: bool = True,
+    ) -> None:
+        """리소스 정리 + 채널 삭제.
 
-    async def _cleanup(self, delay: int = 10) -> None:
-        """리소스 정리 + 채널 삭제."""
+        final_status가 주어지면 final_legs(기본: 가는 편 세션)의 최종 상태 기록을
+        슬롯 해제와 함께 한 번에 처리한다. delete_channel이 False면 채널은 남긴다.
+        """
         if self._cleanup_done:
             return
         self._cleanup_done = True
+        self._closed.set()
+        # 대화 중 캐시한 데이터 참조 해제 (저장소의 복호화된 자격 증명 포함)
+        self._card_info = None
+        self.bot.user_repo.forget(self.session.discord_id)
+        self._trains_data = ()
+        self._return_trains_data = ()
 
         self._cancel_timeout()
+        await self._cancel_polling()
 
-        # 현재 태스크가 폴링 태스크 자신인 경우 cancel하면
-        # CancelledError가 발생하여 이후 await에서 정리가 중단되므로 제외
-        current = asyncio.current_task()
-        if self._polling_task and not self._polling_task.done() and self._polling_task is not current:
-            self._polling_task.cancel()
-        if self._return_polling_task and not self._return_polling_task.done() and self._return_polling_task is not current:
-            self._return_polling_task.cancel()
+        # 대화 추적 해제
+        self.bot.conversations.pop(self.channel.id, None)
 
-        # 슬롯 해제
-        await self.bot.slot_manager.release(self.session.session_id)
+        # 최종 상태 기록 + 슬롯 해제 (가는 편/오는 편 동시)
+        pending = [self.bot.slot_manager.release(self.session.session_id)]
         if self._return_session:
-            await self.bot.slot_manager.release(self._return_session.session_id)
+            pending.append(self.bot.slot_manager.release(self._return_session.session_id))
+        if final_status:
+            legs = (self.session,) if final_legs is None else final_legs
+            pending.extend(
+                self.bot.session_repo.set_status(leg.session_id, final_status)
+                for leg in legs
+            )
+        await asyncio.gather(*pending)
 
-        # 대화 추적 해제
-        self.bot.conversations.pop(self.channel.id, None)
+        if not delete_channel:
+            return
 
-        # 채널 삭제
+        # 채널 삭제는 별도 태스크로 (호출한 콜백은 바로 반환)
+        # 채널만 넘기므로 대기 중에도 이 인스턴스를 붙잡지 않음. 종료 시 정리되도록 봇이 보관
+        task = asyncio.create_task(
+            _delete_channel_after(self.channel, delay), name=f"delete-{self.channel.id}"
+        )
+        self.bot.channel_deletes.add(task)
+        task.add_done_callback(self.bot.channel_deletes.discard)
+
+
+async def _delete_channel_after(channel: discord.TextChannel, delay: int) -> None:
+    """delay초 안내 후 예매 채널 삭제."""
+    try:
         if delay > 0:
-            await self.channel.send(f"이 채널은 {delay}초 후 삭제됩니다.")
+            await channel.send(f"이 채널은 {delay}초 후 삭제됩니다.")
             await asyncio.sleep(delay)
-
-        try:
-            await self.channel.delete(reason="예매 세션 종료")
-        except discord.Forbidden:
-            await self.channel.send("채널 삭제 권한이 없습니다. 관리자에게 문의하세요.")
-        except discord.HTTPException:
-            pass
+        await channel.delete(reason="예매 세션 종료")
+    except discord.Forbidden:
+        await channel.send("채널 삭제 권한이 없습니다. 관리자에게 문의하세요.")
+    except discord.HTTPException:
+        pass
+
+
+# 단계 → 처리 메서드
+_STEP_HANDLERS: dict[ConvStep, Callable[[ConversationManager], Awaitable[None]]] = {
+    ConvStep.FAVORITE: ConversationManager._step_favorite,
+    ConvStep.DEPARTURE: ConversationManager._step_departure,
+    ConvStep.ARRIVAL: ConversationManager._step_arrival,
+    ConvStep.TRIP_TYPE: ConversationManager._step_trip_type,
+    ConvStep.DATE: ConversationManager._step_date,
+    ConvStep.TIME: ConversationManager._step_time,
+    ConvStep.PASSENGERS: ConversationManager._step_passengers,
+    ConvStep.SEARCH: ConversationManager._step_search,
+    ConvStep.TRAIN_SELECT: ConversationManager._step_train_select,
+    ConvStep.SEAT_TYPE: ConversationManager._step_seat_type,
+    ConvStep.AUTO_PAY: ConversationManager._step_auto_pay,
+    ConvStep.RETURN_DATE: ConversationManager._step_return_date,
+    ConvStep.RETURN_TIME: ConversationManager._step_return_time,
+    ConvStep.RETURN_SEARCH: ConversationManager._step_return_search,
+    ConvStep.RETURN_TRAIN_SELECT: ConversationManager._step_return_train_select,
+    ConvStep.CONFIRM: ConversationManager._step_confirm,
+    ConvStep.RUNNING: ConversationManager._step_running,
+}
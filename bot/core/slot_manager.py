@@ -2,27 +2,34 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlotInfo:
-    """슬롯에 할당된 예약 정보."""
+    """슬롯에 할당된 예약 정보 (불변)."""
 
     session_id: int
     discord_id: str
     channel_id: str
     rail_type: str
+    member_id: int = field(init=False, repr=False)  # discord_id 정수 변환 캐시
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "member_id", int(self.discord_id))
 
 
 class SlotManager:
-    """최대 N개 동시 예약 세션 관리 (asyncio.Lock 기반)."""
+    """최대 N개 동시 예약 세션 관리.
+
+    모든 메서드가 await 없이 dict만 다루므로 단일 이벤트 루프에서는 그 자체로 원자적이다.
+    (acquire의 확인→할당 사이에도 await가 없어 락이 필요 없음)
+    """
 
     def __init__(self, max_slots: int = 4) -> None:
         self._max_slots = max_slots
-        self._lock = asyncio.Lock()
         self._slots: dict[int, SlotInfo] = {}  # session_id → SlotInfo
+        self._by_user: dict[str, set[int]] = {}  # discord_id → session_id 집합 (보조 인덱스)
 
     @property
     def active_count(self) -> int:
@@ -36,44 +43,56 @@ class SlotManager:
     def is_full(self) -> bool:
         return len(self._slots) >= self._max_slots
 
-    def get_slots(self) -> list[SlotInfo]:
-        return list(self._slots.values())
+    def snapshot(self) -> tuple[SlotInfo, ...]:
+        """현재 슬롯 목록. SlotInfo가 불변이라 복사 없이 그대로 공유한다 (DB 조회 불필요)."""
+        return tuple(self._slots.values())
 
     def get_user_slots(self, discord_id: str) -> list[SlotInfo]:
-        return [s for s in self._slots.values() if s.discord_id == discord_id]
+        return [self._slots[sid] for sid in self._by_user.get(discord_id, ())]
 
     async def acquire(self, session_id: int, discord_id: str, channel_id: str, rail_type: str) -> bool:
         """슬롯 할당 시도. 성공 시 True."""
-        async with self._lock:
-            if self.is_full:
-                return False
-            self._slots[session_id] = SlotInfo(
-                session_id=session_id,
-                discord_id=discord_id,
-                channel_id=channel_id,
-                rail_type=rail_type,
-            )
-            return True
+        if self.is_full:
+            return False
+        self._remove(session_id)  # 같은 세션 재할당 시 이전 인덱스 정리
+        self._slots[session_id] = SlotInfo(
+            session_id=session_id,
+            discord_id=discord_id,
+            channel_id=channel_id,
+            rail_type=rail_type,
+        )
+        self._by_user.setdefault(discord_id, set()).add(session_id)
+        return True
+
+    def _remove(self, session_id: int) -> bool:
+        """슬롯과 사용자 인덱스에서 함께 제거."""
+        info = self._slots.pop(session_id, None)
+        if info is None:
+            return False
+        sids = self._by_user.get(info.discord_id)
+        if sids is not None:
+            sids.discard(session_id)
+            if not sids:
+                del self._by_user[info.discord_id]
+        return True
 
     async def release(self, session_id: int) -> bool:
         """슬롯 해제. 존재했으면 True."""
-        async with self._lock:
-            return self._slots.pop(session_id, None) is not None
+        return self._remove(session_id)
 
     async def force_release_all(self) -> int:
         """모든 슬롯 강제 해제. 해제된 수 반환."""
-        async with self._lock:
-            count = len(self._slots)
-            self._slots.clear()
-            return count
+        count = len(self._slots)
+        self._slots.clear()
+        self._by_user.clear()
+        return count
 
     async def force_release_by_channel(self, channel_id: str) -> bool:
         """채널 ID로 슬롯 강제 해제."""
-        async with self._lock:
-            to_remove = [
-                sid for sid, info in self._slots.items()
-                if info.channel_id == channel_id
-            ]
-            for sid in to_remove:
-                del self._slots[sid]
-            return len(to_remove) > 0
+        to_remove = [
+            sid for sid, info in self._slots.items()
+            if info.channel_id == channel_id
+        ]
+        for sid in to_remove:
+            self._remove(sid)
+        return len(to_remove) > 0
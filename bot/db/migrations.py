@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import aiosqlite
+from .models import ALL_INDEXES, ALL_TABLES
+from .pool import ConnectionPool
 
-from .models import ALL_TABLES
+# 모든 DDL을 한 트랜잭션(커밋 1회)으로 실행하는 스크립트
+_SCHEMA_SCRIPT = "BEGIN;\n{};\nCOMMIT;".format(
+    ";\n".join(ddl.strip().rstrip(";") for ddl in ALL_TABLES + ALL_INDEXES)
+)
 
 
-async def init_db(db_path: str) -> None:
-    """DB 초기화: 테이블이 없으면 생성."""
-    async with aiosqlite.connect(db_path) as db:
-        for ddl in ALL_TABLES:
-            await db.execute(ddl)
-        await db.commit()
+async def init_db(pool: ConnectionPool) -> None:
+    """DB 초기화: 테이블/인덱스가 없으면 생성 (WAL 등 PRAGMA는 풀 연결 생성 시 적용)."""
+    async with pool.connection() as db:
+        await db.executescript(_SCHEMA_SCRIPT)
@@ -69,3 +69,15 @@ CREATE TABLE IF NOT EXISTS favorite_routes (
 """
 
 ALL_TABLES = [USERS_TABLE, BOOKING_SESSIONS_TABLE, FAVORITE_ROUTES_TABLE]
+
+# 조회 경로용 인덱스. 활성 세션 조회는 항상 같은 status 조건이라 부분 인덱스로 충분
+# favorite_routes(user_id) 단독 인덱스는 UNIQUE(user_id, ...)가 이미 대신함
+ALL_INDEXES = [
+    """CREATE INDEX IF NOT EXISTS idx_sessions_active_channel
+       ON booking_sessions(discord_channel_id)
+       WHERE status IN ('setup', 'searching', 'reserved')""",
+    """CREATE INDEX IF NOT EXISTS idx_sessions_user_status
+       ON booking_sessions(user_id, status)""",
+    """CREATE INDEX IF NOT EXISTS idx_favorites_user_created
+       ON favorite_routes(user_id, created_at)""",
+]
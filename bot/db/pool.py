@@ -0,0 +1,92 @@
+"""aiosqlite 연결 풀."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiosqlite
+
+log = logging.getLogger(__name__)
+
+# 연결 생성 시 한 번만 적용하는 PRAGMA (journal_mode=WAL은 파일에 유지되고 나머지는 연결 단위)
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-20000;
+PRAGMA busy_timeout=30000;
+"""
+
+
+class ConnectionPool:
+    """저장소들이 공유하는 aiosqlite 연결 풀.
+
+    쿼리마다 connect/close하지 않고 열어 둔 연결을 돌려 쓴다.
+    연결은 필요할 때 size개까지 만들고, 모두 사용 중이면 반납될 때까지 기다린다.
+    모든 연결의 row_factory는 aiosqlite.Row (인덱스/컬럼명 접근 모두 가능).
+    DB 쓰기는 모두 이 풀을 거칠 것 (PRAGMA가 적용되지 않은 별도 연결 금지).
+    """
+
+    def __init__(self, db_path: str, size: int = 4) -> None:
+        self._db_path = db_path
+        self._size = size
+        self._created = 0
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._all: list[aiosqlite.Connection] = []
+        self._closed = False
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self._db_path)
+        try:
+            await conn.executescript(_PRAGMAS)
+        except BaseException:
+            await conn.close()
+            raise
+        conn.row_factory = aiosqlite.Row
+        return conn
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        if self._closed:
+            raise RuntimeError("연결 풀이 닫혔습니다")
+        if not self._idle.empty():
+            return self._idle.get_nowait()
+        if self._created < self._size:
+            # 연결 생성 중 다른 요청이 같은 자리를 쓰지 않도록 먼저 예약
+            self._created += 1
+            try:
+                conn = await self._connect()
+            except BaseException:
+                self._created -= 1
+                raise
+            self._all.append(conn)
+            return conn
+        return await self._idle.get()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """연결 하나를 빌려 쓴다. 블록에서 예외가 나면 커밋하지 않은 변경은 롤백."""
+        conn = await self._acquire()
+        try:
+            yield conn
+        except BaseException:
+            try:
+                await conn.rollback()
+            except Exception:
+                log.exception("DB 롤백 실패")
+            raise
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """모든 연결 닫기 (봇 종료 시)."""
+        self._closed = True
+        conns, self._all = self._all, []
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception:
+                log.exception("DB 연결 종료 실패")
@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from datetime import datetime
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
 from typing import Any
 
-import aiosqlite
-
 from ..security.encryption import FieldEncryptor
+from .pool import ConnectionPool
+
+# 슬래시 커맨드에서 DB 호출을 기다리는 최대 시간 (초)
+DB_TIMEOUT = 10
+
+# 복호화 결과 / 즐겨찾기 목록 캐시 유효 시간 (초). 이 프로세스의 쓰기는 즉시 무효화됨
+CACHE_TTL = 60.0
+
+# 복호화 캐시 최대 사용자 수 (평문 자격 증명을 오래·많이 들고 있지 않도록 작게)
+PLAIN_CACHE_SIZE = 32
+
+# 세션 상태 → 함께 CURRENT_TIMESTAMP로 기록할 시각 컬럼
+_STATUS_STAMP = {
+    "searching": "started_at",
+    "reserved": "completed_at",
+    "paid": "completed_at",
+    "cancelled": "completed_at",
+    "timeout": "completed_at",
+    "error": "completed_at",
+}
 
 
 class UserRepository:
@@ -25,30 +46,76 @@ class UserRepository:
         "card_birthday": ("card_birthday_enc", "card_birthday_nonce"),
         "card_expire": ("card_expire_enc", "card_expire_nonce"),
     }
-
-    def __init__(self, db_path: str, encryptor: FieldEncryptor) -> None:
-        self._db_path = db_path
+    # 복호화에 필요한 enc/nonce 컬럼만 읽는 조회문 (SELECT * 대신)
+    _SQL_ENCRYPTED_ROW = "SELECT {} FROM users WHERE discord_id = ?".format(
+        ", ".join(col for pair in ENCRYPTED_FIELDS.values() for col in pair)
+    )
+
+    def __init__(
+        self, pool: ConnectionPool, encryptor: FieldEncryptor, executor: Executor | None = None
+    ) -> None:
+        self._pool = pool
         self._enc = encryptor
-
-    async def get_by_discord_id(self, discord_id: str) -> dict[str, Any] | None:
-        """Discord ID로 사용자 조회."""
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT * FROM users WHERE discord_id = ?", (discord_id,)
-            )
-            row = await cursor.fetchone()
+        self._executor = executor  # 암호화 작업용 (None이면 기본 executor)
+        # discord_id → (복호화 시각, 필드명 → 평문). 자격 증명/카드 조회용 LRU
+        self._plain_cache: OrderedDict[str, tuple[float, dict[str, str]]] = OrderedDict()
+
+    async def get_user_id(self, discord_id: str) -> int | None:
+        """Discord ID로 사용자 PK만 조회."""
+        async with self._pool.connection() as db:
+            async with db.execute(
+                "SELECT id FROM users WHERE discord_id = ?", (discord_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            return row[0] if row else None
+
+    async def get_profile_flags(self, discord_id: str) -> tuple[bool, bool, bool] | None:
+        """(SRT 등록, KTX 등록, 카드 등록) 여부만 조회. 사용자가 없으면 None."""
+        async with self._pool.connection() as db:
+            async with db.execute(
+                """SELECT COALESCE(length(srt_id_enc), 0) > 0,
+                          COALESCE(length(ktx_id_enc), 0) > 0,
+                          COALESCE(length(card_number_enc), 0) > 0
+                   FROM users WHERE discord_id = ?""",
+                (discord_id,),
+            ) as cursor:
+                row = await cursor.fetchone()
             if row is None:
                 return None
-            return dict(row)
+            return bool(row[0]), bool(row[1]), bool(row[2])
 
     async def upsert_user(
         self, discord_id: str, discord_name: str, **fields: str
     ) -> int:
-        """사용자 생성 또는 업데이트. 암호화 필드는 평문으로 전달하면 자동 암호화."""
-        existing = await self.get_by_discord_id(discord_id)
+        """사용자 생성 또는 업데이트. 암호화 필드는 평문으로 전달하면 자동 암호화.
+
+        INSERT ... ON CONFLICT 한 문장으로 처리하므로 조회와 쓰기 사이에 경합이 없다.
+        """
+        # 암호화 필드 처리 (이벤트 루프를 막지 않도록 한 번의 executor 호출로 일괄 처리)
+        loop = asyncio.get_running_loop()
+        enc_columns = await loop.run_in_executor(
+            self._executor, self._encrypt_columns, fields
+        )
+
+        cols = ["discord_id", "discord_name"] + list(enc_columns.keys())
+        col_str = ", ".join(cols)
+        placeholders = ", ".join(["?"] * len(cols))
+        set_clause = ", ".join(f"{k} = excluded.{k}" for k in cols[1:])
+        values = [discord_id, discord_name] + list(enc_columns.values())
+        async with self._pool.connection() as db:
+            async with db.execute(
+                f"""INSERT INTO users ({col_str}) VALUES ({placeholders})
+                    ON CONFLICT(discord_id) DO UPDATE SET {set_clause}, updated_at = CURRENT_TIMESTAMP
+                    RETURNING id""",
+                values,
+            ) as cursor:
+                row = await cursor.fetchone()
+            await db.commit()
+        self._invalidate(discord_id)
+        return row[0]
 
-        # 암호화 필드 처리
+    def _encrypt_columns(self, fields: dict[str, str]) -> dict[str, Any]:
+        """필드명 → 평문을 DB 컬럼 → 값으로 변환 (암호화 필드는 enc/nonce 컬럼으로)."""
         enc_columns: dict[str, Any] = {}
         for field_name, plaintext in fields.items():
             if field_name in self.ENCRYPTED_FIELDS:
@@ -58,37 +125,33 @@ class UserRepository:
                 enc_columns[nonce_col] = nonce
             else:
                 enc_columns[field_name] = plaintext
-
-        async with aiosqlite.connect(self._db_path) as db:
-            if existing is None:
-                cols = ["discord_id", "discord_name"] + list(enc_columns.keys())
-                placeholders = ", ".join(["?"] * len(cols))
-                col_str = ", ".join(cols)
-                values = [discord_id, discord_name] + list(enc_columns.values())
-                cursor = await db.execute(
-                    f"INSERT INTO users ({col_str}) VALUES ({placeholders})", values
-                )
-                await db.commit()
-                return cursor.lastrowid  # type: ignore[return-value]
-            else:
-                enc_columns["discord_name"] = discord_name
-                enc_columns["updated_at"] = datetime.now().isoformat()
-                set_clause = ", ".join(f"{k} = ?" for k in enc_columns)
-                values = list(enc_columns.values()) + [discord_id]
-                await db.execute(
-                    f"UPDATE users SET {set_clause} WHERE discord_id = ?", values
-                )
-                await db.commit()
-                return existing["id"]
+        return enc_columns
 
     async def delete_user(self, discord_id: str) -> bool:
         """사용자 삭제."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._pool.connection() as db:
             cursor = await db.execute(
                 "DELETE FROM users WHERE discord_id = ?", (discord_id,)
             )
             await db.commit()
-            return cursor.rowcount > 0
+        self._invalidate(discord_id)
+        return cursor.rowcount > 0
+
+    def _invalidate(self, discord_id: str) -> None:
+        """복호화 캐시 무효화."""
+        self._plain_cache.pop(discord_id, None)
+
+    def forget(self, discord_id: str) -> None:
+        """사용자의 복호화된 평문을 캐시에서 제거 (대화 종료 시)."""
+        self._plain_cache.pop(discord_id, None)
+
+    def _prune_plain_cache(self, now: float) -> None:
+        """만료된 평문 제거 후 크기 상한까지 오래 안 쓴 항목부터 제거."""
+        expired = [k for k, (ts, _) in self._plain_cache.items() if now - ts >= CACHE_TTL]
+        for key in expired:
+            del self._plain_cache[key]
+        while len(self._plain_cache) > PLAIN_CACHE_SIZE:
+            self._plain_cache.popitem(last=False)
 
     def decrypt_field(self, row: dict[str, Any], field_name: str) -> str:
         """DB row에서 암호화된 필드를 복호화."""
@@ -101,61 +164,115 @@ class UserRepository:
             return ""
         return self._enc.decrypt(enc_blob, nonce)
 
+    async def _decrypted(self, discord_id: str) -> dict[str, str] | None:
+        """암호화 필드 전체를 한 번에 복호화해 CACHE_TTL 동안 캐시. 사용자가 없으면 None."""
+        now = time.monotonic()
+        self._prune_plain_cache(now)
+        cached = self._plain_cache.get(discord_id)
+        if cached is not None:
+            self._plain_cache.move_to_end(discord_id)
+            return cached[1]
+
+        async with self._pool.connection() as db:
+            async with db.execute(self._SQL_ENCRYPTED_ROW, (discord_id,)) as cursor:
+                row = await cursor.fetchone()
+        if row is None:
+            return None
+        enc_row = dict(row)
+        plain = {name: self.decrypt_field(enc_row, name) for name in self.ENCRYPTED_FIELDS}
+        self._plain_cache[discord_id] = (now, plain)
+        self._prune_plain_cache(now)
+        return plain
+
     async def get_credentials(
         self, discord_id: str, rail_type: str
     ) -> tuple[str, str] | None:
         """열차 종류에 따른 로그인 자격 증명 반환."""
-        row = await self.get_by_discord_id(discord_id)
-        if row is None:
+        plain = await self._decrypted(discord_id)
+        if plain is None:
             return None
         prefix = "srt" if rail_type == "SRT" else "ktx"
-        user_id = self.decrypt_field(row, f"{prefix}_id")
-        user_pw = self.decrypt_field(row, f"{prefix}_pw")
+        user_id = plain[f"{prefix}_id"]
+        user_pw = plain[f"{prefix}_pw"]
         if not user_id or not user_pw:
             return None
         return user_id, user_pw
 
     async def get_card_info(self, discord_id: str) -> dict[str, str] | None:
         """카드 정보 반환."""
-        row = await self.get_by_discord_id(discord_id)
-        if row is None:
-            return None
-        number = self.decrypt_field(row, "card_number")
-        if not number:
+        plain = await self._decrypted(discord_id)
+        if plain is None or not plain["card_number"]:
             return None
         return {
-            "number": number,
-            "password": self.decrypt_field(row, "card_password"),
-            "birthday": self.decrypt_field(row, "card_birthday"),
-            "expire": self.decrypt_field(row, "card_expire"),
+            "number": plain["card_number"],
+            "password": plain["card_password"],
+            "birthday": plain["card_birthday"],
+            "expire": plain["card_expire"],
         }
 
 
 class SessionRepository:
     """booking_sessions 테이블 CRUD."""
 
-    def __init__(self, db_path: str) -> None:
-        self._db_path = db_path
-
-    async def create_session(self, user_id: int, rail_type: str, channel_id: str) -> int:
-        """새 예약 세션 생성."""
-        async with aiosqlite.connect(self._db_path) as db:
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+        # (정렬된 컬럼 목록, 시각 컬럼) → UPDATE 문. 같은 문자열을 재사용해 연결의 statement 캐시에 걸리게 함
+        self._update_stmts: dict[tuple[tuple[str, ...], str | None], str] = {}
+
+    def _update_sql(self, keys: tuple[str, ...], stamp: str | None = None) -> str:
+        """keys 컬럼은 바인딩, stamp 컬럼은 SQLite의 CURRENT_TIMESTAMP로 설정하는 UPDATE 문."""
+        sql = self._update_stmts.get((keys, stamp))
+        if sql is None:
+            assignments = [f"{k} = ?" for k in keys]
+            if stamp is not None:
+                assignments.append(f"{stamp} = CURRENT_TIMESTAMP")
+            sql = f"UPDATE booking_sessions SET {', '.join(assignments)} WHERE id = ?"
+            self._update_stmts[(keys, stamp)] = sql
+        return sql
+
+    async def create_session(
+        self, user_id: int, rail_type: str, channel_id: str,
+        status: str = "setup", **fields: Any,
+    ) -> int:
+        """새 예약 세션 생성. 예약 조건(fields)을 알고 있으면 같은 INSERT로 함께 저장."""
+        row: dict[str, Any] = {
+            "user_id": user_id,
+            "rail_type": rail_type,
+            "discord_channel_id": channel_id,
+            "status": status,
+            **self._serialize(fields),
+        }
+        cols = list(row)
+        placeholders = ["?"] * len(cols)
+        stamp = _STATUS_STAMP.get(status)
+        if stamp is not None:
+            cols.append(stamp)
+            placeholders.append("CURRENT_TIMESTAMP")
+
+        col_str = ", ".join(cols)
+        async with self._pool.connection() as db:
             cursor = await db.execute(
-                """INSERT INTO booking_sessions (user_id, rail_type, discord_channel_id, status)
-                   VALUES (?, ?, ?, 'setup')""",
-                (user_id, rail_type, channel_id),
+                f"INSERT INTO booking_sessions ({col_str}) VALUES ({', '.join(placeholders)})",
+                list(row.values()),
             )
             await db.commit()
             return cursor.lastrowid  # type: ignore[return-value]
 
+    @staticmethod
+    def _serialize(fields: dict[str, Any]) -> dict[str, Any]:
+        """JSON 컬럼 값을 문자열로 직렬화 (이미 문자열이면 그대로)."""
+        for key in ("passengers_json", "selected_trains_json"):
+            if key in fields and not isinstance(fields[key], str):
+                fields[key] = json.dumps(fields[key], ensure_ascii=False)
+        return fields
+
     async def get_session(self, session_id: int) -> dict[str, Any] | None:
         """세션 ID로 조회."""
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
+        async with self._pool.connection() as db:
+            async with db.execute(
                 "SELECT * FROM booking_sessions WHERE id = ?", (session_id,)
-            )
-            row = await cursor.fetchone()
+            ) as cursor:
+                row = await cursor.fetchone()
             return dict(row) if row else None
 
     async def get_active_sessions(self, user_id: int | None = None) -> list[dict[str, Any]]:
@@ -166,64 +283,55 @@ class SessionRepository:
         if user_id is not None:
             query += " AND user_id = ?"
             params.append(user_id)
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
-            rows = await cursor.fetchall()
+        async with self._pool.connection() as db:
+            async with db.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
     async def update_session(self, session_id: int, **fields: Any) -> None:
         """세션 필드 업데이트."""
-        if not fields:
-            return
-        # JSON 직렬화가 필요한 필드
-        for key in ("passengers_json", "selected_trains_json"):
-            if key in fields and not isinstance(fields[key], str):
-                fields[key] = json.dumps(fields[key], ensure_ascii=False)
-
-        set_clause = ", ".join(f"{k} = ?" for k in fields)
-        values = list(fields.values()) + [session_id]
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                f"UPDATE booking_sessions SET {set_clause} WHERE id = ?", values
-            )
+        if fields:
+            await self._update(session_id, fields)
+
+    async def set_status(self, session_id: int, status: str, **fields: Any) -> None:
+        """세션 상태 변경. fields가 있으면 같은 UPDATE로 함께 저장.
+
+        시작/완료 시각은 SQLite의 CURRENT_TIMESTAMP(UTC)로 기록.
+        """
+        await self._update(
+            session_id, {**fields, "status": status}, _STATUS_STAMP.get(status)
+        )
+
+    async def _update(
+        self, session_id: int, fields: dict[str, Any], stamp: str | None = None
+    ) -> None:
+        self._serialize(fields)
+        keys = tuple(sorted(fields))
+        values = [fields[k] for k in keys]
+        values.append(session_id)
+        async with self._pool.connection() as db:
+            await db.execute(self._update_sql(keys, stamp), values)
             await db.commit()
 
-    async def set_status(self, session_id: int, status: str) -> None:
-        """세션 상태 변경."""
-        update: dict[str, Any] = {"status": status}
-        if status == "searching":
-            update["started_at"] = datetime.now().isoformat()
-        elif status in ("reserved", "paid", "cancelled", "timeout", "error"):
-            update["completed_at"] = datetime.now().isoformat()
-        await self.update_session(session_id, **update)
-
-    async def increment_attempt(self, session_id: int) -> int:
-        """시도 횟수 증가 후 현재 값 반환."""
-        async with aiosqlite.connect(self._db_path) as db:
+    async def increment_attempt(self, session_id: int, count: int = 1) -> None:
+        """시도 횟수를 count만큼 증가."""
+        async with self._pool.connection() as db:
             await db.execute(
-                "UPDATE booking_sessions SET attempt_count = attempt_count + 1 WHERE id = ?",
-                (session_id,),
+                "UPDATE booking_sessions SET attempt_count = attempt_count + ? WHERE id = ?",
+                (count, session_id),
             )
             await db.commit()
-            cursor = await db.execute(
-                "SELECT attempt_count FROM booking_sessions WHERE id = ?",
-                (session_id,),
-            )
-            row = await cursor.fetchone()
-            return row[0] if row else 0
 
     async def get_session_by_channel(self, channel_id: str) -> dict[str, Any] | None:
         """채널 ID로 활성 세션 조회."""
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
+        async with self._pool.connection() as db:
+            async with db.execute(
                 """SELECT * FROM booking_sessions
                    WHERE discord_channel_id = ? AND status IN ('setup', 'searching', 'reserved')
                    ORDER BY id DESC LIMIT 1""",
                 (channel_id,),
-            )
-            row = await cursor.fetchone()
+            ) as cursor:
+                row = await cursor.fetchone()
             return dict(row) if row else None
 
 
@@ -232,52 +340,64 @@ class FavoriteRouteRepository:
 
     MAX_FAVORITES = 6
 
-    def __init__(self, db_path: str) -> None:
-        self._db_path = db_path
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+        # user_id → (조회 시각, 노선 목록)
+        self._routes_cache: dict[int, tuple[float, list[dict[str, Any]]]] = {}
 
     async def add(self, user_id: int, departure: str, arrival: str) -> int:
         """즐겨찾기 추가. 6개 제한 초과 시 ValueError."""
         current = await self.count(user_id)
         if current >= self.MAX_FAVORITES:
             raise ValueError(f"최대 {self.MAX_FAVORITES}개까지 등록 가능합니다.")
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._pool.connection() as db:
             cursor = await db.execute(
                 """INSERT OR IGNORE INTO favorite_routes (user_id, departure, arrival)
                    VALUES (?, ?, ?)""",
                 (user_id, departure, arrival),
             )
             await db.commit()
+            self._routes_cache.pop(user_id, None)
             if cursor.lastrowid == 0 or cursor.rowcount == 0:
                 raise ValueError("이미 등록된 노선입니다.")
             return cursor.lastrowid  # type: ignore[return-value]
 
     async def get_all(self, user_id: int) -> list[dict[str, Any]]:
-        """사용자의 즐겨찾기 전체 조회."""
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
+        """사용자의 즐겨찾기 전체 조회 (CACHE_TTL 동안 캐시, 반환값은 수정하지 말 것)."""
+        cached = self._routes_cache.get(user_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CACHE_TTL:
+            return cached[1]
+
+        async with self._pool.connection() as db:
+            async with db.execute(
                 "SELECT * FROM favorite_routes WHERE user_id = ? ORDER BY created_at",
                 (user_id,),
-            )
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
-
-    async def remove(self, route_id: int, user_id: int) -> bool:
-        """즐겨찾기 삭제."""
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute(
-                "DELETE FROM favorite_routes WHERE id = ? AND user_id = ?",
+            ) as cursor:
+                rows = await cursor.fetchall()
+        routes = [dict(row) for row in rows]
+        self._routes_cache[user_id] = (now, routes)
+        return routes
+
+    async def remove_and_return(self, route_id: int, user_id: int) -> dict[str, Any] | None:
+        """즐겨찾기 삭제 후 삭제된 노선 반환 (DELETE ... RETURNING, SQLite 3.35+)."""
+        async with self._pool.connection() as db:
+            async with db.execute(
+                """DELETE FROM favorite_routes WHERE id = ? AND user_id = ?
+                   RETURNING id, departure, arrival""",
                 (route_id, user_id),
-            )
+            ) as cursor:
+                row = await cursor.fetchone()
             await db.commit()
-            return cursor.rowcount > 0
+        self._routes_cache.pop(user_id, None)
+        return dict(row) if row else None
 
     async def count(self, user_id: int) -> int:
         """즐겨찾기 개수 조회."""
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute(
+        async with self._pool.connection() as db:
+            async with db.execute(
                 "SELECT COUNT(*) FROM favorite_routes WHERE user_id = ?",
                 (user_id,),
-            )
-            row = await cursor.fetchone()
+            ) as cursor:
+                row = await cursor.fetchone()
             return row[0] if row else 0
@@ -7,17 +7,23 @@ import logging
 import sys
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
-from .config import Config
+from .config import Config, ConfigError
 from .core.slot_manager import SlotManager
 from .db.migrations import init_db
+from .db.pool import ConnectionPool
 from .db.repository import UserRepository, SessionRepository, FavoriteRouteRepository
 from .security.encryption import FieldEncryptor
-from .security.key_manager import load_master_key
+from .security.key_manager import load_master_key, wipe_key
+
+if TYPE_CHECKING:
+    from .core.conversation import ConversationManager
 
 log = logging.getLogger("srtgo.bot")
 
@@ -46,22 +52,44 @@ class SRTGoBot(commands.Bot):
 
         self.config = config
         self.slot_manager = SlotManager(max_slots=config.max_slots)
-        self.executor = ThreadPoolExecutor(max_workers=config.thread_pool_workers)
+        # 프로세스 전체가 공유하는 스레드 풀 (엔진/저장소/루프 기본 executor)
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.workers, thread_name_prefix="srtgo",
+        )
 
         # 보안 및 DB
         master_key = load_master_key(config.master_key)
         self.encryptor = FieldEncryptor(master_key)
-        self.user_repo = UserRepository(config.db_path, self.encryptor)
-        self.session_repo = SessionRepository(config.db_path)
-        self.fav_repo = FavoriteRouteRepository(config.db_path)
+        wipe_key(master_key)  # 원본 키 사본은 암호화 객체 생성 직후 제거
+        # 저장소들이 공유하는 DB 연결 풀 (슬롯마다 하나 + 커맨드용 여유분)
+        self.db_pool = ConnectionPool(config.db_path, size=config.max_slots + 2)
+        self.user_repo = UserRepository(self.db_pool, self.encryptor, self.executor)
+        self.session_repo = SessionRepository(self.db_pool)
+        self.fav_repo = FavoriteRouteRepository(self.db_pool)
 
         # 활성 대화 세션 추적: channel_id → ConversationManager
-        self.conversations: dict[int, object] = {}
+        # 약한 참조 — 정리가 실패한 대화도 다른 참조가 사라지면 함께 수거됨
+        self.conversations: WeakValueDictionary[int, ConversationManager] = (
+            WeakValueDictionary()
+        )
+        # 관리자 일괄 정리(전체 해제 등) 직렬화용
+        self.admin_lock = asyncio.Lock()
+        # 대화 단계 열차 검색 동시 실행 제한 (스레드 풀/게이트웨이 보호)
+        self.search_semaphore = asyncio.Semaphore(config.search_concurrency)
+        # 대화 단계 검색 결과: (rail_type, dep, arr, date, time, 승객) → (검색 시각, 열차 목록)
+        self.search_cache: dict[tuple, tuple[float, list]] = {}
+        # 종료된 대화의 채널 삭제 예약 태스크 (봇 종료 시 정리)
+        self.channel_deletes: set[asyncio.Task] = set()
+        # 프로필/카드 모달 제출 후 백그라운드 저장 태스크 (봇 종료 시 완료 대기)
+        self.modal_saves: set[asyncio.Task] = set()
 
     async def setup_hook(self) -> None:
         """봇 시작 시 DB 초기화 + Cog 로드."""
+        # run_in_executor(None, ...) / asyncio.to_thread도 같은 풀을 쓰도록
+        asyncio.get_running_loop().set_default_executor(self.executor)
+
         self.config.ensure_db_dir()
-        await init_db(self.config.db_path)
+        await init_db(self.db_pool)
         log.info("DB 초기화 완료: %s", self.config.db_path)
 
         for cog in INITIAL_COGS:
@@ -91,27 +119,45 @@ class SRTGoBot(commands.Bot):
         # 전용 예약 채널에서의 메시지인지 확인
         conv = self.conversations.get(message.channel.id)
         if conv is not None:
-            from .core.conversation import ConversationManager
-            if isinstance(conv, ConversationManager):
-                await conv.handle_message(message)
-                return
+            await conv.handle_message(message)
+            return
 
         # 일반 명령어 처리
         await self.process_commands(message)
 
     async def close(self) -> None:
-        self.executor.shutdown(wait=False)
+        # 진행 중인 모달 저장은 끝까지 (DB/응답 전송이 아직 열려 있을 때)
+        await asyncio.gather(*self.modal_saves, return_exceptions=True)
+        # 삭제 대기 중인 채널은 그대로 두고 태스크만 정리
+        for task in self.channel_deletes:
+            task.cancel()
+        await asyncio.gather(*self.channel_deletes, return_exceptions=True)
         await super().close()
+        await self.db_pool.close()
+        # 대기 중인 작업은 버리고 루프는 막지 않음 — 실행 중인 동기 호출(HTTP 요청)은
+        # 워커 스레드에서 마저 끝나고 인터프리터 종료 시 join된다.
+        # (기본 executor가 이 풀이라 run_in_executor로 wait=True를 넘기면 자기 자신을 기다리게 됨)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _install_uvloop() -> None:
+    """uvloop이 있으면 asyncio 이벤트 루프 정책으로 설치."""
+    try:
+        import uvloop
+    except ImportError:
+        log.info("uvloop 미설치, 기본 asyncio 루프 사용")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    log.info("uvloop 이벤트 루프 사용")
 
 
 def run_bot() -> None:
     """봇 실행."""
     load_dotenv()
-    config = Config.from_env()
-
-    errors = config.validate()
-    if errors:
-        for e in errors:
+    try:
+        config = Config.from_env()
+    except ConfigError as ex:
+        for e in ex.errors:
             log.error("설정 오류: %s", e)
         sys.exit(1)
 
@@ -120,6 +166,9 @@ def run_bot() -> None:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    if config.use_uvloop:
+        _install_uvloop()
+
     bot = SRTGoBot(config)
     bot.run(config.discord_token, log_handler=None)
 
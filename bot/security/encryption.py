@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import os
 
-from Crypto.Cipher import AES
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
 NONCE_SIZE = 12  # 96비트
-TAG_SIZE = 16    # 128비트
 
 
 class FieldEncryptor:
@@ -16,28 +15,25 @@ class FieldEncryptor:
 
     각 필드마다 랜덤 nonce를 생성하고,
     ciphertext + GCM tag를 하나의 BLOB으로 저장한다.
+    키 확장은 생성 시 한 번만 하고 AESGCM 객체를 재사용한다.
     """
 
-    def __init__(self, master_key: bytes) -> None:
+    def __init__(self, master_key: bytes | bytearray) -> None:
         if len(master_key) != 32:
             raise ValueError("마스터 키는 32바이트여야 합니다")
-        self._key = master_key
+        # AESGCM이 키를 자체 보관하므로 호출자는 master_key를 바로 지워도 된다
+        self._aead = AESGCM(bytes(master_key))
 
     def encrypt(self, plaintext: str) -> tuple[bytes, bytes]:
         """평문을 암호화하여 (ciphertext + tag, nonce) 반환."""
         if not plaintext:
             return b"", b""
         nonce = os.urandom(NONCE_SIZE)
-        cipher = AES.new(self._key, AES.MODE_GCM, nonce=nonce)
-        ciphertext, tag = cipher.encrypt_and_digest(plaintext.encode("utf-8"))
-        return ciphertext + tag, nonce
+        # AESGCM 출력은 ciphertext + tag (기존 BLOB 형식과 동일)
+        return self._aead.encrypt(nonce, plaintext.encode("utf-8"), None), nonce
 
     def decrypt(self, enc_blob: bytes, nonce: bytes) -> str:
         """(ciphertext + tag, nonce)에서 평문 복원."""
         if not enc_blob or not nonce:
             return ""
-        ciphertext = enc_blob[:-TAG_SIZE]
-        tag = enc_blob[-TAG_SIZE:]
-        cipher = AES.new(self._key, AES.MODE_GCM, nonce=nonce)
-        plaintext = cipher.decrypt_and_verify(ciphertext, tag)
-        return plaintext.decode("utf-8")
+        return self._aead.decrypt(nonce, enc_blob, None).decode("utf-8")
@@ -6,11 +6,20 @@ import os
 import secrets
 
 
-def load_master_key(hex_key: str) -> bytes:
-    """64자리 hex 문자열을 32바이트 키로 변환."""
+def load_master_key(hex_key: str) -> bytearray:
+    """64자리 hex 문자열을 32바이트 키로 변환.
+
+    사용 후 wipe_key()로 덮어쓸 수 있도록 bytearray로 반환한다.
+    (입력 hex 문자열은 CPython 특성상 메모리에서 지울 수 없음)
+    """
     if len(hex_key) != 64:
         raise ValueError("마스터 키는 64자리 hex 문자열이어야 합니다 (32바이트)")
-    return bytes.fromhex(hex_key)
+    return bytearray.fromhex(hex_key)
+
+
+def wipe_key(key: bytearray) -> None:
+    """키 버퍼를 0으로 덮어쓰기."""
+    key[:] = bytes(len(key))
 
 
 def generate_master_key() -> str:
@@ -16,6 +16,9 @@ COLOR_ERROR = 0xE74C3C
 COLOR_WARNING = 0xF1C40F
 COLOR_INFO = 0x3498DB
 
+# 진행 상태 문자열 (폴링 중 반복 호출되므로 미리 바인딩)
+_format_attempt = "**{0}**회".format
+
 
 def rail_color(rail_type: str) -> int:
     return COLOR_SRT if rail_type == "SRT" else COLOR_KTX
@@ -34,33 +37,36 @@ def profile_embed(discord_name: str, has_srt: bool, has_ktx: bool, has_card: boo
     return embed
 
 
-def train_list_embed(
-    trains: list[dict[str, Any]], rail_type: str, departure: str, arrival: str, date: str
+def train_list_embed_base(
+    rail_type: str, departure: str, arrival: str, date: str
 ) -> discord.Embed:
-    """열차 검색 결과 Embed."""
+    """열차 검색 결과 Embed 틀 (열차 필드는 add_train_field로 추가)."""
     formatted_date = f"{date[:4]}/{date[4:6]}/{date[6:]}"
     embed = discord.Embed(
         title=f"열차 검색 결과 ({rail_type})",
         description=f"**{departure}** → **{arrival}** | {formatted_date}",
         color=rail_color(rail_type),
     )
-    for i, t in enumerate(trains):
-        dep_time = t["dep_time"]
-        arr_time = t["arr_time"]
-        dep_fmt = f"{dep_time[:2]}:{dep_time[2:4]}"
-        arr_fmt = f"{arr_time[:2]}:{arr_time[2:4]}"
-        seat_info = t.get("seat_info", "")
-        name = t.get("train_name", rail_type)
-        number = t.get("train_number", "")
-        embed.add_field(
-            name=f"{i+1}. {name} {number}",
-            value=f"{dep_fmt} → {arr_fmt}\n{seat_info}",
-            inline=True,
-        )
     embed.set_footer(text="열차를 선택해주세요")
     return embed
 
 
+def add_train_field(
+    embed: discord.Embed, index: int, train: dict[str, Any], rail_type: str
+) -> None:
+    """format_train_for_select 결과 한 건을 검색 결과 Embed 필드로 추가."""
+    dep_time = train["dep_time"]
+    arr_time = train["arr_time"]
+    name = train.get("train_name", rail_type)
+    number = train.get("train_number", "")
+    embed.add_field(
+        name=f"{index + 1}. {name} {number}",
+        value=f"{dep_time[:2]}:{dep_time[2:4]} → {arr_time[:2]}:{arr_time[2:4]}\n"
+              f"{train.get('seat_info', '')}",
+        inline=True,
+    )
+
+
 def booking_summary_embed(
     rail_type: str,
     departure: str,
@@ -113,9 +119,18 @@ def searching_embed(
         suffix = ""
     embed = discord.Embed(
         title=f"예매 진행 중... ({rail_type}){suffix}",
-        description=f"시도 횟수: **{attempt}**회 | 경과: {elapsed}",
         color=COLOR_WARNING,
     )
+    # 진행 중에는 아래 두 필드 값만 바뀜 (set_searching_progress)
+    embed.add_field(name="시도 횟수", value=_format_attempt(attempt), inline=True)
+    embed.add_field(name="경과", value=elapsed, inline=True)
+    return embed
+
+
+def set_searching_progress(embed: discord.Embed, attempt: int, elapsed: str) -> discord.Embed:
+    """searching_embed로 만든 Embed의 시도 횟수/경과 필드만 갱신 (제자리 수정)."""
+    embed.set_field_at(0, name="시도 횟수", value=_format_attempt(attempt), inline=True)
+    embed.set_field_at(1, name="경과", value=elapsed, inline=True)
     return embed
 
 
@@ -209,6 +224,11 @@ def error_embed(message: str) -> discord.Embed:
     )
 
 
+# 여러 커맨드에서 공통으로 쓰는 고정 에러 Embed (import 시 한 번만 생성, 변경 금지)
+NO_PROFILE_EMBED = error_embed("프로필이 등록되지 않았습니다. `/프로필설정`으로 먼저 등록해주세요.")
+DB_TIMEOUT_EMBED = error_embed("DB 응답이 지연되고 있습니다. 잠시 후 다시 시도해주세요.")
+
+
 def favorite_routes_embed(routes: list[dict[str, Any]], discord_name: str) -> discord.Embed:
     """즐겨찾기 노선 목록 Embed."""
     embed = discord.Embed(
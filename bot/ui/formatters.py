@@ -2,77 +2,103 @@
 
 from __future__ import annotations
 
-from typing import Any
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Sequence
 
 
 def format_train_for_select(train, index: int, rail_type: str) -> dict[str, str]:
-    """열차 객체를 UI용 딕셔너리로 변환."""
-    if rail_type == "SRT":
-        return {
-            "train_name": getattr(train, "train_name", "SRT"),
-            "train_number": getattr(train, "train_number", ""),
-            "dep_time": getattr(train, "dep_time", ""),
-            "arr_time": getattr(train, "arr_time", ""),
-            "seat_info": _srt_seat_info(train),
-        }
-    else:
-        return {
-            "train_name": getattr(train, "train_name", "KTX"),
-            "train_number": getattr(train, "train_number", ""),
-            "dep_time": getattr(train, "dep_time", ""),
-            "arr_time": getattr(train, "arr_time", ""),
-            "seat_info": _ktx_seat_info(train),
-        }
+    """열차 객체를 UI용 딕셔너리로 변환.
+
+    TrainSelect 옵션 문자열(display_label/display_desc)도 여기서 한 번만 만든다.
+    """
+    default_name, number_of, seat_info_of = _RAIL_FORMAT.get(rail_type, _RAIL_FORMAT["KTX"])
+    try:
+        name = train.train_name
+    except AttributeError:  # KTX Train에는 열차명 속성이 없음
+        name = default_name
+    number = number_of(train)
+    dep = train.dep_time
+    arr = train.arr_time
+    seat_info = seat_info_of(train)
+    return {
+        "train_name": name,
+        "train_number": number,
+        "dep_time": dep,
+        "arr_time": arr,
+        "seat_info": seat_info,
+        "display_label": f"{name} {number} | {dep[:2]}:{dep[2:4]}→{arr[:2]}:{arr[2:4]}",
+        "display_desc": seat_info[:100],  # SelectOption description 최대 100자
+    }
 
 
 def _srt_seat_info(train) -> str:
     """SRT 좌석 정보 문자열."""
-    parts = []
-    gen = getattr(train, "general_seat_state", "")
-    spc = getattr(train, "special_seat_state", "")
-    parts.append(f"일반: {gen}")
-    parts.append(f"특실: {spc}")
-    if hasattr(train, "reserve_standby_available") and train.reserve_standby_available():
-        parts.append("예약대기: 가능")
-    return " | ".join(parts)
+    info = f"일반: {train.general_seat_state} | 특실: {train.special_seat_state}"
+    if train.reserve_standby_available():
+        info += " | 예약대기: 가능"
+    return info
 
 
 def _ktx_seat_info(train) -> str:
     """KTX 좌석 정보 문자열."""
-    parts = []
-    if hasattr(train, "has_general_seat"):
-        parts.append(f"일반: {'가능' if train.has_general_seat() else '매진'}")
-    if hasattr(train, "has_special_seat"):
-        parts.append(f"특실: {'가능' if train.has_special_seat() else '매진'}")
-    if hasattr(train, "has_waiting_list") and train.has_waiting_list():
+    parts = [
+        f"일반: {'가능' if train.has_general_seat() else '매진'}",
+        f"특실: {'가능' if train.has_special_seat() else '매진'}",
+    ]
+    if train.has_waiting_list():
         parts.append("예약대기: 가능")
     return " | ".join(parts)
 
 
+# 열차 종류 → (기본 열차명, 열차번호 getter, 좌석 정보 포맷터)
+# 열차번호 속성 이름이 다름: SRTTrain.train_number / Korail Train.train_no
+_RAIL_FORMAT = {
+    "SRT": ("SRT", attrgetter("train_number"), _srt_seat_info),
+    "KTX": ("KTX", attrgetter("train_no"), _ktx_seat_info),
+}
+
+
 def format_reservation_detail(reservation, rail_type: str) -> str:
     """예약 결과 상세 문자열."""
     if rail_type == "SRT":
-        lines = [str(reservation)]
-        if hasattr(reservation, "tickets"):
-            for ticket in reservation.tickets:
-                lines.append(str(ticket))
-        return "\n".join(lines)
+        tickets = getattr(reservation, "tickets", ())
+        return "\n".join(chain((str(reservation),), map(str, tickets)))
     else:
         return str(reservation).strip()
 
 
-def format_trains_summary(trains_data: list[dict[str, str]]) -> str:
+def format_trains_summary(trains_data: Sequence[dict[str, str]]) -> str:
     """선택된 열차 요약 문자열."""
-    parts = []
-    for t in trains_data:
-        dep = t["dep_time"]
-        arr = t["arr_time"]
-        parts.append(f"{t.get('train_name', '')} {t.get('train_number', '')} ({dep[:2]}:{dep[2:4]}→{arr[:2]}:{arr[2:4]})")
-    return "\n".join(parts) if parts else "없음"
+    return "\n".join(
+        f"{t.get('train_name', '')} {t.get('train_number', '')} "
+        f"({t['dep_time'][:2]}:{t['dep_time'][2:4]}→{t['arr_time'][:2]}:{t['arr_time'][2:4]})"
+        for t in trains_data
+    ) or "없음"
+
+
+def format_slots_info(slots, guild) -> list[dict[str, str]]:
+    """슬롯 목록을 slot_status_embed용 딕셔너리 목록으로 변환.
+
+    같은 사용자가 여러 슬롯을 쓰더라도 멤버 조회는 한 번만 한다.
+    """
+    members: dict[int, Any] = {}
+    if guild is not None:
+        for member_id in {s.member_id for s in slots}:
+            members[member_id] = guild.get_member(member_id)
+
+    slots_info = []
+    for s in slots:
+        user = members.get(s.member_id)
+        slots_info.append({
+            "user": user.display_name if user else s.discord_id,
+            "rail_type": s.rail_type,
+            "channel": f"<#{s.channel_id}>",
+        })
+    return slots_info
 
 
 def format_elapsed(seconds: float) -> str:
-    """경과 시간 포맷."""
-    hours, remainder = divmod(int(seconds), 3600)
-    minutes, secs = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    """경과 시간 포맷 (HH:MM:SS, 24시간 이상은 시간 자리가 늘어남)."""
+    s = int(seconds)
+    return f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}"
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Callable, Coroutine
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Coroutine, Iterable, Sequence
 
 import discord
 from discord import ui
@@ -18,66 +21,145 @@ MAX_SELECT_OPTIONS = 25
 MAX_STATION_SELECTS = 5
 
 
+def build_station_options(stations: Iterable[str]) -> tuple[discord.SelectOption, ...]:
+    """역 이름 목록 → SelectOption 튜플.
+
+    결과는 변경하지 않으므로 모듈 로드 시 한 번 만들어 여러 View에서 공유할 수 있다.
+    """
+    return tuple(discord.SelectOption(label=s, value=s) for s in stations)
+
+
 class StationSelect(ui.Select):
-    """역 선택 드롭다운."""
+    """역 선택 드롭다운.
 
-    def __init__(self, stations: list[str], placeholder: str = "역을 선택하세요") -> None:
-        options = [discord.SelectOption(label=s, value=s) for s in stations]
-        super().__init__(placeholder=placeholder, options=options, min_values=1, max_values=1)
+    선택 결과 처리는 소속 View의 select_station()에 위임한다.
+    """
+
+    def __init__(
+        self, options: Iterable[discord.SelectOption], placeholder: str = "역을 선택하세요"
+    ) -> None:
+        # discord.py가 options 리스트를 직접 보관/변경하므로 새 리스트로 만들어 전달
+        super().__init__(placeholder=placeholder, options=list(options), min_values=1, max_values=1)
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        self.view.selected_value = self.values[0]  # type: ignore[attr-defined]
-        self.view.stop()  # type: ignore[attr-defined]
-        await interaction.response.defer()
+        await self.view.select_station(interaction, self.values[0])  # type: ignore[attr-defined]
+
+
+def _build_station_selects(
+    options: Sequence[discord.SelectOption], placeholder: str
+) -> list[StationSelect]:
+    """옵션 25개 단위로 StationSelect 분할 생성.
+
+    구간은 islice로 넘겨 StationSelect가 만드는 리스트 외에 중간 복사본을 만들지 않는다.
+    """
+    n_chunks = -(-len(options) // MAX_SELECT_OPTIONS)
+    if n_chunks > MAX_STATION_SELECTS:
+        raise ValueError("StationSelectView supports up to 125 station options")
+
+    selects = []
+    for index, start in enumerate(range(0, len(options), MAX_SELECT_OPTIONS)):
+        chunk_placeholder = placeholder
+        if n_chunks > 1:
+            chunk_placeholder = f"{placeholder} ({index + 1}/{n_chunks})"
+        chunk = islice(options, start, start + MAX_SELECT_OPTIONS)
+        selects.append(StationSelect(chunk, chunk_placeholder))
+    return selects
 
 
 class StationSelectView(ui.View):
     """역 선택 View.
 
     Discord Select Menu는 옵션 25개 제한이 있으므로 역 목록을 25개 단위로 분할한다.
+    options는 build_station_options()로 미리 만들어 둔 것을 전달한다.
     """
 
-    def __init__(self, stations: list[str], placeholder: str, timeout: float = 300) -> None:
+    def __init__(
+        self, options: Sequence[discord.SelectOption], placeholder: str, timeout: float = 300
+    ) -> None:
         super().__init__(timeout=timeout)
         self.selected_value: str | None = None
-        chunks = [
-            stations[i:i + MAX_SELECT_OPTIONS]
-            for i in range(0, len(stations), MAX_SELECT_OPTIONS)
-        ]
-        if len(chunks) > MAX_STATION_SELECTS:
-            raise ValueError("StationSelectView supports up to 125 station options")
+        for select in _build_station_selects(options, placeholder):
+            self.add_item(select)
 
-        for index, chunk in enumerate(chunks):
-            chunk_placeholder = placeholder
-            if len(chunks) > 1:
-                chunk_placeholder = f"{placeholder} ({index + 1}/{len(chunks)})"
-            self.add_item(StationSelect(chunk, chunk_placeholder))
+    async def select_station(self, interaction: discord.Interaction, value: str) -> None:
+        await interaction.response.defer()
+        self.selected_value = value
+        self.stop()
 
     async def on_timeout(self) -> None:
         self.selected_value = None
 
 
+class RouteSelectView(ui.View):
+    """출발역 → 도착역을 한 메시지에서 순서대로 선택하는 View.
+
+    출발역을 고르면 같은 메시지를 도착역 선택으로 바꾸며, 도착역 목록에서는 출발역을 제외한다.
+    """
+
+    def __init__(self, options: Sequence[discord.SelectOption], timeout: float = 300) -> None:
+        super().__init__(timeout=timeout)
+        self.departure: str | None = None
+        self.selected_pair: tuple[str, str] | None = None
+        self._options = options
+        for select in _build_station_selects(options, "출발역을 선택하세요"):
+            self.add_item(select)
+
+    async def select_station(self, interaction: discord.Interaction, value: str) -> None:
+        if self.departure is None:
+            self.departure = value
+            self.clear_items()
+            arrival_options = [o for o in self._options if o.value != value]
+            for select in _build_station_selects(arrival_options, "도착역을 선택하세요"):
+                self.add_item(select)
+            await interaction.response.edit_message(content="도착역을 선택하세요:", view=self)
+            return
+
+        await interaction.response.defer()
+        self.selected_pair = (self.departure, value)
+        self.stop()
+
+    async def on_timeout(self) -> None:
+        self.selected_pair = None
+
+
 # ──────────────────────────────────────
 # 날짜 선택
 # ──────────────────────────────────────
 
+# 기준 날짜 → 날짜 옵션 (날짜가 바뀌면 다시 생성)
+_date_options_cache: dict[date, tuple[discord.SelectOption, ...]] = {}
+
+# strftime("%a") 대신 (C 로케일 표기와 동일)
+_WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def date_options() -> tuple[discord.SelectOption, ...]:
+    """오늘부터 25일치 날짜 옵션. 같은 날에는 만들어 둔 것을 재사용."""
+    today = date.today()
+    options = _date_options_cache.get(today)
+    if options is None:
+        options = tuple(
+            discord.SelectOption(
+                label=f"{d.year}/{d.month:02d}/{d.day:02d} {_WEEKDAY_ABBR[d.weekday()]}",
+                value=f"{d.year}{d.month:02d}{d.day:02d}",
+            )
+            for d in (today + timedelta(days=i) for i in range(MAX_SELECT_OPTIONS))
+        )
+        _date_options_cache.clear()
+        _date_options_cache[today] = options
+    return options
+
+
 class DateSelect(ui.Select):
     """날짜 선택 드롭다운."""
 
     def __init__(self) -> None:
-        now = datetime.now()
-        options = []
-        for i in range(25):  # Discord 최대 25개 옵션
-            d = now + timedelta(days=i)
-            label = d.strftime("%Y/%m/%d %a")
-            value = d.strftime("%Y%m%d")
-            options.append(discord.SelectOption(label=label, value=value))
-        super().__init__(placeholder="날짜를 선택하세요", options=options)
+        super().__init__(placeholder="날짜를 선택하세요", options=list(date_options()))
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer()
         self.view.selected_value = self.values[0]  # type: ignore[attr-defined]
         self.view.stop()  # type: ignore[attr-defined]
-        await interaction.response.defer()
 
 
 class DateSelectView(ui.View):
@@ -93,25 +175,27 @@ class DateSelectView(ui.View):
 # 시간 선택
 # ──────────────────────────────────────
 
+# 시간 옵션은 고정이므로 모든 View가 공유
+TIME_OPTIONS = tuple(
+    discord.SelectOption(label=f"{h:02d}시", value=f"{h:02d}0000") for h in range(24)
+)
+
+
 class TimeSelect(ui.Select):
     """시간 선택 드롭다운 (복수 선택 가능)."""
 
     def __init__(self) -> None:
-        options = [
-            discord.SelectOption(label=f"{h:02d}시", value=f"{h:02d}0000")
-            for h in range(24)
-        ]
         super().__init__(
             placeholder="시간을 선택하세요 (복수 선택 가능)",
-            options=options,
+            options=list(TIME_OPTIONS),
             min_values=1,
-            max_values=len(options),
+            max_values=len(TIME_OPTIONS),
         )
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer()
         self.view.selected_values = sorted(self.values)  # type: ignore[attr-defined]
         self.view.stop()  # type: ignore[attr-defined]
-        await interaction.response.defer()
 
 
 class TimeSelectView(ui.View):
@@ -130,14 +214,12 @@ class TimeSelectView(ui.View):
 class TrainSelect(ui.Select):
     """열차 복수 선택."""
 
-    def __init__(self, trains: list[dict[str, str]]) -> None:
-        options = []
-        for i, t in enumerate(trains[:25]):
-            dep = t["dep_time"]
-            arr = t["arr_time"]
-            label = f"{t.get('train_name', '')} {t.get('train_number', '')} | {dep[:2]}:{dep[2:4]}→{arr[:2]}:{arr[2:4]}"
-            desc = t.get("seat_info", "")
-            options.append(discord.SelectOption(label=label, value=str(i), description=desc[:100]))
+    def __init__(self, trains: Sequence[dict[str, str]]) -> None:
+        # 라벨/설명은 format_train_for_select에서 미리 만들어 둔 것
+        options = [
+            discord.SelectOption(label=t["display_label"], value=str(i), description=t["display_desc"])
+            for i, t in enumerate(trains[:MAX_SELECT_OPTIONS])
+        ]
         super().__init__(
             placeholder="열차를 선택하세요 (복수 가능)",
             options=options,
@@ -146,15 +228,19 @@ class TrainSelect(ui.Select):
         )
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        self.view.selected_values = [int(v) for v in self.values]  # type: ignore[attr-defined]
-        self.view.stop()  # type: ignore[attr-defined]
         await interaction.response.defer()
+        # 표시한 옵션 범위 안의 인덱스만 (이후 단계에서는 범위 검사 없이 사용)
+        count = len(self.options)
+        self.view.selected_values = [  # type: ignore[attr-defined]
+            i for i in map(int, self.values) if 0 <= i < count
+        ]
+        self.view.stop()  # type: ignore[attr-defined]
 
 
 class TrainSelectView(ui.View):
     """열차 선택 View."""
 
-    def __init__(self, trains: list[dict[str, str]], timeout: float = 300) -> None:
+    def __init__(self, trains: Sequence[dict[str, str]], timeout: float = 300) -> None:
         super().__init__(timeout=timeout)
         self.selected_values: list[int] | None = None
         self.add_item(TrainSelect(trains))
@@ -173,98 +259,144 @@ class SeatTypeView(ui.View):
 
     @ui.button(label="일반실 우선", style=discord.ButtonStyle.primary, row=0)
     async def general_first(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "GENERAL_FIRST"
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="일반실만", style=discord.ButtonStyle.secondary, row=0)
     async def general_only(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "GENERAL_ONLY"
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="특실 우선", style=discord.ButtonStyle.primary, row=1)
     async def special_first(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "SPECIAL_FIRST"
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="특실만", style=discord.ButtonStyle.secondary, row=1)
     async def special_only(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "SPECIAL_ONLY"
         self.stop()
-        await interaction.response.defer()
 
 
 # ──────────────────────────────────────
 # 승객 수 선택 버튼
 # ──────────────────────────────────────
 
+# 연속 클릭을 메시지 수정 한 번으로 모으는 대기 시간 (초)
+PASSENGER_EDIT_DEBOUNCE = 0.15
+
+
 class PassengerCountView(ui.View):
-    """승객 수 조절 View."""
+    """승객 수 조절 View.
+
+    +/- 클릭은 바로 응답(defer)만 하고, 메시지 수정은 잠시 모았다가 마지막 상태로 한 번 보낸다.
+    """
 
     def __init__(self, timeout: float = 300) -> None:
         super().__init__(timeout=timeout)
         self.adults: int = 1
         self.child_count: int = 0
         self.seniors: int = 0
+        self._total: int = 1  # 어른 + 어린이 + 경로 (버튼마다 함께 갱신)
         self.confirmed: bool = False
+        self._last_interaction: discord.Interaction | None = None
+        self._edit_task: asyncio.Task | None = None
+
+    async def _queue_edit(self, interaction: discord.Interaction) -> None:
+        """클릭 응답 후 메시지 수정 예약 (이미 예약돼 있으면 그 수정에 합류)."""
+        await interaction.response.defer()
+        self._last_interaction = interaction
+        if self._edit_task is None:
+            self._edit_task = asyncio.create_task(self._flush_edit())
+
+    async def _flush_edit(self) -> None:
+        await asyncio.sleep(PASSENGER_EDIT_DEBOUNCE)
+        # 이후 클릭은 새 수정으로 예약되도록 전송 전에 비움
+        self._edit_task = None
+        try:
+            await self._last_interaction.edit_original_response(  # type: ignore[union-attr]
+                content=self._make_content(), view=self
+            )
+        except discord.HTTPException:
+            pass
+
+    def _cancel_edit(self) -> None:
+        if self._edit_task is not None:
+            self._edit_task.cancel()
+            self._edit_task = None
+
+    def stop(self) -> None:
+        # 확인/취소 후 늦게 도착한 수정이 다음 단계 메시지를 덮지 않도록
+        self._cancel_edit()
+        super().stop()
+
+    async def on_timeout(self) -> None:
+        self._cancel_edit()
 
     def _make_content(self) -> str:
-        parts = []
-        if self.adults:
-            parts.append(f"어른 {self.adults}명")
-        if self.child_count:
-            parts.append(f"어린이 {self.child_count}명")
-        if self.seniors:
-            parts.append(f"경로 {self.seniors}명")
-        total = self.adults + self.child_count + self.seniors
-        return f"승객: {', '.join(parts)} (총 {total}명)" if parts else "승객을 선택해주세요"
+        if not self._total:
+            return "승객을 선택해주세요"
+        counts = ", ".join(
+            f"{label} {n}명"
+            for label, n in (("어른", self.adults), ("어린이", self.child_count), ("경로", self.seniors))
+            if n
+        )
+        return f"승객: {counts} (총 {self._total}명)"
 
     @ui.button(label="어른 +", style=discord.ButtonStyle.primary, row=0)
     async def adult_plus(self, interaction: discord.Interaction, button: ui.Button) -> None:
-        if self.adults + self.child_count + self.seniors < 9:
+        if self._total < 9:
             self.adults += 1
-        await interaction.response.edit_message(content=self._make_content(), view=self)
+            self._total += 1
+        await self._queue_edit(interaction)
 
     @ui.button(label="어른 -", style=discord.ButtonStyle.secondary, row=0)
     async def adult_minus(self, interaction: discord.Interaction, button: ui.Button) -> None:
         if self.adults > 0:
             self.adults -= 1
-        await interaction.response.edit_message(content=self._make_content(), view=self)
+            self._total -= 1
+        await self._queue_edit(interaction)
 
     @ui.button(label="어린이 +", style=discord.ButtonStyle.primary, row=1)
     async def child_plus(self, interaction: discord.Interaction, button: ui.Button) -> None:
-        if self.adults + self.child_count + self.seniors < 9:
+        if self._total < 9:
             self.child_count += 1
-        await interaction.response.edit_message(content=self._make_content(), view=self)
+            self._total += 1
+        await self._queue_edit(interaction)
 
     @ui.button(label="어린이 -", style=discord.ButtonStyle.secondary, row=1)
     async def child_minus(self, interaction: discord.Interaction, button: ui.Button) -> None:
         if self.child_count > 0:
             self.child_count -= 1
-        await interaction.response.edit_message(content=self._make_content(), view=self)
+            self._total -= 1
+        await self._queue_edit(interaction)
 
     @ui.button(label="경로 +", style=discord.ButtonStyle.primary, row=2)
     async def senior_plus(self, interaction: discord.Interaction, button: ui.Button) -> None:
-        if self.adults + self.child_count + self.seniors < 9:
+        if self._total < 9:
             self.seniors += 1
-        await interaction.response.edit_message(content=self._make_content(), view=self)
+            self._total += 1
+        await self._queue_edit(interaction)
 
     @ui.button(label="경로 -", style=discord.ButtonStyle.secondary, row=2)
     async def senior_minus(self, interaction: discord.Interaction, button: ui.Button) -> None:
         if self.seniors > 0:
             self.seniors -= 1
-        await interaction.response.edit_message(content=self._make_content(), view=self)
+            self._total -= 1
+        await self._queue_edit(interaction)
 
     @ui.button(label="확인", style=discord.ButtonStyle.success, row=3)
     async def confirm(self, interaction: discord.Interaction, button: ui.Button) -> None:
-        if self.adults + self.child_count + self.seniors == 0:
+        if not self._total:
             await interaction.response.send_message("승객 수는 0이 될 수 없습니다.", ephemeral=True)
             return
+        await interaction.response.defer()
         self.confirmed = True
         self.stop()
-        await interaction.response.defer()
 
 
 # ──────────────────────────────────────
@@ -280,15 +412,15 @@ class ConfirmView(ui.View):
 
     @ui.button(label="예", style=discord.ButtonStyle.success)
     async def yes(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.result = True
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="아니오", style=discord.ButtonStyle.danger)
     async def no(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.result = False
         self.stop()
-        await interaction.response.defer()
 
 
 class StartCancelView(ui.View):
@@ -300,15 +432,15 @@ class StartCancelView(ui.View):
 
     @ui.button(label="예매 시작", style=discord.ButtonStyle.success, emoji="\U0001f680")
     async def start(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.result = True
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="취소", style=discord.ButtonStyle.danger)
     async def cancel(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.result = False
         self.stop()
-        await interaction.response.defer()
 
 
 # ──────────────────────────────────────
@@ -324,15 +456,15 @@ class RailTypeView(ui.View):
 
     @ui.button(label="SRT", style=discord.ButtonStyle.danger)
     async def srt(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "SRT"
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="KTX", style=discord.ButtonStyle.primary)
     async def ktx(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "KTX"
         self.stop()
-        await interaction.response.defer()
 
 
 # ──────────────────────────────────────
@@ -348,29 +480,56 @@ class TripTypeView(ui.View):
 
     @ui.button(label="편도", style=discord.ButtonStyle.primary)
     async def oneway(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "oneway"
         self.stop()
-        await interaction.response.defer()
 
     @ui.button(label="왕복", style=discord.ButtonStyle.success)
     async def roundtrip(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await interaction.response.defer()
         self.selected_value = "roundtrip"
         self.stop()
-        await interaction.response.defer()
 
 
 # ──────────────────────────────────────
 # 프로필 설정 Modal
 # ──────────────────────────────────────
 
+# 모달 제출 값 저장 콜백: (제출 interaction, 저장할 필드) → None
+ModalSaveCallback = Callable[[discord.Interaction, dict[str, str]], Coroutine[Any, Any, None]]
+
+
+def _start_save(
+    tasks: set[asyncio.Task], coro: Coroutine[Any, Any, None]
+) -> None:
+    """모달 저장 태스크 시작.
+
+    모달은 on_submit 직후 버려지고 asyncio는 태스크를 약하게만 참조하므로,
+    끝날 때까지 tasks 집합(봇이 보관, 종료 시 대기)이 강한 참조를 유지한다.
+    """
+    task = asyncio.create_task(coro)
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+
+
 class ProfileModal(ui.Modal, title="프로필 설정"):
-    """SRT/KTX 자격 증명 입력 모달."""
+    """SRT/KTX 자격 증명 입력 모달.
+
+    제출 즉시 응답(defer)한 뒤, 저장은 on_save 백그라운드 태스크에서 처리한다.
+    """
 
-    def __init__(self, rail_type: str) -> None:
+    def __init__(
+        self,
+        rail_type: str,
+        save_tasks: set[asyncio.Task],
+        on_save: ModalSaveCallback | None = None,
+    ) -> None:
         super().__init__()
         self.rail_type = rail_type
         self.user_id_value: str = ""
         self.user_pw_value: str = ""
+        self._on_save = on_save
+        self._save_tasks = save_tasks
 
     rail_id = ui.TextInput(
         label="아이디 (멤버십 번호, 이메일, 전화번호)",
@@ -388,34 +547,50 @@ class ProfileModal(ui.Modal, title="프로필 설정"):
         self.user_pw_value = self.rail_pw.value
         await interaction.response.defer(ephemeral=True)
 
+        if self._on_save is not None:
+            prefix = "srt" if self.rail_type == "SRT" else "ktx"
+            _start_save(self._save_tasks, self._on_save(interaction, {
+                f"{prefix}_id": self.user_id_value,
+                f"{prefix}_pw": self.user_pw_value,
+            }))
+
 
 # ──────────────────────────────────────
 # 즐겨찾기 노선 선택
 # ──────────────────────────────────────
 
+@lru_cache(maxsize=256)
+def _get_route_option(departure: str, arrival: str, route_id: int) -> discord.SelectOption:
+    """노선 하나의 SelectOption (같은 노선은 다시 열어도 같은 객체를 재사용)."""
+    return discord.SelectOption(label=f"{departure} → {arrival}", value=str(route_id))
+
+
+def _route_options(routes: list[dict]) -> list[discord.SelectOption]:
+    """즐겨찾기 노선 목록 → SelectOption 목록 (선택/삭제 드롭다운 공용)."""
+    return [_get_route_option(r["departure"], r["arrival"], r["id"]) for r in routes]
+
+
+# 노선 선택 드롭다운 마지막의 "직접 선택" 옵션 (변경하지 않으므로 공유)
+_MANUAL_ROUTE_OPTION = discord.SelectOption(
+    label="직접 선택",
+    value="manual",
+    description="출발역/도착역을 직접 선택합니다",
+    emoji="\u270F\uFE0F",
+)
+
+
 class FavoriteRouteSelect(ui.Select):
     """즐겨찾기 노선 선택 드롭다운."""
 
     def __init__(self, routes: list[dict], placeholder: str = "노선을 선택하세요") -> None:
-        options = []
-        for r in routes:
-            options.append(discord.SelectOption(
-                label=f"{r['departure']} → {r['arrival']}",
-                value=str(r["id"]),
-            ))
-        # "직접 선택" 옵션 추가
-        options.append(discord.SelectOption(
-            label="직접 선택",
-            value="manual",
-            description="출발역/도착역을 직접 선택합니다",
-            emoji="\u270F\uFE0F",
-        ))
+        options = _route_options(routes)
+        options.append(_MANUAL_ROUTE_OPTION)
         super().__init__(placeholder=placeholder, options=options, min_values=1, max_values=1)
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer()
         self.view.selected_value = self.values[0]  # type: ignore[attr-defined]
         self.view.stop()  # type: ignore[attr-defined]
-        await interaction.response.defer()
 
 
 class FavoriteRouteSelectView(ui.View):
@@ -450,19 +625,15 @@ class FavoriteDeleteSelect(ui.Select):
     """즐겨찾기 삭제용 선택 드롭다운."""
 
     def __init__(self, routes: list[dict]) -> None:
-        options = [
-            discord.SelectOption(
-                label=f"{r['departure']} → {r['arrival']}",
-                value=str(r["id"]),
-            )
-            for r in routes
-        ]
-        super().__init__(placeholder="삭제할 노선을 선택하세요", options=options, min_values=1, max_values=1)
+        super().__init__(
+            placeholder="삭제할 노선을 선택하세요", options=_route_options(routes),
+            min_values=1, max_values=1,
+        )
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer()
         self.view.selected_value = self.values[0]  # type: ignore[attr-defined]
         self.view.stop()  # type: ignore[attr-defined]
-        await interaction.response.defer()
 
 
 class FavoriteDeleteView(ui.View):
@@ -477,12 +648,27 @@ class FavoriteDeleteView(ui.View):
         self.selected_value = None
 
 
+# 카드번호 입력 정규화/검증 (공백·하이픈 제거 후 숫자 15~16자리)
+_CARD_STRIP = str.maketrans("", "", " -")
+_CARD_RE = re.compile(r"\d{15,16}")
+
+
 class CardModal(ui.Modal, title="카드 설정"):
-    """신용카드 정보 입력 모달."""
+    """신용카드 정보 입력 모달.
 
-    def __init__(self) -> None:
+    제출 즉시 응답(defer)한 뒤, 저장은 on_save 백그라운드 태스크에서 처리한다.
+    """
+
+    def __init__(
+        self, save_tasks: set[asyncio.Task], on_save: ModalSaveCallback | None = None
+    ) -> None:
         super().__init__()
-        self.card_values: dict[str, str] = {}
+        self.card_number_value: str = ""
+        self.card_password_value: str = ""
+        self.card_birthday_value: str = ""
+        self.card_expire_value: str = ""
+        self._on_save = on_save
+        self._save_tasks = save_tasks
 
     card_number = ui.TextInput(
         label="카드번호 (띄어쓰기/하이픈 가능)",
@@ -508,26 +694,27 @@ class CardModal(ui.Modal, title="카드 설정"):
     )
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        # 카드번호에서 공백, 하이픈 제거
-        card_number_clean = self.card_number.value.replace(" ", "").replace("-", "")
-
-        # 숫자만 입력되었는지 검증
-        if not card_number_clean.isdigit():
-            await interaction.response.send_message(
-                "❌ 카드번호는 숫자만 입력해주세요.", ephemeral=True
+        # 카드번호에서 공백, 하이픈 제거 후 숫자 15~16자리인지 한 번에 검증
+        card_number_clean = self.card_number.value.translate(_CARD_STRIP)
+        if not _CARD_RE.fullmatch(card_number_clean):
+            msg = (
+                "❌ 카드번호는 숫자만 입력해주세요."
+                if not card_number_clean.isdigit()
+                else "❌ 카드번호는 15~16자리여야 합니다."
             )
+            await interaction.response.send_message(msg, ephemeral=True)
             return
 
-        if len(card_number_clean) < 15 or len(card_number_clean) > 16:
-            await interaction.response.send_message(
-                "❌ 카드번호는 15~16자리여야 합니다.", ephemeral=True
-            )
-            return
-
-        self.card_values = {
-            "card_number": card_number_clean,
-            "card_password": self.card_password.value,
-            "card_birthday": self.card_birthday.value,
-            "card_expire": self.card_expire.value,
-        }
+        self.card_number_value = card_number_clean
+        self.card_password_value = self.card_password.value
+        self.card_birthday_value = self.card_birthday.value
+        self.card_expire_value = self.card_expire.value
         await interaction.response.defer(ephemeral=True)
+
+        if self._on_save is not None:
+            _start_save(self._save_tasks, self._on_save(interaction, {
+                "card_number": self.card_number_value,
+                "card_password": self.card_password_value,
+                "card_birthday": self.card_birthday_value,
+                "card_expire": self.card_expire_value,
+            }))
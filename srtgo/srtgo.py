@@ -148,7 +148,7 @@ def edit_station(rail_type: RailType) -> bool:
     print(f"선택된 역: {selected_stations}")
     return True
 
-def get_station(rail_type: RailType) -> Tuple[List[str], List[int]]:
+def get_station(rail_type: RailType) -> Tuple[Tuple[str, ...], List[int]]:
     stations = STATIONS[rail_type]
     station_key = keyring.get_password(rail_type, "station")
     
@@ -1,13 +1,13 @@
 """Station choices shared by the CLI and Discord bot."""
 
-SRT_STATIONS = [
+SRT_STATIONS = (
     "수서", "동탄", "평택지제", "경주", "곡성", "공주", "광주송정", "구례구", "김천(구미)",
     "나주", "남원", "대전", "동대구", "마산", "목포", "밀양", "부산", "서대구",
     "순천", "여수EXPO", "여천", "오송", "울산(통도사)", "익산", "전주",
     "정읍", "진영", "진주", "창원", "창원중앙", "천안아산", "포항",
-]
+)
 
-KTX_STATIONS = [
+KTX_STATIONS = (
     "행신", "서울", "용산", "영등포", "광명", "수원", "평택", "천안", "천안아산",
     "오송", "조치원", "대전", "서대전", "계룡", "논산", "공주", "김천구미",
     "구미", "대구", "서대구", "동대구", "경산", "밀양", "구포", "부산",
@@ -18,13 +18,17 @@ KTX_STATIONS = [
     "정동진", "묵호", "동해", "제천", "단양", "풍기", "영주", "안동",
     "부발", "가남", "감곡장호원", "앙성온천", "충주", "판교(경기)", "판교(충남)",
     "합덕", "인주",
-]
+)
 
 STATIONS = {
     "SRT": SRT_STATIONS,
     "KTX": KTX_STATIONS,
 }
 
+# O(1) 멤버십 검사용 (import 시 한 번만 생성)
+STATION_SETS = {rail_type: frozenset(stations) for rail_type, stations in STATIONS.items()}
+ALL_STATION_SET = STATION_SETS["SRT"] | STATION_SETS["KTX"]
+
 DEFAULT_STATIONS = {
     "SRT": ["수서", "대전", "동대구", "부산"],
     "KTX": ["서울", "대전", "동대구", "부산", "서대구"],